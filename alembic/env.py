@@ -28,6 +28,7 @@ from mitlist.modules.finance.models import (  # noqa: F401
     Category,
     Expense,
     ExpenseSplit,
+    MemberBalance,
     RecurringExpense,
     Settlement,
     SplitPreset,
@@ -77,6 +78,9 @@ from mitlist.modules.gamification.models import (  # noqa: F401
 )
 from mitlist.modules.calendar.models import CalendarEvent, EventAttendee, Reminder  # noqa: F401
 from mitlist.modules.audit.models import AuditLog, ReportSnapshot, Tag, TagAssignment  # noqa: F401
+from mitlist.jobs.models import ScheduledJob  # noqa: F401
+from mitlist.events.models import OutboxEvent  # noqa: F401
+from mitlist.idempotency.models import IdempotencyRecord  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,31 @@
+"""Audit logs keyset pagination index
+
+Revision ID: 018_audit_logs_keyset_index
+Revises: 017_optimize_finance_user_index
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '018_audit_logs_keyset_index'
+down_revision: Union[str, None] = '017_optimize_finance_user_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Group audit trail is paged newest-first by (occurred_at, id)
+    op.create_index(
+        'ix_audit_logs_group_occurred',
+        'audit_logs',
+        ['group_id', 'occurred_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_logs_group_occurred', table_name='audit_logs')
@@ -0,0 +1,57 @@
+"""Member balances ledger
+
+Revision ID: 022_member_balances
+Revises: 021_idempotency_keys
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '022_member_balances'
+down_revision: Union[str, None] = '021_idempotency_keys'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'member_balances',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('group_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('balance', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['group_id'], ['groups.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('group_id', 'user_id', name='uq_member_balance')
+    )
+    # Backfill from history (same aggregation as finance.service.rebuild_member_balances)
+    op.execute(
+        """
+        INSERT INTO member_balances (group_id, user_id, balance)
+        SELECT group_id, user_id, sum(delta) FROM (
+            SELECT group_id, paid_by_user_id AS user_id, amount AS delta
+            FROM expenses WHERE deleted_at IS NULL
+            UNION ALL
+            SELECT e.group_id, s.user_id, -s.owed_amount
+            FROM expense_splits s JOIN expenses e ON s.expense_id = e.id
+            WHERE e.deleted_at IS NULL AND s.is_paid IS false
+            UNION ALL
+            SELECT group_id, payee_id, amount FROM settlements
+            UNION ALL
+            SELECT group_id, payer_id, -amount FROM settlements
+        ) AS movements
+        GROUP BY group_id, user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('member_balances')
@@ -0,0 +1,30 @@
+"""Outbox index for the dispatcher's per-group ordering check
+
+Revision ID: 023_outbox_group_index
+Revises: 022_member_balances
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '023_outbox_group_index'
+down_revision: Union[str, None] = '022_member_balances'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_outbox_events_group_id_status_id',
+        'outbox_events',
+        ['group_id', 'status', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_events_group_id_status_id', table_name='outbox_events')
@@ -0,0 +1,34 @@
+"""Version columns on chores and notifications for conditional GETs
+
+Revision ID: 024_chore_notification_versions
+Revises: 023_outbox_group_index
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '024_chore_notification_versions'
+down_revision: Union[str, None] = '023_outbox_group_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'chores',
+        sa.Column('version_id', sa.Integer(), server_default=sa.text('1'), nullable=False),
+    )
+    op.add_column(
+        'notifications',
+        sa.Column('version_id', sa.Integer(), server_default=sa.text('1'), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('notifications', 'version_id')
+    op.drop_column('chores', 'version_id')
@@ -0,0 +1,26 @@
+"""Resume cursor for scheduled jobs that page through a window
+
+Revision ID: 025_scheduled_job_cursor
+Revises: 024_chore_notification_versions
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '025_scheduled_job_cursor'
+down_revision: Union[str, None] = '024_chore_notification_versions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('scheduled_jobs', sa.Column('cursor', sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('scheduled_jobs', 'cursor')
@@ -0,0 +1,224 @@
+"""
+Batch API: POST /batch runs several API calls in one round trip.
+
+Sub-requests go through the whole application in-process (middleware, routers,
+dependencies, error handlers), so each behaves exactly like the standalone call. The
+token is verified and the user resolved once, by the batch itself; sub-requests reuse
+that principal, and each run of consecutive reads shares one membership memo (started
+empty again after every write), so five group-scoped reads check the membership once.
+
+Consecutive GET sub-requests run concurrently (at most BATCH_MAX_CONCURRENCY at a
+time), each with its own session. Any other method runs on its own, in order, once the
+reads listed before it have finished, so later items see its effects. Every item gets
+its own status, headers and body; one failing item does not affect the others.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Literal, Optional
+from urllib.parse import unquote
+
+from fastapi import APIRouter, Depends, Request
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp, Message, Scope
+
+from mitlist.api.deps import _membership_roles, get_current_principal, get_current_user, get_db
+from mitlist.api.principal import SharedPrincipal
+from mitlist.core.config import settings
+from mitlist.core.errors import ValidationError
+from mitlist.core.request_context import get_trace_id
+from mitlist.modules.auth.models import User
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["batch"])
+
+BATCH_PATH = "/batch"
+
+# Taken from the batch request unless the item sets them
+_INHERITED_HEADERS = {b"authorization", b"x-group-id", b"accept-language", b"user-agent"}
+# Never taken from items
+_RESERVED_HEADERS = {
+    "authorization",
+    "content-length",
+    "content-type",
+    "accept-encoding",
+    "host",
+    "x-request-id",
+}
+# Framing of the sub-response, meaningless inside the batch body
+_UNRETURNED_HEADERS = {"content-length", "x-request-id"}
+
+
+class BatchItem(BaseModel):
+    """One API call: `path` is the full API path, with an optional query string."""
+
+    id: Optional[str] = Field(None, max_length=100)
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str = Field(..., min_length=1, max_length=2048)
+    headers: dict[str, str] = Field(default_factory=dict)
+    body: Any = None
+
+
+class BatchRequest(BaseModel):
+    requests: list[BatchItem] = Field(..., min_length=1, max_length=settings.BATCH_MAX_REQUESTS)
+
+
+class BatchItemResult(BaseModel):
+    id: Optional[str] = None
+    status: int
+    headers: dict[str, str]
+    # JSON bodies decoded, anything else as text
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    responses: list[BatchItemResult]
+
+
+class _SubRequest:
+    """ASGI receive/send pair collecting one in-process response."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body: Optional[bytes] = body
+        self._done = asyncio.Event()
+        self.status: Optional[int] = None
+        self.headers: list[tuple[bytes, bytes]] = []
+        self.chunks: list[bytes] = []
+
+    async def receive(self) -> Message:
+        if self._body is not None:
+            body, self._body = self._body, None
+            return {"type": "http.request", "body": body, "more_body": False}
+        await self._done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+            self.headers = list(message.get("headers", ()))
+        elif message["type"] == "http.response.body":
+            self.chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                self._done.set()
+
+
+def _sub_scope(request: Request, item: BatchItem, body: bytes, state: dict[str, Any]) -> Scope:
+    path, _, query = item.path.partition("?")
+    own = [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in item.headers.items()
+        if name.lower() not in _RESERVED_HEADERS
+    ]
+    overridden = {name for name, _ in own}
+    headers = [
+        (k, v)
+        for k, v in request.scope["headers"]
+        if k in _INHERITED_HEADERS and k not in overridden
+    ]
+    headers += own
+    # Sub-requests log under the batch's trace id
+    headers.append((b"x-request-id", get_trace_id().encode()))
+    if body:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode()))
+    scope = {
+        key: request.scope[key]
+        for key in ("asgi", "http_version", "scheme", "server", "client", "root_path")
+        if key in request.scope
+    }
+    scope.update(
+        type="http",
+        method=item.method,
+        path=unquote(path),
+        raw_path=path.encode(),
+        query_string=query.encode(),
+        headers=headers,
+        state=state,
+    )
+    return scope
+
+
+def _decode_body(headers: dict[str, str], body: bytes) -> Any:
+    if not body:
+        return None
+    media_type = headers.get("content-type", "").split(";")[0].strip()
+    if media_type == "application/json" or media_type.endswith("+json"):
+        return json.loads(body)
+    return body.decode("utf-8", errors="replace")
+
+
+async def _run(app: ASGIApp, request: Request, item: BatchItem, state: dict[str, Any]):
+    body = b"" if item.body is None else json.dumps(item.body).encode()
+    sub = _SubRequest(body)
+    try:
+        await app(_sub_scope(request, item, body, state), sub.receive, sub.send)
+    except Exception:
+        # The error middleware has normally sent a 500 already; keep it if so
+        logger.exception("Batch item %s %s failed", item.method, item.path)
+        if sub.status is None:
+            return BatchItemResult(id=item.id, status=500, headers={}, body=None)
+    headers: dict[str, str] = {}
+    for raw_name, raw_value in sub.headers:
+        name, value = raw_name.decode("latin-1").lower(), raw_value.decode("latin-1")
+        if name not in _UNRETURNED_HEADERS:
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+    return BatchItemResult(
+        id=item.id,
+        status=sub.status,
+        headers=headers,
+        body=_decode_body(headers, b"".join(sub.chunks)),
+    )
+
+
+def _check_path(item: BatchItem, api_prefix: str) -> None:
+    path = item.path.partition("?")[0]
+    if not path.startswith(f"{api_prefix}/") or "://" in item.path:
+        raise ValidationError(
+            code="INVALID_BATCH_PATH",
+            detail=f"Batch items must target API paths under {api_prefix}/: {item.path}",
+        )
+    if path.rstrip("/") == f"{api_prefix}{BATCH_PATH}":
+        raise ValidationError(code="NESTED_BATCH", detail="Batches cannot contain batches")
+
+
+@router.post(BATCH_PATH, response_model=BatchResponse)
+async def run_batch(
+    payload: BatchRequest,
+    request: Request,
+    claims: dict[str, Any] = Depends(get_current_principal),
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Run up to BATCH_MAX_REQUESTS API calls; responses come back in request order."""
+    # The batch route sits directly under the API prefix
+    api_prefix = request.url.path.removesuffix(BATCH_PATH)
+    for item in payload.requests:
+        _check_path(item, api_prefix)
+    # A user created on first sight must be visible to the sub-requests' sessions
+    await db.commit()
+
+    principal = SharedPrincipal(claims, user)
+    roles = _membership_roles(request)
+    semaphore = asyncio.Semaphore(settings.BATCH_MAX_CONCURRENCY)
+
+    async def run(item: BatchItem, roles: dict[tuple[int, int], Optional[str]]) -> BatchItemResult:
+        state = {"shared_principal": principal, "group_roles": roles}
+        async with semaphore:
+            return await _run(request.app, request, item, state)
+
+    results: list[BatchItemResult] = []
+    reads: list[BatchItem] = []
+    for item in payload.requests:
+        if item.method == "GET":
+            reads.append(item)
+            continue
+        results += await asyncio.gather(*(run(read, roles) for read in reads))
+        reads = []
+        results.append(await run(item, {}))
+        # The write may have changed memberships (leave, join, role change)
+        roles = {}
+    results += await asyncio.gather(*(run(read, roles) for read in reads))
+    return BatchResponse(responses=results)
@@ -0,0 +1,282 @@
+"""Negotiated response compression (pure ASGI).
+
+Encodes responses with the best encoding the client accepts: zstd and brotli when the
+optional `zstandard` / `brotli` packages are installed, gzip always. Bodies under
+COMPRESSION_MINIMUM_SIZE go out as-is. Streaming responses are compressed chunk by
+chunk (only the first COMPRESSION_MINIMUM_SIZE bytes are held back to decide), and
+each chunk is flushed so clients see data as soon as the app sends it.
+
+Skipped: HEAD requests, bodiless statuses, responses that already carry a
+Content-Encoding, non-text content types, and endpoints decorated with
+`@uncompressed` (e.g. downloads of already-compressed documents).
+
+Usage:
+    @router.get("/documents/{document_id}/download")
+    @uncompressed
+    async def get_documents_download(...): ...
+"""
+
+import zlib
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Protocol, TypeVar
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+_UNCOMPRESSED_ATTR = "__mitlist_uncompressed__"
+
+# Content types worth compressing; everything else (images, archives, PDFs) is skipped.
+_COMPRESSIBLE_PREFIXES = ("text/", "application/json", "application/problem+json", "application/xml")
+_COMPRESSIBLE_SUFFIXES = ("+json", "+xml")
+
+F = TypeVar("F", bound=Callable)
+
+
+def uncompressed(endpoint: F) -> F:
+    """Opt an endpoint out of response compression. Apply below the route decorator."""
+    setattr(endpoint, _UNCOMPRESSED_ATTR, True)
+    return endpoint
+
+
+class _Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+    def flush(self) -> bytes: ...
+    def finish(self) -> bytes: ...
+
+
+class _GzipEncoder:
+    def __init__(self) -> None:
+        self._obj = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self) -> None:
+        self._obj = brotli.Compressor(quality=4)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self) -> None:
+        self._obj = zstandard.ZstdCompressor(level=3).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+def available_encodings() -> dict[str, Callable[[], _Encoder]]:
+    """Encoder factories by content-coding, in server preference order."""
+    encoders: dict[str, Callable[[], _Encoder]] = {}
+    if zstandard is not None:
+        encoders["zstd"] = _ZstdEncoder
+    if brotli is not None:
+        encoders["br"] = _BrotliEncoder
+    encoders["gzip"] = _GzipEncoder
+    return encoders
+
+
+def negotiate(accept_encoding: Optional[str], available: list[str]) -> Optional[str]:
+    """
+    Pick a content-coding from an Accept-Encoding header: highest q-value wins, ties go
+    to the server's preference order in `available`. None means send identity.
+    """
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in available:
+        q = weights.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def _is_compressible(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith(_COMPRESSIBLE_PREFIXES) or media_type.endswith(
+        _COMPRESSIBLE_SUFFIXES
+    )
+
+
+@dataclass
+class CompressionStats:
+    """Process-wide counters of compressed responses and bytes in/out per encoding."""
+
+    responses: dict[str, int] = field(default_factory=dict)
+    bytes_in: dict[str, int] = field(default_factory=dict)
+    bytes_out: dict[str, int] = field(default_factory=dict)
+
+    def record(self, encoding: str, raw: int, encoded: int) -> None:
+        self.responses[encoding] = self.responses.get(encoding, 0) + 1
+        self.bytes_in[encoding] = self.bytes_in.get(encoding, 0) + raw
+        self.bytes_out[encoding] = self.bytes_out.get(encoding, 0) + encoded
+
+    @property
+    def bytes_saved(self) -> int:
+        return sum(self.bytes_in.values()) - sum(self.bytes_out.values())
+
+    def reset(self) -> None:
+        self.responses.clear()
+        self.bytes_in.clear()
+        self.bytes_out.clear()
+
+
+compression_stats = CompressionStats()
+
+
+class CompressionMiddleware:
+    """Compress HTTP responses by Accept-Encoding; see the module docstring."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(
+            Headers(scope=scope).get("accept-encoding"), list(self.encoders)
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponder(self, scope, encoding)(receive, send)
+
+
+class _CompressedResponder:
+    """Per-request state: holds the start message until the first body bytes decide."""
+
+    def __init__(self, middleware: CompressionMiddleware, scope: Scope, encoding: str):
+        self.app = middleware.app
+        self.minimum_size = middleware.minimum_size
+        self.scope = scope
+        self.encoding = encoding
+        self.encoder_factory = middleware.encoders[encoding]
+        self.start: Optional[Message] = None
+        self.buffer: list[bytes] = []
+        self.buffered = 0
+        self.encoder: Optional[_Encoder] = None
+        self.passthrough = False
+        self.raw = 0
+        self.encoded = 0
+
+    async def __call__(self, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(self.scope, receive, self.send_compressed)
+
+    def _eligible(self, message: Message) -> bool:
+        headers = Headers(raw=message["headers"])
+        endpoint = self.scope.get("endpoint")
+        return (
+            message["status"] >= 200
+            and message["status"] not in (204, 304)
+            and "content-encoding" not in headers
+            and not getattr(endpoint, _UNCOMPRESSED_ATTR, False)
+            and _is_compressible(headers.get("content-type"))
+        )
+
+    async def send_compressed(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            if not self._eligible(message):
+                self.passthrough = True
+                await self.send(message)
+                return
+            MutableHeaders(scope=message).add_vary_header("Accept-Encoding")
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body" or self.start is None:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is None:
+            self.buffer.append(body)
+            self.buffered += len(body)
+            if self.buffered < self.minimum_size:
+                if more_body:
+                    return
+                # Whole body is below the threshold: send it as-is.
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": b"".join(self.buffer)})
+                return
+            body, self.buffer = b"".join(self.buffer), []
+            await self._begin(body, more_body)
+        else:
+            chunk = self.encoder.compress(body)
+            chunk += self.encoder.flush() if more_body else self.encoder.finish()
+            await self._emit(body, chunk, more_body)
+
+    async def _begin(self, body: bytes, more_body: bool) -> None:
+        self.encoder = self.encoder_factory()
+        chunk = self.encoder.compress(body)
+        chunk += self.encoder.flush() if more_body else self.encoder.finish()
+        headers = MutableHeaders(scope=self.start)
+        headers["Content-Encoding"] = self.encoding
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(chunk))
+        await self.send(self.start)
+        await self._emit(body, chunk, more_body)
+
+    async def _emit(self, body: bytes, chunk: bytes, more_body: bool) -> None:
+        self.raw += len(body)
+        self.encoded += len(chunk)
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+        if not more_body:
+            compression_stats.record(self.encoding, self.raw, self.encoded)
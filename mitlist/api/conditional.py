@@ -0,0 +1,121 @@
+"""Conditional GET: weak ETags from cheap probes, 304 on If-None-Match.
+
+Instead of loading and serializing a result to hash it, an endpoint probes the rows it
+would return: `count(*)` and `max(updated_at)` (plus `sum(version_id)` for versioned
+models) for a collection, or `updated_at`/`version_id` for a single row. `updated_at`
+alone misses writes that leave the maximum where it was (transaction-start timestamps,
+one-second resolution), so models polled through here should carry a version column. The probe, the caller,
+the requested group scope, the request path and query string make up the ETag, so a
+matching If-None-Match is answered with 304 before the handler touches the full result.
+Responses vary by Authorization and X-Group-ID: two principals (or groups) whose probes
+happen to agree never share a validator.
+
+Usage:
+    @router.get("")
+    async def get_things(
+        conditional: ConditionalGet = Depends(get_conditional),
+        db: AsyncSession = Depends(get_read_only_db),
+    ):
+        not_modified = await conditional.collection(db, Thing, Thing.group_id == gid)
+        if not_modified is not None:
+            return not_modified
+        ...
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from fastapi import Depends, Request, Response, status
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist.api.deps import _requested_group_id, get_current_user
+from mitlist.modules.auth.models import User
+
+# Per-user data: caches may store it but must revalidate every time.
+CACHE_CONTROL = "private, no-cache"
+# Request headers that select whose data (and which group's) a response holds
+VARY = "Authorization, X-Group-ID"
+
+
+def weak_etag(*parts: Any) -> str:
+    """Weak ETag over the string form of `parts`."""
+    digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of `etag` against an If-None-Match header value."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+@dataclass
+class ConditionalGet:
+    """Request-scoped helper that sets ETag/Cache-Control and short-circuits with 304."""
+
+    request: Request
+    response: Response
+    user_id: Optional[int] = None
+    etag: Optional[str] = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Validator headers, for handlers that return their own Response."""
+        if self.etag is None:
+            return {}
+        return {"ETag": self.etag, "Cache-Control": CACHE_CONTROL, "Vary": VARY}
+
+    def _evaluate(self, *probe: Any) -> Optional[Response]:
+        self.etag = weak_etag(
+            self.user_id,
+            _requested_group_id(self.request),
+            self.request.url.path,
+            self.request.url.query,
+            *probe,
+        )
+        self.response.headers.update(self.headers)
+        if etag_matches(self.request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers)
+        return None
+
+    async def collection(
+        self, db: AsyncSession, model: Any, *criteria: ColumnElement[bool]
+    ) -> Optional[Response]:
+        """Probe the rows of `model` matching `criteria`; 304 response if unchanged."""
+        columns = [func.count(), func.max(model.updated_at)]
+        if hasattr(model, "version_id"):
+            columns.append(func.sum(model.version_id))
+        probe = (await db.execute(select(*columns).where(*criteria))).one()
+        return self._evaluate(*probe)
+
+    async def row(
+        self, db: AsyncSession, model: Any, row_id: int, *criteria: ColumnElement[bool]
+    ) -> Optional[Response]:
+        """
+        Probe one row by primary key (and `criteria`, e.g. group scope); 304 response if
+        unchanged. A missing row yields None so the handler raises its usual 404.
+        """
+        columns = [model.updated_at]
+        if hasattr(model, "version_id"):
+            columns.append(model.version_id)
+        probe = (
+            await db.execute(select(*columns).where(model.id == row_id, *criteria))
+        ).one_or_none()
+        if probe is None:
+            return None
+        return self._evaluate(*probe)
+
+
+def get_conditional(
+    request: Request, response: Response, user: User = Depends(get_current_user)
+) -> ConditionalGet:
+    """Dependency for endpoints that support conditional GET (ETags scoped to the caller)."""
+    return ConditionalGet(request=request, response=response, user_id=user.id)
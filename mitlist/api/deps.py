@@ -1,14 +1,23 @@
 """FastAPI dependencies for database and authentication."""
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
 
 from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from mitlist.api.principal import (
+    SharedPrincipal,
+    invalidate_after_commit,
+    last_login_buffer,
+    user_cache,
+)
+from mitlist.db.engine import ReadSessionLocal, replica_router
 from mitlist.db.engine import get_db as get_db_session
+from mitlist.db.engine import get_read_only_db as get_read_only_db_session
 from mitlist.core.auth.zitadel import ZitadelTokenError, require_active_token, verify_access_token
 from mitlist.core.config import settings
 from mitlist.core.errors import ForbiddenError, UnauthorizedError, ValidationError
@@ -18,12 +27,17 @@ from mitlist.modules.auth.models import User, UserGroup
 # Re-export for convenience
 __all__ = [
     "get_db",
+    "get_read_only_db",
+    "get_read_db",
     "get_bearer_token",
     "get_current_principal",
     "get_current_user",
     "get_current_group_id",
+    "get_group_context",
+    "GroupContext",
     "require_group_admin",
     "require_introspection_user",
+    "invalidate_cached_user",
 ]
 
 
@@ -37,6 +51,62 @@ async def get_db() -> AsyncSession:
         yield session
 
 
+async def get_read_only_db() -> AsyncSession:
+    """
+    Dependency that yields a read-only session on the primary (no commit).
+
+    This is a re-export wrapper around mitlist.db.engine.get_read_only_db.
+    """
+    async for session in get_read_only_db_session():
+        yield session
+
+
+async def get_read_db(db: AsyncSession = Depends(get_read_only_db)) -> AsyncSession:
+    """
+    Dependency for read-only paths: a session on a healthy read replica.
+
+    Falls back to a read-only primary session when no replica is configured or
+    every replica lags beyond DATABASE_REPLICA_MAX_LAG_SECONDS. Results may be a
+    few seconds stale, so only use it where that is acceptable.
+    """
+    replica = replica_router.pick()
+    if replica is None:
+        yield db
+        return
+    async with ReadSessionLocal(bind=replica) as session:
+        yield session
+
+
+# Endpoint -> whether it reads through get_read_only_db (resolved once per endpoint)
+_read_only_routes: dict[Any, bool] = {}
+
+
+def _depends_on(dependant: Any, call: Any) -> bool:
+    return any(d.call is call or _depends_on(d, call) for d in dependant.dependencies)
+
+
+async def _principal_db(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_only_db),
+) -> AsyncSession:
+    """
+    Session for the principal and membership lookups: the one the handler queries.
+
+    Routes reading through get_read_only_db (directly or via get_read_db) get that
+    session, everything else the read-write one, so a request checks out a single
+    connection. Sessions connect on their first query; the unused one costs nothing.
+    """
+    dependant = getattr(request.scope.get("route"), "dependant", None)
+    if dependant is None:
+        return db
+    read_only = _read_only_routes.get(dependant.call)
+    if read_only is None:
+        read_only = _depends_on(dependant, get_read_only_db)
+        _read_only_routes[dependant.call] = read_only
+    return read_db if read_only else db
+
+
 security = HTTPBearer(auto_error=False)
 
 
@@ -60,8 +130,18 @@ def _parse_dev_token(token: str) -> dict[str, Any] | None:
     return {"sub": sub, "email": email, "name": name, "preferred_username": email}
 
 
-async def get_current_principal(token: str = Depends(get_bearer_token)) -> dict[str, Any]:
+def _shared_principal(request: Request) -> Optional[SharedPrincipal]:
+    """Principal the batch endpoint resolved for its sub-requests (see api/batch.py)."""
+    return getattr(request.state, "shared_principal", None)
+
+
+async def get_current_principal(
+    request: Request, token: str = Depends(get_bearer_token)
+) -> dict[str, Any]:
     """Validate the token (JWKS or dev token) and return its claims."""
+    shared = _shared_principal(request)
+    if shared is not None:
+        return shared.claims
     dev_claims = _parse_dev_token(token)
     if dev_claims is not None:
         return dev_claims
@@ -73,21 +153,61 @@ async def get_current_principal(token: str = Depends(get_bearer_token)) -> dict[
 
 
 async def get_current_user(
+    request: Request,
     claims: dict[str, Any] = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
+    lookup_db: AsyncSession = Depends(_principal_db),
 ) -> User:
-    """Map Zitadel subject to a local User row (create-on-first-seen if enabled)."""
+    """
+    Map Zitadel subject to a local User row (create-on-first-seen if enabled).
+
+    Cached principals are served without a DB round trip; `last_login_at` is
+    recorded in the write-behind buffer and flushed in batches. On a cache miss
+    with a group scope on the request, the membership role is loaded in the same
+    joined query and shared with the group dependencies via request state.
+    Lookups run on the handler's session; only the rare writes (first sight, a
+    changed subject) go through the read-write one.
+    Sub-requests of a batch reuse the user the batch resolved.
+    """
+    shared = _shared_principal(request)
+    if shared is not None:
+        user = shared.user()
+        set_user_id(user.id)
+        return user
+
     sub = claims.get("sub")
     email = claims.get("email") or claims.get("preferred_username")
     if not sub:
         raise UnauthorizedError(code="TOKEN_MISSING_SUB", detail="Token missing subject (sub)")
 
+    now = datetime.now(timezone.utc)
+    cached = user_cache.get(sub)
+    if cached is not None:
+        last_login_buffer.record(cached.id, now)
+        set_user_id(cached.id)
+        return cached
+
     if not email:
         # fallback: stable synthetic email to satisfy local uniqueness/NOT NULL constraint
         email = f"{sub}@zitadel.local"
 
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
+    group_id = _requested_group_id(request)
+    if group_id is not None:
+        result = await lookup_db.execute(
+            select(User, UserGroup.role)
+            .outerjoin(
+                UserGroup,
+                and_(UserGroup.user_id == User.id, UserGroup.group_id == group_id),
+            )
+            .where(User.email == email)
+        )
+        row = result.first()
+        user = row[0] if row else None
+        if user is not None:
+            _remember_membership(request, user.id, group_id, row[1])
+    else:
+        result = await lookup_db.execute(select(User).where(User.email == email))
+        user = result.scalar_one_or_none()
 
     if user is None:
         if not settings.ZITADEL_USER_AUTOCREATE:
@@ -100,25 +220,45 @@ async def get_current_user(
             avatar_url=claims.get("picture"),
             is_active=True,
             preferences={"zitadel_sub": sub},
-            last_login_at=datetime.now(timezone.utc),
+            last_login_at=now,
         )
         db.add(user)
         await db.flush()
         await db.refresh(user)
     else:
-        # update last_login and ensure we remember sub
-        user.last_login_at = datetime.now(timezone.utc)
-        prefs = user.preferences or {}
-        if prefs.get("zitadel_sub") != sub:
-            prefs["zitadel_sub"] = sub
-            user.preferences = prefs
-        await db.flush()
-        await db.refresh(user)
+        # ensure we remember sub; last_login goes through the write-behind buffer
+        user = await _remember_subject(db, lookup_db, user, sub)
+        last_login_buffer.record(user.id, now)
 
+    user_cache.put(sub, user)
     set_user_id(user.id)
     return user
 
 
+async def _remember_subject(
+    db: AsyncSession, lookup_db: AsyncSession, user: User, sub: str
+) -> User:
+    """Store the token subject on `user` (loaded from `lookup_db`) through the write session."""
+    prefs = user.preferences or {}
+    if prefs.get("zitadel_sub") == sub:
+        return user
+    if lookup_db is not db:
+        user = await db.merge(user)
+    user.preferences = {**prefs, "zitadel_sub": sub}
+    await db.flush()
+    await db.refresh(user)
+    return user
+
+
+def invalidate_cached_user(db: AsyncSession, user_id: int) -> None:
+    """
+    Evict a user from the principal cache after profile or account changes.
+
+    Takes effect when `db` commits (nothing happens on rollback), in every worker.
+    """
+    invalidate_after_commit(db, user_id)
+
+
 async def require_introspection_user(
     token: str = Depends(get_bearer_token),
     user: User = Depends(get_current_user),
@@ -133,10 +273,63 @@ async def require_introspection_user(
         raise UnauthorizedError(code="TOKEN_NOT_ACTIVE", detail=str(e)) from e
 
 
+def _requested_group_id(request: Request) -> Optional[int]:
+    """Group scope from `X-Group-ID` (preferred) or `group_id` query param, if parseable."""
+    raw = request.headers.get("X-Group-ID") or request.query_params.get("group_id")
+    if not raw:
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        return None
+
+
+def _membership_roles(request: Request) -> dict[tuple[int, int], Optional[str]]:
+    """Per-request memo of (user_id, group_id) -> role (None = not a member)."""
+    roles = getattr(request.state, "group_roles", None)
+    if roles is None:
+        roles = {}
+        request.state.group_roles = roles
+    return roles
+
+
+def _remember_membership(
+    request: Request, user_id: int, group_id: int, role: Optional[str]
+) -> None:
+    _membership_roles(request)[(user_id, group_id)] = role
+
+
+async def _get_membership_role(
+    request: Request, db: AsyncSession, user_id: int, group_id: int
+) -> Optional[str]:
+    """Return the caller's role in `group_id`, querying at most once per request."""
+    roles = _membership_roles(request)
+    key = (user_id, group_id)
+    if key not in roles:
+        result = await db.execute(
+            select(UserGroup.role).where(UserGroup.group_id == group_id, UserGroup.user_id == user_id)
+        )
+        roles[key] = result.scalar_one_or_none()
+    return roles[key]
+
+
+@dataclass(frozen=True)
+class GroupContext:
+    """Resolved principal + group scope for the current request."""
+
+    user: User
+    group_id: int
+    role: str
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role == "ADMIN"
+
+
 async def get_current_group_id(
     request: Request,
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(_principal_db),
 ) -> int:
     """
     Resolve current group scope for request.
@@ -156,27 +349,31 @@ async def get_current_group_id(
     except ValueError as e:
         raise ValidationError(code="INVALID_GROUP_ID", detail="group_id must be an integer") from e
 
-    result = await db.execute(
-        select(UserGroup).where(UserGroup.group_id == group_id, UserGroup.user_id == user.id)
-    )
-    membership = result.scalar_one_or_none()
-    if not membership:
+    role = await _get_membership_role(request, db, user.id, group_id)
+    if role is None:
         raise ForbiddenError(code="NOT_A_MEMBER", detail="User is not a member of this group")
 
     set_group_id(group_id)
     return group_id
 
 
-async def require_group_admin(
+async def get_group_context(
+    request: Request,
     group_id: int = Depends(get_current_group_id),
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(_principal_db),
+) -> GroupContext:
+    """User, group and membership role resolved together (reuses the request memo)."""
+    role = await _get_membership_role(request, db, user.id, group_id)
+    if role is None:
+        raise ForbiddenError(code="NOT_A_MEMBER", detail="User is not a member of this group")
+    return GroupContext(user=user, group_id=group_id, role=role)
+
+
+async def require_group_admin(
+    context: GroupContext = Depends(get_group_context),
 ) -> int:
     """Require ADMIN role in the current group."""
-    result = await db.execute(
-        select(UserGroup).where(UserGroup.group_id == group_id, UserGroup.user_id == user.id)
-    )
-    membership = result.scalar_one_or_none()
-    if not membership or membership.role != "ADMIN":
+    if not context.is_admin:
         raise ForbiddenError(code="ADMIN_REQUIRED", detail="Admin role required for this action")
-    return group_id
+    return context.group_id
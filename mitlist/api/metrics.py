@@ -0,0 +1,18 @@
+"""Prometheus scrape endpoint."""
+
+from fastapi import APIRouter, Response
+
+from mitlist.core.metrics import render
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """
+    Prometheus text exposition (all workers when PROMETHEUS_MULTIPROC_DIR is set).
+
+    Unauthenticated like the health probes: keep it off the public ingress.
+    """
+    body, content_type = render()
+    return Response(content=body, media_type=content_type)
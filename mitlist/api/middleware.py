@@ -0,0 +1,175 @@
+"""Pure ASGI middleware: request context (trace id, contextvars, timing, SQL stats),
+request metrics and maintenance mode.
+
+Runs the app in the request's own task (no BaseHTTPMiddleware task/stream hop), so
+streaming responses pass through untouched and contextvars set by dependencies are
+visible to the rest of the request. Headers are added on `http.response.start`.
+"""
+
+import time
+import uuid
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mitlist.core.config import settings
+from mitlist.core.metrics import REQUESTS_IN_FLIGHT, observe_request
+from mitlist.core.request_context import get_trace_id, group_id_var, trace_id_var, user_id_var
+from mitlist.core.state import SharedValue
+from mitlist.db.instrumentation import QueryStats, report_query_stats, track_queries
+
+
+def _server_timing(started: float, query_stats: Optional[QueryStats]) -> str:
+    timing = f"app;dur={(time.perf_counter() - started) * 1000:.1f}"
+    if query_stats is not None:
+        timing = f"{timing}, {query_stats.server_timing()}"
+    return timing
+
+
+class RequestContextMiddleware:
+    """
+    Per HTTP request:
+      - take X-Request-ID from the client or generate one, expose it via get_trace_id()
+        and echo it on the response;
+      - scope user/group contextvars to the request and restore them afterwards;
+      - record SQL stats (SQL_INSTRUMENTATION_ENABLED) and, with SERVER_TIMING_ENABLED,
+        emit `Server-Timing: app;dur=..., db;dur=...`. The stats go on the OTel server
+        span just before the last body chunk is sent, since the span ends with it.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace_id = Headers(scope=scope).get("x-request-id") or str(uuid.uuid4())
+        tokens = (
+            trace_id_var.set(trace_id),
+            user_id_var.set(None),
+            group_id_var.set(None),
+        )
+        started = time.perf_counter()
+        query_stats: Optional[QueryStats] = None
+        reported = False
+
+        def report() -> None:
+            nonlocal reported
+            if query_stats is None or reported:
+                return
+            reported = True
+            report_query_stats(
+                query_stats,
+                f"{scope['method']} {scope['path']}",
+                settings.SQL_N_PLUS_ONE_THRESHOLD,
+            )
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = trace_id
+                if settings.SERVER_TIMING_ENABLED:
+                    headers.append("Server-Timing", _server_timing(started, query_stats))
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                report()
+            await send(message)
+
+        try:
+            if not settings.SQL_INSTRUMENTATION_ENABLED:
+                await self.app(scope, receive, send_with_headers)
+                return
+            with track_queries() as query_stats:
+                await self.app(scope, receive, send_with_headers)
+            # Returned without sending a final body chunk (e.g. client disconnected)
+            report()
+        finally:
+            for var, token in zip((trace_id_var, user_id_var, group_id_var), tokens, strict=True):
+                var.reset(token)
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Path template of the matched route, e.g. /api/v1/lists/{list_id}; "unmatched" for
+    404s so label cardinality stays bounded.
+
+    `scope["route"]` is the route as declared on its router (no include prefixes); the
+    effective route FastAPI resolved for the request carries the full template.
+    """
+    if "endpoint" not in scope:
+        return "unmatched"
+    route = scope.get("fastapi", {}).get("effective_route_context") or scope.get("route")
+    path = getattr(route, "path", None)
+    return "unmatched" if path is None else path
+
+
+class MetricsMiddleware:
+    """In-flight gauge and latency histogram labelled by route template (not raw path)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            observe_request(
+                scope["method"], route_template(scope), status_code, time.perf_counter() - started
+            )
+
+
+class MaintenanceModeMiddleware:
+    """
+    While maintenance mode is on, answer API requests (paths under `prefix`) with 503
+    Problem Details instead of running them. Paths in `exempt` stay reachable so the mode
+    can be switched off again. The flag is a SharedValue (local copy kept current by
+    invalidation messages), so the check costs no round trip.
+    """
+
+    def __init__(
+        self, app: ASGIApp, state: SharedValue, prefix: str = "/api/", exempt: tuple[str, ...] = ()
+    ):
+        self.app = app
+        self.state = state
+        self.prefix = prefix
+        self.exempt = frozenset(exempt)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.state.value.get("enabled")
+            or not scope["path"].startswith(self.prefix)
+            or scope["path"] in self.exempt
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        response = JSONResponse(
+            status_code=503,
+            content={
+                "type": "error:maintenance",
+                "code": "MAINTENANCE_MODE",
+                "detail": self.state.value.get("message") or "Service is under maintenance",
+                "instance": scope["path"],
+                "trace_id": get_trace_id(),
+            },
+        )
+        await response(scope, receive, send)
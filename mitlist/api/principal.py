@@ -0,0 +1,197 @@
+"""Principal cache and write-behind last-login tracking for get_current_user.
+
+A cache hit resolves the local User without touching the database; `last_login_at`
+updates are buffered in memory and written in one batched UPDATE per flush interval.
+SharedPrincipal hands a principal resolved once to in-process sub-requests (batch API).
+
+Profile and account changes evict the user with invalidate_after_commit(): once the
+session commits, this worker drops its cached principals and the user id is published
+on the state backend, so every other worker drops theirs too.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import event as sa_event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from mitlist.core.cache import TTLCache
+from mitlist.core.config import settings
+from mitlist.core.state import state_backend
+from mitlist.modules.auth.models import User
+
+logger = logging.getLogger(__name__)
+
+# Message: id of a user whose cached principals every worker must drop
+USER_INVALIDATION_CHANNEL = "invalidate-principal"
+
+_USER_COLUMNS = tuple(c.key for c in sa_inspect(User).column_attrs)
+
+
+def _snapshot(user: User) -> dict[str, Any]:
+    return {key: getattr(user, key) for key in _USER_COLUMNS}
+
+
+def _detached(snapshot: dict[str, Any]) -> User:
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+class UserCache:
+    """Map token `sub` to a snapshot of the local User row."""
+
+    def __init__(self, maxsize: int, ttl: float, name: Optional[str] = None):
+        self._cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=maxsize, ttl=ttl, name=name)
+
+    def get(self, sub: str) -> Optional[User]:
+        """Return a fresh detached User for `sub`, or None on miss."""
+        snapshot = self._cache.get(sub)
+        if snapshot is None:
+            return None
+        return _detached(snapshot)
+
+    def put(self, sub: str, user: User) -> None:
+        self._cache.set(sub, _snapshot(user))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached principal that maps to `user_id`."""
+        for sub, snapshot in self._cache.items():
+            if snapshot.get("id") == user_id:
+                self._cache.pop(sub)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return self._cache.stats()
+
+
+class SharedPrincipal:
+    """Token claims and user resolved once, reused by the sub-requests of a batch."""
+
+    def __init__(self, claims: dict[str, Any], user: User) -> None:
+        self.claims = claims
+        self._snapshot = _snapshot(user)
+
+    def user(self) -> User:
+        """A fresh detached User, so sub-requests never share an ORM instance."""
+        return _detached(self._snapshot)
+
+
+class LastLoginBuffer:
+    """Coalesce `last_login_at` writes per user and flush them in one batched UPDATE."""
+
+    def __init__(self) -> None:
+        self._pending: dict[int, datetime] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def record(self, user_id: int, seen_at: datetime) -> None:
+        current = self._pending.get(user_id)
+        if current is None or seen_at > current:
+            self._pending[user_id] = seen_at
+
+    def pending(self) -> dict[int, datetime]:
+        return dict(self._pending)
+
+    async def flush(self, session_factory: async_sessionmaker[AsyncSession]) -> int:
+        """Write buffered timestamps; returns the number of users updated."""
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        try:
+            async with session_factory() as session:
+                await session.execute(
+                    update(User),
+                    [{"id": uid, "last_login_at": ts} for uid, ts in batch.items()],
+                )
+                await session.commit()
+        except Exception:
+            # Put the batch back (newer in-memory values win) and retry on next tick.
+            for uid, ts in batch.items():
+                self.record(uid, ts)
+            raise
+        return len(batch)
+
+    async def _run(
+        self, session_factory: async_sessionmaker[AsyncSession], interval: float
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush(session_factory)
+            except Exception:
+                logger.exception("Failed to flush last_login_at buffer")
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession], interval: float) -> None:
+        """Start the periodic flusher (called from the application lifespan)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(session_factory, interval))
+
+    async def stop(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Cancel the flusher and write whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush(session_factory)
+        except Exception:
+            logger.exception("Failed to flush last_login_at buffer on shutdown")
+
+
+user_cache = UserCache(
+    maxsize=settings.USER_CACHE_MAX_ENTRIES,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    name="principal",
+)
+last_login_buffer = LastLoginBuffer()
+
+
+def invalidate_after_commit(db: AsyncSession, user_id: int) -> None:
+    """Drop `user_id`'s cached principals in every worker once `db` commits."""
+    db.info.setdefault("invalidate_principals", set()).add(user_id)
+
+
+_publishing: set[asyncio.Task[None]] = set()
+
+
+async def _publish_invalidations(user_ids: list[int]) -> None:
+    for user_id in user_ids:
+        try:
+            await state_backend.publish(USER_INVALIDATION_CHANNEL, str(user_id))
+        except Exception:
+            logger.warning("Publishing principal invalidation failed", exc_info=True)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    user_ids = session.info.pop("invalidate_principals", None)
+    if not user_ids:
+        return
+    # This worker right away; the others when the message reaches them
+    for user_id in user_ids:
+        user_cache.invalidate_user(user_id)
+    task = asyncio.get_running_loop().create_task(_publish_invalidations(sorted(user_ids)))
+    _publishing.add(task)
+    task.add_done_callback(_publishing.discard)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop("invalidate_principals", None)
+
+
+def _invalidated(message: str) -> None:
+    user_cache.invalidate_user(int(message))
+
+
+state_backend.subscribe(USER_INVALIDATION_CHANNEL, _invalidated)
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Depends
 
-from mitlist.api import health, system
+from mitlist.api import batch, health, metrics, system
 from mitlist.api.deps import get_current_user
 from mitlist.modules.assets import api as assets_api
 from mitlist.modules.audit import api as audit_api
@@ -26,8 +26,14 @@ api_router = APIRouter(prefix="/api/v1")
 health_router = APIRouter()
 health_router.include_router(health.router, prefix="/health")
 
+# Prometheus scrape endpoint (no version prefix)
+metrics_router = APIRouter()
+metrics_router.include_router(metrics.router)
+
 # Include module routers
 api_router.include_router(auth_api.router)
+# Resolves the principal itself and shares it with its sub-requests
+api_router.include_router(batch.router)
 api_router.include_router(system.router, dependencies=[Depends(get_current_user)])
 api_router.include_router(assets_api.router, dependencies=[Depends(get_current_user)])
 api_router.include_router(audit_api.router, dependencies=[Depends(get_current_user)])
@@ -46,4 +52,4 @@ api_router.include_router(pets_api.router, dependencies=[Depends(get_current_use
 api_router.include_router(plants_api.router, dependencies=[Depends(get_current_user)])
 api_router.include_router(recipes_api.router, dependencies=[Depends(get_current_user)])
 
-__all__ = ["api_router", "health_router"]
+__all__ = ["api_router", "health_router", "metrics_router"]
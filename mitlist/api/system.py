@@ -2,17 +2,15 @@
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter
 
-from mitlist.api.deps import get_db
 from mitlist.core.config import settings
 
 router = APIRouter(prefix="/system", tags=["system"])
 
 
 @router.get("/info")
-async def get_system_info(db: AsyncSession = Depends(get_db)):
+async def get_system_info():
     """Version and environment info."""
     return {
         "app_name": settings.PROJECT_NAME,
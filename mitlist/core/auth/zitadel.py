@@ -6,16 +6,26 @@ Critical strategy: validate locally + check revocation via introspection.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import httpx
 from jose import jwk, jwt
-from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
+from jose.backends.base import Key
+from jose.exceptions import ExpiredSignatureError, JWKError, JWTClaimsError, JWTError
 
+from mitlist.core.cache import TTLCache
 from mitlist.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+_REFRESH_RETRY_SECONDS = 30.0
+
 
 @dataclass(frozen=True)
 class VerifiedToken:
@@ -36,77 +46,220 @@ class ZitadelTokenError(Exception):
 
 
 _discovery_cache: dict[str, Any] = {"expires_at": 0.0, "value": None}
-_jwks_cache: dict[str, Any] = {"expires_at": 0.0, "value": None}
+_jwks_cache: dict[str, Any] = {"expires_at": 0.0, "fetched_at": 0.0, "value": None}
+# kid -> constructed public key, rebuilt only when the cached JWKS document changes
+_key_cache: dict[str, Any] = {"jwks": None, "keys": {}}
+# sha256(token) -> verified claims, each entry expiring no later than the token's exp
+_verified_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=settings.ZITADEL_TOKEN_CACHE_MAX_ENTRIES,
+    ttl=settings.ZITADEL_TOKEN_CACHE_TTL_SECONDS,
+    name="zitadel_verified_token",
+)
+# sha256(token) -> introspection response (active and negative entries)
+_introspection_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=settings.ZITADEL_INTROSPECTION_CACHE_MAX_ENTRIES,
+    ttl=max(
+        settings.ZITADEL_INTROSPECTION_CACHE_TTL_SECONDS,
+        settings.ZITADEL_INTROSPECTION_NEGATIVE_CACHE_TTL_SECONDS,
+    ),
+    name="zitadel_introspection",
+)
+_introspection_stats: dict[str, int] = {"coalesced": 0}
+
+
+_http_client: Optional[httpx.AsyncClient] = None
+# name -> in-flight refresh shared by concurrent callers (single-flight)
+_inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+_refresh_task: Optional[asyncio.Task[None]] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared keep-alive client; created lazily when used outside the app lifespan."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=settings.ZITADEL_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.ZITADEL_HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=60.0,
+            ),
+        )
+    return _http_client
 
 
 async def _fetch_json(url: str) -> dict[str, Any]:
-    async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.json()
+    resp = await _get_http_client().get(url)
+    resp.raise_for_status()
+    return resp.json()
 
 
-async def get_discovery() -> dict[str, Any]:
-    """Fetch and cache the OIDC discovery document."""
-    now = time.time()
-    if _discovery_cache["value"] is not None and now < _discovery_cache["expires_at"]:
-        return _discovery_cache["value"]
+async def _single_flight(
+    name: str, fetch: Callable[[], Awaitable[dict[str, Any]]]
+) -> dict[str, Any]:
+    """Run `fetch` once for all concurrent callers of the same `name`."""
+    task = _inflight.get(name)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[name] = task
+
+        def _forget(done: asyncio.Task[dict[str, Any]]) -> None:
+            if _inflight.get(name) is done:
+                del _inflight[name]
+
+        task.add_done_callback(_forget)
+    # shield: a cancelled caller must not cancel the fetch other callers await
+    return await asyncio.shield(task)
+
+
+def _cache_ttl() -> float:
+    return max(30, settings.ZITADEL_JWKS_CACHE_TTL_SECONDS)
+
 
+async def _refresh_discovery() -> dict[str, Any]:
     url = settings.zitadel_discovery_url
     if not url:
         raise ZitadelTokenError("Zitadel discovery URL is not configured (ZITADEL_BASE_URL).")
 
     doc = await _fetch_json(url)
     _discovery_cache["value"] = doc
-    _discovery_cache["expires_at"] = now + max(30, settings.ZITADEL_JWKS_CACHE_TTL_SECONDS)
+    _discovery_cache["expires_at"] = time.time() + _cache_ttl()
     return doc
 
 
-async def get_jwks() -> dict[str, Any]:
-    """Fetch and cache the JWKS (public keys)."""
-    now = time.time()
-    if _jwks_cache["value"] is not None and now < _jwks_cache["expires_at"]:
-        return _jwks_cache["value"]
+async def get_discovery() -> dict[str, Any]:
+    """Fetch and cache the OIDC discovery document."""
+    if _discovery_cache["value"] is not None and time.time() < _discovery_cache["expires_at"]:
+        return _discovery_cache["value"]
+    return await _single_flight("discovery", _refresh_discovery)
+
 
+async def _refresh_jwks() -> dict[str, Any]:
     discovery = await get_discovery()
     jwks_uri = discovery.get("jwks_uri")
     if not jwks_uri:
         raise ZitadelTokenError("Discovery document missing jwks_uri.")
 
     jwks = await _fetch_json(jwks_uri)
+    now = time.time()
     _jwks_cache["value"] = jwks
-    _jwks_cache["expires_at"] = now + max(30, settings.ZITADEL_JWKS_CACHE_TTL_SECONDS)
+    _jwks_cache["fetched_at"] = now
+    _jwks_cache["expires_at"] = now + _cache_ttl()
     return jwks
 
 
-def _jwk_to_public_pem(key_dict: dict[str, Any]) -> str:
-    key_obj = jwk.construct(key_dict)
-    pem = key_obj.to_pem()
-    if isinstance(pem, bytes):
-        return pem.decode("utf-8")
-    return str(pem)
+async def get_jwks(force_refresh: bool = False) -> dict[str, Any]:
+    """
+    Fetch and cache the JWKS (public keys).
 
+    `force_refresh` (unknown kid) is rate-limited by
+    ZITADEL_JWKS_MIN_REFRESH_INTERVAL_SECONDS so bogus kids cannot hammer the IdP.
+    """
+    now = time.time()
+    cached = _jwks_cache["value"]
+    if cached is not None and now < _jwks_cache["expires_at"]:
+        if not force_refresh:
+            return cached
+        min_interval = settings.ZITADEL_JWKS_MIN_REFRESH_INTERVAL_SECONDS
+        if now - _jwks_cache.get("fetched_at", 0.0) < min_interval:
+            return cached
+    return await _single_flight("jwks", _refresh_jwks)
+
+
+def _next_refresh_delay() -> float:
+    """Seconds until the JWKS should be refreshed ahead of its expiry."""
+    ttl = _cache_ttl()
+    ahead = min(settings.ZITADEL_JWKS_REFRESH_AHEAD_SECONDS, ttl / 2)
+    return max(0.0, _jwks_cache["expires_at"] - ahead - time.time())
+
+
+async def _background_refresh() -> None:
+    """Keep discovery + JWKS warm so requests never wait on a refresh."""
+    while True:
+        await asyncio.sleep(_next_refresh_delay())
+        try:
+            await _single_flight("discovery", _refresh_discovery)
+            await _single_flight("jwks", _refresh_jwks)
+        except Exception:
+            logger.warning("Zitadel JWKS background refresh failed; retrying", exc_info=True)
+            await asyncio.sleep(_REFRESH_RETRY_SECONDS)
+
+
+async def start_zitadel_client() -> None:
+    """Open the shared HTTP client and start background key rotation (app lifespan)."""
+    global _refresh_task
+    _get_http_client()
+    if settings.ZITADEL_BASE_URL and (_refresh_task is None or _refresh_task.done()):
+        _refresh_task = asyncio.create_task(_background_refresh())
+
+
+async def stop_zitadel_client() -> None:
+    """Stop background rotation and close the shared HTTP client."""
+    global _http_client, _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _construct_key(key_dict: dict[str, Any]) -> Key:
+    return jwk.construct(key_dict, algorithm=key_dict.get("alg") or "RS256")
+
+
+def _keys_by_kid(jwks: dict[str, Any]) -> dict[str, Key]:
+    """Parse each JWK once per JWKS document."""
+    if _key_cache["jwks"] is not jwks:
+        keys: dict[str, Key] = {}
+        for k in jwks.get("keys", []):
+            kid = k.get("kid")
+            if not kid:
+                continue
+            try:
+                keys[kid] = _construct_key(k)
+            except JWKError:
+                # unsupported key type/alg; tokens signed with it fail as unknown kid
+                continue
+        _key_cache["keys"] = keys
+        _key_cache["jwks"] = jwks
+    return _key_cache["keys"]
+
+
+async def _get_public_key_for_kid(kid: str) -> Key:
+    key = _keys_by_kid(await get_jwks()).get(kid)
+    if key is not None:
+        return key
+
+    # key rotation: refresh once (single-flight, rate-limited)
+    key = _keys_by_kid(await get_jwks(force_refresh=True)).get(kid)
+    if key is not None:
+        return key
 
-async def _get_public_key_for_kid(kid: str) -> str:
-    jwks = await get_jwks()
-    keys = jwks.get("keys", [])
-    for k in keys:
-        if k.get("kid") == kid:
-            return _jwk_to_public_pem(k)
+    raise ZitadelTokenError(f"Unknown signing key (kid={kid}).")
 
-    # key rotation: refresh once
-    _jwks_cache["expires_at"] = 0.0
-    jwks = await get_jwks()
-    keys = jwks.get("keys", [])
-    for k in keys:
-        if k.get("kid") == kid:
-            return _jwk_to_public_pem(k)
 
-    raise ZitadelTokenError(f"Unknown signing key (kid={kid}).")
+def _token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
 async def verify_access_token(token: str) -> VerifiedToken:
-    """Verify a Zitadel access token locally using JWKS."""
+    """
+    Verify a Zitadel access token locally using JWKS.
+
+    Verified claims are cached by token hash until the token's `exp`, so repeat
+    requests with the same bearer token skip signature verification.
+    """
+    cache_key = _token_cache_key(token)
+    cached = _verified_cache.get(cache_key)
+    if cached is not None:
+        return VerifiedToken(token=token, claims=cached)
+
     try:
         header = jwt.get_unverified_header(token)
         kid = header.get("kid")
@@ -136,6 +289,9 @@ async def verify_access_token(token: str) -> VerifiedToken:
             issuer=settings.zitadel_issuer if verify_iss else None,
             options=options,
         )
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            _verified_cache.set(cache_key, claims, ttl=exp - time.time())
         return VerifiedToken(token=token, claims=claims)
     except (ExpiredSignatureError, JWTClaimsError, JWTError) as e:
         raise ZitadelTokenError(f"Invalid token: {e}") from e
@@ -155,20 +311,66 @@ async def introspect_token(token: str) -> dict[str, Any]:
             "(ZITADEL_INTROSPECTION_CLIENT_ID/SECRET)."
         )
 
-    async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-        resp = await client.post(
-            url,
-            data={"token": token},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            auth=(client_id, client_secret),
-        )
-        resp.raise_for_status()
-        return resp.json()
+    resp = await _get_http_client().post(
+        url,
+        data={"token": token},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        auth=(client_id, client_secret),
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _token_exp(token: str, introspection: dict[str, Any]) -> Optional[float]:
+    """Expiry from the introspection response, else from the (unverified) JWT claims."""
+    exp = introspection.get("exp")
+    if not isinstance(exp, (int, float)):
+        try:
+            exp = jwt.get_unverified_claims(token).get("exp")
+        except JWTError:
+            return None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+async def introspect_token_cached(token: str) -> dict[str, Any]:
+    """
+    Introspection with a short-lived result cache.
+
+    Active results live for ZITADEL_INTROSPECTION_CACHE_TTL_SECONDS, inactive ones
+    (negative entries) for ZITADEL_INTROSPECTION_NEGATIVE_CACHE_TTL_SECONDS; neither
+    outlives the token's exp. Concurrent misses for the same token share one call.
+    """
+    cache_key = _token_cache_key(token)
+    cached = _introspection_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    async def _introspect() -> dict[str, Any]:
+        data = await introspect_token(token)
+        if data.get("active"):
+            ttl = float(settings.ZITADEL_INTROSPECTION_CACHE_TTL_SECONDS)
+        else:
+            ttl = float(settings.ZITADEL_INTROSPECTION_NEGATIVE_CACHE_TTL_SECONDS)
+        exp = _token_exp(token, data)
+        if exp is not None:
+            ttl = min(ttl, exp - time.time())
+        _introspection_cache.set(cache_key, data, ttl=ttl)
+        return data
+
+    flight = f"introspect:{cache_key}"
+    if flight in _inflight:
+        _introspection_stats["coalesced"] += 1
+    return await _single_flight(flight, _introspect)
+
+
+def introspection_cache_stats() -> dict[str, Any]:
+    """Hit/miss/coalesced counters of the introspection cache, for tuning."""
+    return {**_introspection_cache.stats(), "coalesced": _introspection_stats["coalesced"]}
 
 
 async def require_active_token(token: str) -> dict[str, Any]:
-    """Introspect token and require active=true."""
-    data = await introspect_token(token)
+    """Introspect token (cached) and require active=true."""
+    data = await introspect_token_cached(token)
     if not data.get("active"):
         raise ZitadelTokenError("Token is not active (revoked or expired).")
     return data
@@ -0,0 +1,89 @@
+"""In-process TTL + LRU cache used by hot-path lookups (principals, tokens, keys)."""
+
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from typing import Any, Generic, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# name -> cache, for metrics export
+_named_caches: "weakref.WeakValueDictionary[str, TTLCache[Any, Any]]" = weakref.WeakValueDictionary()
+
+
+def named_caches() -> dict[str, "TTLCache[Any, Any]"]:
+    """Live caches that were created with a `name`."""
+    return dict(_named_caches)
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded mapping whose entries expire after a TTL.
+
+    Least-recently-used entries are evicted once `maxsize` is reached.
+    Not thread-safe: intended for use from the event loop thread only.
+    A `name` registers the cache for hit/miss metrics (see named_caches()).
+    """
+
+    def __init__(self, maxsize: int, ttl: float, name: Optional[str] = None):
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        if name is not None:
+            _named_caches[name] = self
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Store a value; `ttl` overrides the cache default for this entry."""
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0:
+            self._data.pop(key, None)
+            return
+        self._data[key] = (time.monotonic() + lifetime, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove and return an entry (expired or not)."""
+        entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        """Iterate over a snapshot of (key, value) pairs, including stale ones."""
+        return ((k, v) for k, (_, v) in list(self._data.items()))
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for tuning."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits / total) if total else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
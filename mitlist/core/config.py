@@ -17,6 +17,13 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 10
+    # Read replicas: comma-separated async SQLAlchemy URLs (empty = primary only)
+    DATABASE_READ_REPLICA_URLS: str = ""
+    # Replicas lagging more than this fall back to the primary
+    DATABASE_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DATABASE_REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 10.0
 
     # Security
     SECRET_KEY: str
@@ -30,14 +37,33 @@ class Settings(BaseSettings):
     ZITADEL_AUDIENCE: str = ""
     # JWKS cache TTL
     ZITADEL_JWKS_CACHE_TTL_SECONDS: int = 3600
+    # Background refresh starts this long before the JWKS cache expires
+    ZITADEL_JWKS_REFRESH_AHEAD_SECONDS: int = 300
+    # Minimum gap between forced JWKS refetches triggered by unknown kids
+    ZITADEL_JWKS_MIN_REFRESH_INTERVAL_SECONDS: int = 30
+    # Shared keep-alive HTTP client pool size (discovery, JWKS, introspection)
+    ZITADEL_HTTP_MAX_CONNECTIONS: int = 20
+    # Verified-token cache (entries never outlive the token's exp)
+    ZITADEL_TOKEN_CACHE_TTL_SECONDS: int = 300
+    ZITADEL_TOKEN_CACHE_MAX_ENTRIES: int = 10000
     # Clock skew leeway in seconds for exp/nbf checks
     ZITADEL_CLOCK_SKEW_SECONDS: int = 10
     # Introspection client auth (client_secret_basic)
     ZITADEL_INTROSPECTION_CLIENT_ID: str = ""
     ZITADEL_INTROSPECTION_CLIENT_SECRET: str = ""
+    # Introspection result cache (never served past the token's exp)
+    ZITADEL_INTROSPECTION_CACHE_TTL_SECONDS: int = 15
+    ZITADEL_INTROSPECTION_NEGATIVE_CACHE_TTL_SECONDS: int = 60
+    ZITADEL_INTROSPECTION_CACHE_MAX_ENTRIES: int = 10000
     # User mapping behavior
     ZITADEL_USER_AUTOCREATE: bool = True
 
+    # Principal cache (token sub -> local user); 0 disables caching
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    # Write-behind interval for batched last_login_at updates
+    LAST_LOGIN_FLUSH_INTERVAL_SECONDS: float = 5.0
+
     # Dev: allow test user without Zitadel (Bearer dev:<email> or dev:<email>:<name>)
     # Only use when Zitadel is not configured. Never enable in production.
     DEV_TEST_USER_ENABLED: bool = False
@@ -45,6 +71,69 @@ class Settings(BaseSettings):
     # Observability (optional)
     OTEL_EXPORTER_OTLP_ENDPOINT: str = ""
     OTEL_SERVICE_NAME: str = "mitlist"
+    # Fraction of new traces sampled (children follow the parent's decision)
+    OTEL_TRACES_SAMPLER_RATIO: float = 1.0
+    # BatchSpanProcessor: buffered spans (overflow is dropped), spans per export, timings
+    OTEL_BSP_MAX_QUEUE_SIZE: int = 2048
+    OTEL_BSP_MAX_EXPORT_BATCH_SIZE: int = 512
+    OTEL_BSP_SCHEDULE_DELAY_MILLIS: int = 5000
+    OTEL_BSP_EXPORT_TIMEOUT_MILLIS: int = 30000
+    # Per-request SQL stats (query count, DB time, slowest statement) on the request span
+    SQL_INSTRUMENTATION_ENABLED: bool = True
+    # Expose request and DB time as a Server-Timing response header
+    SERVER_TIMING_ENABLED: bool = False
+    # Log a suspected N+1 when one statement shape runs this often in a request (0 = off)
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+
+    # Prometheus /metrics (multi-worker: set PROMETHEUS_MULTIPROC_DIR in the environment)
+    METRICS_ENABLED: bool = True
+    # How often each worker samples pool/cache stats into shared gauges (multi-worker only)
+    METRICS_REFRESH_INTERVAL_SECONDS: float = 15.0
+
+    # Log records buffered for the background log writer; overflow is dropped and counted
+    LOG_QUEUE_SIZE: int = 10000
+
+    # Response compression (gzip; brotli/zstd when installed) by Accept-Encoding
+    COMPRESSION_ENABLED: bool = True
+    # Bodies smaller than this many bytes are sent uncompressed
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+
+    # Background job scheduler (recurring expenses, proposal deadlines, care reminders).
+    # Runs in every app process; DB leases make each job run on one replica at a time.
+    SCHEDULER_ENABLED: bool = True
+    # How often each process looks for due jobs
+    SCHEDULER_POLL_INTERVAL_SECONDS: float = 15.0
+    # A job's lease; renewed while it runs, taken over by another process once expired
+    SCHEDULER_LEASE_SECONDS: float = 120.0
+    # Items per sweep run; a full batch reschedules the job immediately
+    SCHEDULER_BATCH_SIZE: int = 500
+
+    # Domain events: outbox dispatcher (one active dispatcher across replicas, DB lease)
+    EVENTS_DISPATCH_ENABLED: bool = True
+    # Upper bound on delivery delay; the dispatch lease is claimed once per interval across
+    # replicas, and commits that emitted events wake the local dispatcher at once
+    EVENTS_POLL_INTERVAL_SECONDS: float = 5.0
+    EVENTS_BATCH_SIZE: int = 200
+    # Failed deliveries are retried after EVENTS_RETRY_DELAY_SECONDS, doubling (max 1 hour)
+    EVENTS_MAX_ATTEMPTS: int = 10
+    EVENTS_RETRY_DELAY_SECONDS: float = 5.0
+    # Delivered events are deleted after this many days
+    EVENTS_RETENTION_DAYS: int = 7
+
+    # State shared across workers (maintenance mode): memory:// (single process) or
+    # redis://[[user]:password@]host[:port][/db] for any Redis-protocol server (needs the
+    # `redis` extra)
+    STATE_BACKEND_URL: str = "memory://"
+    # Local copies are refreshed on invalidation messages; this catches missed ones
+    STATE_REFRESH_INTERVAL_SECONDS: float = 30.0
+
+    # Idempotency-Key: stored responses are replayed to retries for this long
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+
+    # Batch API: sub-requests per batch, and how many GETs of a batch run at once
+    # (each holds a DB connection while it runs)
+    BATCH_MAX_REQUESTS: int = 20
+    BATCH_MAX_CONCURRENCY: int = 5
 
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> str:
@@ -54,6 +143,11 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def read_replica_urls(self) -> list[str]:
+        """Configured read-replica URLs."""
+        return [u.strip() for u in self.DATABASE_READ_REPLICA_URLS.split(",") if u.strip()]
+
     @property
     def zitadel_discovery_url(self) -> str:
         """OIDC discovery endpoint."""
@@ -1,8 +1,17 @@
-"""Structured logging configuration."""
+"""Structured logging configuration.
+
+Log calls only capture context and enqueue: the root logger has a single QueueHandler
+(with ContextFilter, so trace/user/group ids are read at the call site) feeding a
+bounded queue. A QueueListener thread does the JSON/text formatting and the blocking
+write to stdout. When the queue is full, records are dropped and counted instead of
+stalling the event loop; see dropped_log_records().
+"""
 
 import logging
+import queue
 import sys
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
 from pythonjsonlogger import jsonlogger
 
@@ -20,14 +29,41 @@ class ContextFilter(logging.Filter):
         return True
 
 
-def setup_logging() -> None:
-    """Configure structured logging based on environment."""
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks: records that do not fit are dropped and counted."""
 
-    # Remove existing handlers
-    root_logger.handlers.clear()
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now (they may be mutated after the call returns), but leave the
+        # formatting - including exc_info tracebacks - to the listener thread.
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
 
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogQueueListener(QueueListener):
+    """QueueListener whose stop() waits for room in a full queue instead of raising."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+_queue_handler: Optional[DroppingQueueHandler] = None
+_listener: Optional[LogQueueListener] = None
+
+
+def _output_handler() -> logging.Handler:
+    """The handler the listener thread writes through."""
     handler: logging.StreamHandler[Any]
     if settings.is_production:
         # JSON logging for production
@@ -44,6 +80,43 @@ def setup_logging() -> None:
             "[user_id=%(user_id)s] [group_id=%(group_id)s] - %(message)s"
         )
         handler.setFormatter(formatter)
+    return handler
+
+
+def setup_logging() -> None:
+    """Configure structured logging based on environment."""
+    global _queue_handler, _listener
+
+    shutdown_logging()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+
+    # Remove existing handlers
+    root_logger.handlers.clear()
+
+    _queue_handler = DroppingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+    _queue_handler.addFilter(ContextFilter())
+    root_logger.addHandler(_queue_handler)
+
+    _listener = LogQueueListener(
+        _queue_handler.queue, _output_handler(), respect_handler_level=True
+    )
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Stop the listener thread after it has written everything already queued."""
+    global _listener
+
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+    dropped = dropped_log_records()
+    if dropped:
+        sys.stderr.write(f"logging: {dropped} records dropped (queue full)\n")
+
 
-    handler.addFilter(ContextFilter())
-    root_logger.addHandler(handler)
+def dropped_log_records() -> int:
+    """Records dropped because the log queue was full, since setup_logging()."""
+    return _queue_handler.dropped if _queue_handler is not None else 0
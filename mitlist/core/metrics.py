@@ -0,0 +1,263 @@
+"""Prometheus metrics: request latency, in-flight requests, DB pool, caches, jobs, events.
+
+Hot path: MetricsMiddleware does one gauge inc/dec and one histogram observe per
+request, on label children cached in a dict (no `labels()` lookup, only the metric
+values' own uncontended locks).
+
+Pool, cache, compression and logging figures are sampled into gauges by `refresh()`,
+on every scrape and, with several workers, periodically by `metrics_sampler`.
+
+Multiple uvicorn workers: set the PROMETHEUS_MULTIPROC_DIR environment variable to
+an empty, writable directory before start-up. Each worker then writes its values to
+mmap'd files there and /metrics aggregates all workers (gauges are summed over live
+processes).
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Iterable, Iterator, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily, Metric
+
+from mitlist.core.cache import named_caches
+
+logger = logging.getLogger(__name__)
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+REQUEST_LATENCY = Histogram(
+    "mitlist_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "mitlist_http_requests_in_flight",
+    "HTTP requests currently being served",
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "mitlist_db_pool_wait_seconds",
+    "Time to acquire a pooled DB connection (including opening a new one)",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "mitlist_db_pool_checked_out",
+    "DB connections currently checked out",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "mitlist_db_pool_overflow",
+    "DB connections open beyond pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_SIZE = Gauge(
+    "mitlist_db_pool_size",
+    "Configured DB pool size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+CACHE_HITS = Gauge(
+    "mitlist_cache_hits", "Cache hits since start", ["cache"], multiprocess_mode="livesum"
+)
+CACHE_MISSES = Gauge(
+    "mitlist_cache_misses", "Cache misses since start", ["cache"], multiprocess_mode="livesum"
+)
+CACHE_ENTRIES = Gauge(
+    "mitlist_cache_entries", "Entries currently cached", ["cache"], multiprocess_mode="livesum"
+)
+COMPRESSION_BYTES_IN = Gauge(
+    "mitlist_compression_bytes_in",
+    "Response bytes before compression",
+    ["encoding"],
+    multiprocess_mode="livesum",
+)
+COMPRESSION_BYTES_OUT = Gauge(
+    "mitlist_compression_bytes_out",
+    "Response bytes after compression",
+    ["encoding"],
+    multiprocess_mode="livesum",
+)
+LOG_RECORDS_DROPPED = Gauge(
+    "mitlist_log_records_dropped",
+    "Log records dropped because the log queue was full",
+    multiprocess_mode="livesum",
+)
+
+JOB_RUNS = Counter(
+    "mitlist_job_runs",
+    "Scheduled job runs by outcome (success / failure)",
+    ["job", "outcome"],
+)
+JOB_DURATION = Histogram(
+    "mitlist_job_duration_seconds",
+    "Scheduled job run time",
+    ["job"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+JOB_ITEMS = Counter(
+    "mitlist_job_items",
+    "Items processed by scheduled jobs",
+    ["job"],
+)
+JOB_LAST_SUCCESS = Gauge(
+    "mitlist_job_last_success_timestamp_seconds",
+    "Unix time of each job's last successful run in this process",
+    ["job"],
+    multiprocess_mode="max",
+)
+
+EVENTS_DELIVERED = Counter(
+    "mitlist_events_delivered",
+    "Outbox events handled by the dispatcher, by outcome (delivered / retry / failed)",
+    ["event_type", "outcome"],
+)
+EVENT_DELIVERY_LAG = Histogram(
+    "mitlist_event_delivery_lag_seconds",
+    "Time from an event's commit to its delivery to all subscribers",
+    ["event_type"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 3600.0),
+)
+OUTBOX_PENDING = Gauge(
+    "mitlist_outbox_pending",
+    "Outbox events waiting for delivery (sampled by the dispatcher)",
+    multiprocess_mode="max",
+)
+OUTBOX_OLDEST_PENDING_AGE = Gauge(
+    "mitlist_outbox_oldest_pending_age_seconds",
+    "Age of the oldest undelivered outbox event (sampled by the dispatcher)",
+    multiprocess_mode="max",
+)
+
+_latency_children: dict[tuple[str, str, str], Any] = {}
+
+
+def observe_request(method: str, route: str, status: int, seconds: float) -> None:
+    """Record one request in the latency histogram."""
+    key = (method, route, f"{status // 100}xx")
+    child = _latency_children.get(key)
+    if child is None:
+        child = _latency_children[key] = REQUEST_LATENCY.labels(*key)
+    child.observe(seconds)
+
+
+def refresh() -> None:
+    """Sample pool, cache, compression and logging stats into their gauges."""
+    from mitlist.api.compression import compression_stats
+    from mitlist.core.logging import dropped_log_records
+    from mitlist.db.engine import engine, replica_router
+
+    pools = [("primary", engine)]
+    pools += [(f"replica{i}", e) for i, e in enumerate(replica_router.engines)]
+    for name, eng in pools:
+        pool = eng.sync_engine.pool
+        if not hasattr(pool, "checkedout"):
+            continue  # NullPool / StaticPool
+        DB_POOL_CHECKED_OUT.labels(name).set(pool.checkedout())
+        DB_POOL_OVERFLOW.labels(name).set(max(pool.overflow(), 0))
+        DB_POOL_SIZE.labels(name).set(pool.size())
+
+    for name, cache in named_caches().items():
+        CACHE_HITS.labels(name).set(cache.hits)
+        CACHE_MISSES.labels(name).set(cache.misses)
+        CACHE_ENTRIES.labels(name).set(len(cache))
+
+    for encoding, raw in compression_stats.bytes_in.items():
+        COMPRESSION_BYTES_IN.labels(encoding).set(raw)
+        COMPRESSION_BYTES_OUT.labels(encoding).set(compression_stats.bytes_out[encoding])
+
+    LOG_RECORDS_DROPPED.set(dropped_log_records())
+
+
+def _hit_ratios(families: list[Metric]) -> Iterator[Metric]:
+    """Derive per-cache hit ratios from the (possibly worker-aggregated) hit/miss gauges."""
+    totals: dict[str, dict[str, float]] = {}
+    for family in families:
+        if family.name in ("mitlist_cache_hits", "mitlist_cache_misses"):
+            for sample in family.samples:
+                cache = sample.labels["cache"]
+                totals.setdefault(cache, {}).setdefault(family.name, 0.0)
+                totals[cache][family.name] += sample.value
+    ratio = GaugeMetricFamily(
+        "mitlist_cache_hit_ratio", "Cache hits / lookups since start", labels=["cache"]
+    )
+    for cache, counts in totals.items():
+        hits = counts.get("mitlist_cache_hits", 0.0)
+        lookups = hits + counts.get("mitlist_cache_misses", 0.0)
+        ratio.add_metric([cache], hits / lookups if lookups else 0.0)
+    yield ratio
+
+
+class _Exposition:
+    """Collector view over a fixed set of families, for generate_latest()."""
+
+    def __init__(self, families: Iterable[Metric]):
+        self.families = list(families)
+
+    def collect(self) -> Iterable[Metric]:
+        return self.families
+
+
+def render() -> tuple[bytes, str]:
+    """Current metrics in the Prometheus text format, and its content type."""
+    refresh()
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    families = list(registry.collect())
+    families.extend(_hit_ratios(families))
+    return generate_latest(_Exposition(families)), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the multiprocess directory (on shutdown)."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+class MetricsSampler:
+    """Periodic `refresh()`, so other workers' pool/cache gauges stay current."""
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                refresh()
+            except Exception:
+                logger.exception("Metrics refresh failed")
+
+    def start(self, interval: float) -> None:
+        # Single process: the scrape itself refreshes, no need for a task.
+        if MULTIPROCESS and interval > 0 and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run(interval))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+metrics_sampler = MetricsSampler()
+
@@ -4,42 +4,116 @@ import logging
 from typing import Optional
 
 from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
 from opentelemetry.instrumentation.logging import LoggingInstrumentor
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from starlette.applications import Starlette
 
 from mitlist.core.config import settings
+from mitlist.db.instrumentation import disable_statement_spans, enable_statement_spans
 
 logger = logging.getLogger(__name__)
 
+_tracer_provider: Optional[TracerProvider] = None
 
-def setup_otel() -> Optional[FastAPIInstrumentor]:
+
+def build_tracer_provider(exporter: SpanExporter) -> TracerProvider:
+    """
+    TracerProvider exporting through a BatchSpanProcessor sized from settings, with
+    parent-based ratio sampling: root spans are kept with probability
+    OTEL_TRACES_SAMPLER_RATIO, child spans follow their parent's decision.
     """
-    Initialize OpenTelemetry instrumentation.
+    provider = TracerProvider(
+        resource=Resource.create({SERVICE_NAME: settings.OTEL_SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(settings.OTEL_TRACES_SAMPLER_RATIO)),
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            exporter,
+            max_queue_size=settings.OTEL_BSP_MAX_QUEUE_SIZE,
+            max_export_batch_size=settings.OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
+            schedule_delay_millis=settings.OTEL_BSP_SCHEDULE_DELAY_MILLIS,
+            export_timeout_millis=settings.OTEL_BSP_EXPORT_TIMEOUT_MILLIS,
+        )
+    )
+    return provider
 
-    Returns FastAPIInstrumentor instance if configured, None otherwise.
-    Keeps exporter configurable - can be extended to use OTLP exporter.
+
+def instrument_libraries(provider: TracerProvider) -> None:
     """
-    if not settings.OTEL_EXPORTER_OTLP_ENDPOINT and settings.is_development:
-        # Development: use console exporter
-        provider = TracerProvider()
-        processor = BatchSpanProcessor(ConsoleSpanExporter())
-        provider.add_span_processor(processor)
-        trace.set_tracer_provider(provider)
-        logger.info("OpenTelemetry configured with console exporter")
-    elif settings.OTEL_EXPORTER_OTLP_ENDPOINT:
-        # Production: OTLP exporter would be configured here
-        # For now, just set up the provider
-        provider = TracerProvider()
-        trace.set_tracer_provider(provider)
+    Spans for every SQL statement (emitted by the engine listeners in
+    db.instrumentation) and for outbound httpx calls such as Zitadel JWKS/introspection.
+    """
+    enable_statement_spans(provider)
+    HTTPXClientInstrumentor().instrument(tracer_provider=provider)
+
+
+def uninstrument_libraries() -> None:
+    """Undo instrument_libraries()."""
+    disable_statement_spans()
+    HTTPXClientInstrumentor().uninstrument()
+
+
+def otel_enabled() -> bool:
+    """Whether setup_otel() exports spans: OTLP endpoint configured, or development."""
+    return bool(settings.OTEL_EXPORTER_OTLP_ENDPOINT) or settings.is_development
+
+
+def instrument_app(app: Starlette, provider: Optional[trace.TracerProvider] = None) -> None:
+    """
+    Wrap `app` in the FastAPI server-span middleware.
+
+    Must run before the app's first ASGI call (the lifespan startup), which builds the
+    middleware stack: the server span then encloses every middleware, so
+    RequestContextMiddleware attaches its SQL stats while the span is still current.
+    Without `provider`, spans go to the global provider setup_otel() installs.
+    """
+    FastAPIInstrumentor.instrument_app(app, tracer_provider=provider)
+
+
+def setup_otel() -> None:
+    """
+    Initialize OpenTelemetry: global tracer provider, library and logging instrumentation.
+
+    Exports to OTEL_EXPORTER_OTLP_ENDPOINT (OTLP/HTTP) when set, else to the console
+    in development. Server spans come from instrument_app(), applied when the app is
+    created.
+    """
+    global _tracer_provider
+
+    if not otel_enabled():
+        logger.info("OpenTelemetry not configured")
+        return
+
+    if settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+        exporter: SpanExporter = OTLPSpanExporter(
+            endpoint=f"{settings.OTEL_EXPORTER_OTLP_ENDPOINT.rstrip('/')}/v1/traces"
+        )
         logger.info(f"OpenTelemetry configured with OTLP endpoint: {settings.OTEL_EXPORTER_OTLP_ENDPOINT}")
     else:
-        logger.info("OpenTelemetry not configured")
-        return None
+        # Development: use console exporter
+        exporter = ConsoleSpanExporter()
+        logger.info("OpenTelemetry configured with console exporter")
+
+    _tracer_provider = build_tracer_provider(exporter)
+    trace.set_tracer_provider(_tracer_provider)
+    instrument_libraries(_tracer_provider)
 
     # Instrument logging
     LoggingInstrumentor().instrument()
 
-    # Return FastAPI instrumentor (will be applied in main.py)
-    return FastAPIInstrumentor()
+
+def shutdown_otel() -> None:
+    """Flush queued spans to the exporter and stop the batch processor."""
+    global _tracer_provider
+
+    if _tracer_provider is None:
+        return
+    uninstrument_libraries()
+    _tracer_provider.shutdown()
+    _tracer_provider = None
@@ -0,0 +1,64 @@
+"""Opaque keyset (cursor) pagination helpers.
+
+A cursor encodes the ordering key `(timestamp, id)` of the last row on a page. The next
+page is fetched with a row-value comparison on the same key, so the database seeks
+straight to it through the ordering index instead of scanning and discarding `offset`
+rows.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from mitlist.core.errors import ValidationError
+
+# Response header carrying the cursor for endpoints that return a bare JSON list.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    """Encode an ordering key as an opaque, URL-safe cursor."""
+    raw = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor; raises ValidationError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise ValidationError(code="INVALID_CURSOR", detail="Invalid pagination cursor") from e
+
+
+def apply_keyset(
+    q: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    cursor: Optional[str],
+    descending: bool = True,
+) -> Select:
+    """Order `q` by `(sort_column, id_column)` and, given a cursor, seek past it."""
+    if descending:
+        q = q.order_by(sort_column.desc(), id_column.desc())
+    else:
+        q = q.order_by(sort_column.asc(), id_column.asc())
+    if cursor is None:
+        return q
+    key = tuple_(sort_column, id_column)
+    after = decode_cursor(cursor)
+    return q.where(key < after if descending else key > after)
+
+
+def next_cursor(rows: Sequence[Any], limit: int, sort_attr: str) -> Optional[str]:
+    """Cursor for the page after `rows`, or None when this page is the last one."""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(getattr(last, sort_attr), last.id)
@@ -0,0 +1,123 @@
+"""Opt-in fast JSON path: orjson responses and direct ORM-to-bytes serialization.
+
+FastAPI's default path validates a handler's return value against `response_model`
+even when the handler already built validated schemas from ORM rows. For large list
+payloads a route can instead return `FastJSONResponse(serializer.dump(rows))`: the
+rows are read attribute-by-attribute following the response schema's fields and
+encoded by orjson, with no pydantic validation at all. Keep `response_model` on the
+route so the OpenAPI schema is unchanged.
+
+Only use ORMSerializer for trusted rows and plain `from_attributes` schemas; schemas
+with validators, custom serializers or computed fields are rejected.
+"""
+
+import types
+from decimal import Decimal
+from typing import Any, Generic, Iterable, Optional, TypeVar, Union, get_args, get_origin
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+_MISSING = object()
+
+
+def _default(obj: Any) -> Any:
+    # Match pydantic's JSON mode: Decimal as string, sets as lists.
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode `content` as JSON bytes with orjson."""
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson; pre-encoded bytes are sent as-is."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+def _nested_model(annotation: Any) -> tuple[Optional[type[BaseModel]], bool]:
+    """(schema, is_list) when a field holds a nested schema or a list of them."""
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return _nested_model(args[0])
+        return None, False
+    if origin in (list, tuple, set, frozenset):
+        (item,) = get_args(annotation)[:1] or (Any,)
+        schema, _ = _nested_model(item)
+        return schema, schema is not None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+class ORMSerializer(Generic[M]):
+    """Serialize ORM rows to JSON bytes following a response schema's fields."""
+
+    def __init__(self, schema: type[M]):
+        decorators = schema.__pydantic_decorators__
+        if (
+            decorators.validators
+            or decorators.root_validators
+            or decorators.field_validators
+            or decorators.model_validators
+            or decorators.field_serializers
+            or decorators.model_serializers
+            or decorators.computed_fields
+        ):
+            raise TypeError(f"{schema.__name__} customizes (de)serialization; use model_validate")
+        self.schema = schema
+        self._fields: list[tuple[str, str, Optional[ORMSerializer], bool, Any]] = []
+        for name, field in schema.model_fields.items():
+            nested, many = _nested_model(field.annotation)
+            default = (
+                _MISSING if field.is_required() else field.get_default(call_default_factory=True)
+            )
+            self._fields.append(
+                (
+                    name,
+                    field.serialization_alias or field.alias or name,
+                    ORMSerializer(nested) if nested is not None else None,
+                    many,
+                    default,
+                )
+            )
+
+    def to_python(self, row: Any) -> dict[str, Any]:
+        """JSON-ready dict for one row (nested schemas included)."""
+        out: dict[str, Any] = {}
+        # Loaded ORM attributes live in the instance __dict__; reading it directly skips
+        # the instrumented descriptor. Anything else goes through getattr.
+        loaded = getattr(row, "__dict__", {})
+        for attr, key, nested, many, default in self._fields:
+            value = loaded[attr] if attr in loaded else getattr(row, attr, default)
+            if value is _MISSING:
+                raise AttributeError(f"{type(row).__name__} has no attribute {attr!r}")
+            if nested is not None and value is not None:
+                value = [nested.to_python(v) for v in value] if many else nested.to_python(value)
+            out[key] = value
+        return out
+
+    def dump(self, rows: Iterable[Any]) -> bytes:
+        """JSON array of `rows` as bytes."""
+        return dumps([self.to_python(row) for row in rows])
+
+    def dump_one(self, row: Any) -> bytes:
+        """JSON object for a single row as bytes."""
+        return dumps(self.to_python(row))
@@ -0,0 +1,291 @@
+"""
+State shared by all worker processes: string keys with optional TTL, plus pub/sub.
+
+STATE_BACKEND_URL picks the backend:
+  - memory://  in-process only; the default, enough for a single worker and tests
+  - redis://[[user]:password@]host[:port][/db] (rediss:// for TLS): anything speaking
+    the Redis protocol (Redis, Valkey, a local stand-in), through `redis.asyncio` from
+    the optional `redis` extra.
+
+Hot-path reads go through SharedValue, a process-local copy of one JSON key. Writers
+publish an invalidation for the key and every process refreshes its copy, so reading
+it costs no round trip. Copies are also refreshed after a lost subscription is
+re-established and every STATE_REFRESH_INTERVAL_SECONDS, in case a message was missed.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from mitlist.core.config import settings
+
+try:
+    import redis.asyncio as aioredis
+    from redis.asyncio.retry import Retry
+    from redis.backoff import NoBackoff
+    from redis.exceptions import ConnectionError as RedisConnectionError
+    from redis.exceptions import RedisError
+except ImportError:  # optional
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "invalidate"
+
+
+class StateBackendError(Exception):
+    """The state backend could not be reached or rejected a command."""
+
+
+class SharedValue:
+    """Process-local copy of a JSON value kept in the state backend."""
+
+    def __init__(self, backend: "StateBackend", key: str, default: Any) -> None:
+        self.key = key
+        self.default = default
+        self.value = default
+        self._backend = backend
+
+    async def refresh(self) -> None:
+        raw = await self._backend.get(self.key)
+        self.value = self.default if raw is None else json.loads(raw)
+
+    async def set(self, value: Any) -> None:
+        """Store a new value and have every process refresh its copy."""
+        await self._backend.set(self.key, json.dumps(value))
+        self.value = value
+        await self._backend.publish(INVALIDATION_CHANNEL, self.key)
+
+
+class StateBackend(ABC):
+    """Key/value store with TTLs and pub/sub; see the module docstring."""
+
+    def __init__(self) -> None:
+        self._callbacks: dict[str, list[Callable[[str], None]]] = {}
+        self._shared: dict[str, SharedValue] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.subscribe(INVALIDATION_CHANNEL, self._invalidated)
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Return the value, or None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Store a value; it expires after `ttl` seconds when given."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Remove a key. Returns whether it existed."""
+
+    @abstractmethod
+    async def publish(self, channel: str, message: str) -> None:
+        """Send a message to the channel's subscribers in every process."""
+
+    def subscribe(self, channel: str, callback: Callable[[str], None]) -> None:
+        """Call `callback(message)` for each message on `channel`. Register before start()."""
+        self._callbacks.setdefault(channel, []).append(callback)
+
+    def shared(self, key: str, default: Any) -> SharedValue:
+        """The process-wide SharedValue for `key` (created on first use)."""
+        if key not in self._shared:
+            self._shared[key] = SharedValue(self, key, default)
+        return self._shared[key]
+
+    def _deliver(self, channel: str, message: str) -> None:
+        for callback in self._callbacks.get(channel, ()):
+            try:
+                callback(message)
+            except Exception:
+                logger.warning("State subscriber for %s failed", channel, exc_info=True)
+
+    def _invalidated(self, key: str) -> None:
+        shared = self._shared.get(key)
+        if shared is not None:
+            self._spawn(self._refresh(shared))
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, shared: SharedValue) -> None:
+        try:
+            await shared.refresh()
+        except Exception:
+            logger.warning("Refreshing shared value %s failed", shared.key, exc_info=True)
+
+    async def refresh_all(self) -> None:
+        for shared in list(self._shared.values()):
+            await self._refresh(shared)
+
+    async def _refresh_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.refresh_all()
+
+    @abstractmethod
+    async def _listen(self) -> None:
+        """Receive messages published by other processes and _deliver() them."""
+
+    async def start(self, refresh_interval: float) -> None:
+        """Load shared values, then follow invalidations and refresh periodically."""
+        await self.refresh_all()
+        self._spawn(self._listen())
+        self._spawn(self._refresh_loop(refresh_interval))
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        await self.close()
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release connections."""
+
+
+class MemoryStateBackend(StateBackend):
+    """In-process backend: state is not shared between worker processes."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        super().__init__()
+        self._clock = clock
+        self._data: dict[str, tuple[Optional[float], str]] = {}
+        self._sweep_at = 1024
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        self._data[key] = (None if ttl is None else self._clock() + ttl, value)
+        if len(self._data) >= self._sweep_at:
+            now = self._clock()
+            for k, (expires_at, _) in list(self._data.items()):
+                if expires_at is not None and expires_at <= now:
+                    del self._data[k]
+            self._sweep_at = max(1024, 2 * len(self._data))
+
+    async def delete(self, key: str) -> bool:
+        return self._data.pop(key, None) is not None
+
+    async def publish(self, channel: str, message: str) -> None:
+        self._deliver(channel, message)
+
+    async def _listen(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisStateBackend(StateBackend):
+    """
+    Redis backend on `redis.asyncio` (the optional `redis` extra). Commands go through
+    the client's connection pool; pub/sub uses its own connection, re-established with
+    backoff. Keys and channels are prefixed with `prefix`.
+    """
+
+    def __init__(self, url: str, prefix: str = "mitlist:", timeout: float = 5.0) -> None:
+        if aioredis is None:
+            raise StateBackendError(
+                "STATE_BACKEND_URL is a redis:// URL but the `redis` package is not "
+                "installed (pip install 'mitlist[redis]')"
+            )
+        super().__init__()
+        self.prefix = prefix
+        # RESP2: no HELLO handshake, so servers without RESP3 work too
+        options = {"decode_responses": True, "protocol": 2}
+        self._client = aioredis.from_url(
+            url,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+            # A pooled connection closed by the server is replaced once, transparently
+            retry=Retry(NoBackoff(), 1),
+            retry_on_error=[RedisConnectionError],
+            **options,
+        )
+        # No timeouts for the subscriber: it sits idle between messages, and redis-py
+        # enforces them with asyncio.wait_for, which can swallow the cancellation that
+        # stops the listener on Python 3.11
+        self._subscriber = aioredis.from_url(
+            url, socket_timeout=None, socket_connect_timeout=None, **options
+        )
+
+    @contextmanager
+    def _errors(self, command: str) -> Iterator[None]:
+        try:
+            yield
+        except RedisError as exc:
+            raise StateBackendError(f"State backend {command} failed: {exc}") from exc
+
+    async def get(self, key: str) -> Optional[str]:
+        with self._errors("GET"):
+            return await self._client.get(self.prefix + key)
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        px = None if ttl is None else max(1, int(ttl * 1000))
+        with self._errors("SET"):
+            await self._client.set(self.prefix + key, value, px=px)
+
+    async def delete(self, key: str) -> bool:
+        with self._errors("DEL"):
+            return await self._client.delete(self.prefix + key) > 0
+
+    async def publish(self, channel: str, message: str) -> None:
+        with self._errors("PUBLISH"):
+            await self._client.publish(self.prefix + channel, message)
+
+    async def _listen(self) -> None:
+        delay = 0.5
+        while True:
+            pubsub = self._subscriber.pubsub()
+            try:
+                await pubsub.subscribe(*(self.prefix + c for c in self._callbacks))
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._deliver(message["channel"].removeprefix(self.prefix), message["data"])
+                    elif message["type"] == "subscribe" and message["data"] == len(self._callbacks):
+                        # Subscribed: catch up on anything published while we were not
+                        delay = 0.5
+                        self._spawn(self.refresh_all())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "State backend subscription lost; retrying in %.1fs", delay, exc_info=True
+                )
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+        await self._subscriber.aclose()
+
+
+def create_state_backend(url: str) -> StateBackend:
+    scheme = urlsplit(url).scheme
+    if scheme in ("", "memory"):
+        return MemoryStateBackend()
+    if scheme in ("redis", "rediss"):
+        return RedisStateBackend(url)
+    raise ValueError(f"Unsupported STATE_BACKEND_URL scheme: {scheme!r}")
+
+
+state_backend = create_state_backend(settings.STATE_BACKEND_URL)
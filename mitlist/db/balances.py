@@ -0,0 +1,52 @@
+"""Member balance ledger check: python -m mitlist.db.balances [--rebuild] [--group-id N]
+
+Compares member_balances with what expense, split and settlement history adds up to and
+prints every difference (exit status 1 if any). --rebuild recomputes the ledger from
+history instead, e.g. after rows were written behind the finance service.
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from mitlist.modules.finance.interface import rebuild_member_balances, verify_member_balances
+
+
+async def _main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m mitlist.db.balances", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("--database-url", help="Defaults to the configured database")
+    parser.add_argument("--group-id", type=int, default=None, help="Only this group")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute the ledger")
+    args = parser.parse_args(argv)
+
+    if args.database_url:
+        engine = create_async_engine(args.database_url)
+    else:
+        from mitlist.db.engine import engine
+    try:
+        async with engine.begin() as conn:
+            async with AsyncSession(bind=conn) as db:
+                if args.rebuild:
+                    rows = await rebuild_member_balances(db, args.group_id)
+                    print(f"member_balances rebuilt: {rows} rows")
+                    return 0
+                mismatches = await verify_member_balances(db, args.group_id)
+    finally:
+        await engine.dispose()
+
+    for m in mismatches:
+        print(
+            f"group {m['group_id']} user {m['user_id']}: "
+            f"ledger {m['ledger']} != history {m['expected']}"
+        )
+    print(f"{len(mismatches)} mismatched balances")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main()))
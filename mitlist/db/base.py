@@ -1,5 +1,7 @@
 """SQLAlchemy declarative base and shared mixins."""
 
+import importlib
+import pkgutil
 from datetime import datetime
 from typing import Any
 
@@ -13,6 +15,17 @@ class Base(DeclarativeBase):
     pass
 
 
+def import_all_models() -> None:
+    """Register every module's tables on Base.metadata (create_all needs the full graph)."""
+    import mitlist.modules
+
+    for module in pkgutil.iter_modules(mitlist.modules.__path__):
+        importlib.import_module(f"mitlist.modules.{module.name}.models")
+    importlib.import_module("mitlist.events.models")
+    importlib.import_module("mitlist.jobs.models")
+    importlib.import_module("mitlist.idempotency.models")
+
+
 class TimestampMixin:
     """Mixin adding created_at and updated_at timestamp columns."""
 
@@ -1,17 +1,46 @@
 """Async SQLAlchemy engine and session factory."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+import itertools
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from mitlist.core.config import settings
+from mitlist.core.metrics import DB_POOL_WAIT
+
+logger = logging.getLogger(__name__)
+
+
+class _TimedQueuePool(AsyncAdaptedQueuePool):
+    """Default async pool, observing how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        poolclass=_TimedQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        echo=settings.is_development,
+    )
+
 
 # Create async engine with connection pooling
-engine = create_async_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
-    pool_size=20,
-    max_overflow=10,
-    pool_pre_ping=True,
-    echo=settings.is_development,
-)
+engine = _create_engine(settings.SQLALCHEMY_DATABASE_URI)
 
 # Create async session factory
 # expire_on_commit=False prevents attribute expiration after commit
@@ -41,3 +70,123 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+# ---------- Read-only sessions ----------
+def _read_only_bind(bind: AsyncEngine) -> AsyncEngine:
+    """
+    Engine whose transactions are READ ONLY on Postgres.
+
+    asyncpg folds this into the BEGIN statement (`BEGIN READ ONLY`), so it costs no
+    extra round-trip. Other dialects get the bind unchanged.
+    """
+    if bind.dialect.name == "postgresql":
+        return bind.execution_options(postgresql_readonly=True)
+    return bind
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_flush(session: Session, flush_context, instances) -> None:
+    if session.info.get("read_only"):
+        raise RuntimeError("Attempted to flush changes in a read-only session")
+
+
+# Like AsyncSessionLocal, a session only checks out a connection on its first query.
+ReadOnlySessionLocal = async_sessionmaker(
+    bind=_read_only_bind(engine),
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+    info={"read_only": True},
+)
+
+
+async def get_read_only_db() -> AsyncSession:
+    """
+    Dependency that yields a read-only async database session.
+
+    Unlike get_db there is no commit round-trip: the transaction (if a query ever
+    started one) is rolled back when the session closes. Flushing pending changes
+    raises, so handlers that write must keep using get_db.
+    """
+    async with ReadOnlySessionLocal() as session:
+        yield session
+
+
+# ---------- Read replicas ----------
+# Seconds a replica is behind the primary (Postgres hot standby).
+_REPLICA_LAG_SQL = text(
+    "SELECT CASE WHEN pg_is_in_recovery() "
+    "THEN COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "ELSE 0 END"
+)
+
+
+class ReplicaRouter:
+    """
+    Round-robin over read-replica engines, skipping replicas whose replication lag
+    exceeds DATABASE_REPLICA_MAX_LAG_SECONDS (or whose lag probe failed).
+    """
+
+    def __init__(self, engines: list[AsyncEngine], max_lag_seconds: float):
+        self.engines = engines
+        self.max_lag_seconds = max_lag_seconds
+        # Optimistic until the first probe; the monitor probes immediately on start.
+        self.lag: list[float] = [0.0] * len(engines)
+        self._cycle = itertools.cycle(range(len(engines))) if engines else None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def pick(self) -> Optional[AsyncEngine]:
+        """Next healthy replica engine, or None to fall back to the primary."""
+        if self._cycle is None:
+            return None
+        for _ in range(len(self.engines)):
+            idx = next(self._cycle)
+            if self.lag[idx] <= self.max_lag_seconds:
+                return self.engines[idx]
+        return None
+
+    async def probe(self) -> None:
+        """Measure replication lag of every replica."""
+        for idx, replica in enumerate(self.engines):
+            try:
+                async with replica.connect() as conn:
+                    lag = (await conn.execute(_REPLICA_LAG_SQL)).scalar_one()
+                self.lag[idx] = float(lag or 0.0)
+            except Exception:
+                logger.warning("Read replica %s lag probe failed", idx, exc_info=True)
+                self.lag[idx] = float("inf")
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            await self.probe()
+            await asyncio.sleep(interval)
+
+    def start(self, interval: float) -> None:
+        """Start the background lag monitor (called from the application lifespan)."""
+        if self.engines and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run(interval))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for replica in self.engines:
+            await replica.dispose()
+
+
+replica_router = ReplicaRouter(
+    [_read_only_bind(_create_engine(url)) for url in settings.read_replica_urls],
+    max_lag_seconds=settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+)
+
+ReadSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+    info={"read_only": True},
+)
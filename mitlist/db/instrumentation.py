@@ -0,0 +1,179 @@
+"""Per-request SQL instrumentation: query count, DB time, slowest statement, N+1 hints,
+and (once enable_statement_spans() is called) one OTel client span per statement.
+
+Cursor events are registered once on the Engine class, so every engine (primary,
+replicas, test engines) reports into whatever `track_queries()` scopes are active in
+the current context. Outside a scope, with spans disabled, the listeners return after
+one ContextVar read.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from opentelemetry import trace
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# Positional placeholders ($1 for asyncpg, ? for sqlite) and expanded IN lists.
+_PLACEHOLDER_RE = re.compile(r"\$\d+|%\(\w+\)s|:\w+")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+_START_KEY = "mitlist_query_start"
+_SPAN_ATTR = "_mitlist_span"
+
+_tracer: Optional[trace.Tracer] = None
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeated executions with different binds compare equal."""
+    shape = _WHITESPACE_RE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER_RE.sub("?", shape)
+    return _IN_LIST_RE.sub("(?)", shape)
+
+
+@dataclass
+class QueryStats:
+    """SQL activity recorded inside one `track_queries()` scope."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: Optional[str] = None
+    shapes: Counter = field(default_factory=Counter)
+    parent: Optional["QueryStats"] = field(default=None, repr=False)
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        shape = statement_shape(statement)
+        stats: Optional[QueryStats] = self
+        while stats is not None:
+            stats.count += 1
+            stats.total_ms += duration_ms
+            stats.shapes[shape] += 1
+            if duration_ms >= stats.slowest_ms:
+                stats.slowest_ms = duration_ms
+                stats.slowest_statement = shape
+            stats = stats.parent
+
+    def repeated_shapes(self, threshold: int) -> dict[str, int]:
+        """Statement shapes executed at least `threshold` times (suspected N+1)."""
+        if threshold <= 0:
+            return {}
+        return {shape: n for shape, n in self.shapes.items() if n >= threshold}
+
+    def server_timing(self) -> str:
+        """`Server-Timing` header value for this scope."""
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+_query_stats_var: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Innermost active QueryStats, if any."""
+    return _query_stats_var.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Record SQL executed in the current context (and tasks spawned from it).
+
+    Scopes nest: queries count towards every enclosing scope, so a test can wrap a
+    request that the middleware also tracks.
+    """
+    stats = QueryStats(parent=_query_stats_var.get())
+    token = _query_stats_var.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats_var.reset(token)
+
+
+def report_query_stats(stats: QueryStats, route: str, n_plus_one_threshold: int) -> None:
+    """Attach `stats` to the current OTel span and log suspected N+1 patterns."""
+    repeated = stats.repeated_shapes(n_plus_one_threshold)
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.set_attribute("db.query_count", stats.count)
+        span.set_attribute("db.total_duration_ms", round(stats.total_ms, 3))
+        if stats.slowest_statement is not None:
+            span.set_attribute("db.slowest_duration_ms", round(stats.slowest_ms, 3))
+            span.set_attribute("db.slowest_statement", stats.slowest_statement)
+        span.set_attribute("db.n_plus_one_suspected", bool(repeated))
+    for shape, n in repeated.items():
+        logger.warning("Suspected N+1 in %s: %d executions of %s", route, n, shape)
+
+
+def enable_statement_spans(provider: trace.TracerProvider) -> None:
+    """Emit a client span per SQL statement, parented to the current span."""
+    global _tracer
+    _tracer = provider.get_tracer(__name__)
+
+
+def disable_statement_spans() -> None:
+    global _tracer
+    _tracer = None
+
+
+def _start_span(conn, statement: str, context) -> None:
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    span = _tracer.start_span(
+        f"{operation} {conn.dialect.name}",
+        kind=trace.SpanKind.CLIENT,
+        attributes={
+            "db.system": conn.dialect.name,
+            "db.operation": operation,
+            "db.statement": statement,
+        },
+    )
+    setattr(context, _SPAN_ATTR, span)
+
+
+def _end_span(context, error: Optional[BaseException] = None) -> None:
+    span = getattr(context, _SPAN_ATTR, None)
+    if span is None:
+        return
+    setattr(context, _SPAN_ATTR, None)
+    if error is not None:
+        span.record_exception(error)
+        span.set_status(trace.Status(trace.StatusCode.ERROR, type(error).__name__))
+    span.end()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _tracer is not None and context is not None:
+        _start_span(conn, statement, context)
+    if _query_stats_var.get() is not None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        _end_span(context)
+    stats = _query_stats_var.get()
+    if stats is None:
+        return
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    stats.record(statement, (time.perf_counter() - starts.pop()) * 1000)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context) -> None:
+    if exception_context.execution_context is not None:
+        _end_span(exception_context.execution_context, exception_context.original_exception)
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_START_KEY):
+        conn.info[_START_KEY].pop()
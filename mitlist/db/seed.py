@@ -0,0 +1,952 @@
+"""Synthetic dataset generator for load and performance testing.
+
+Generates reproducible, production-shaped data: N groups x M members with years of
+expenses/splits/settlements, recurring bills, chores and assignments, points/streaks/
+achievements, proposals and (ranked) votes, notifications, audit logs, plants/pets with
+their logs, recipes and meal plans, and calendar events. Rows are built as plain dicts
+and written with Core `insert()` executemany batches; primary keys are allocated up
+front (after the current max id), so foreign keys are known without round-trips and a
+seed can be added to an existing database. Works on SQLite and Postgres (sequences are
+advanced afterwards).
+
+Usage:
+    python -m mitlist.db.seed --groups 200 --members 3-6 --years 3 --seed 42
+    python -m mitlist.db.seed --database-url sqlite+aiosqlite:///perf.db --create-schema
+
+The same --seed and --end-date always produce the same rows.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass, field, fields
+from datetime import UTC, date, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Optional
+
+from sqlalchemy import Table, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, create_async_engine
+
+from mitlist.db.base import Base, import_all_models
+from mitlist.modules.audit.models import AuditLog
+from mitlist.modules.auth.models import Group, User, UserGroup
+from mitlist.modules.calendar.models import CalendarEvent
+from mitlist.modules.chores.models import Chore, ChoreAssignment
+from mitlist.modules.finance.interface import rebuild_member_balances
+from mitlist.modules.finance.models import (
+    Category,
+    Expense,
+    ExpenseSplit,
+    RecurringExpense,
+    Settlement,
+)
+from mitlist.modules.gamification.models import Achievement, Streak, UserAchievement, UserPoints
+from mitlist.modules.governance.models import BallotOption, Proposal, VoteRecord
+from mitlist.modules.notifications.models import Notification
+from mitlist.modules.pets.models import Pet, PetLog, PetMedicalRecord
+from mitlist.modules.plants.models import Plant, PlantLog, PlantSpecies
+from mitlist.modules.recipes.models import MealPlan, Recipe, RecipeIngredient, RecipeStep
+
+# Insert order: parents before children, so a flush never violates a foreign key.
+TABLES: list[Table] = [
+    m.__table__
+    for m in (
+        User,
+        Group,
+        UserGroup,
+        Category,
+        Expense,
+        ExpenseSplit,
+        RecurringExpense,
+        Settlement,
+        Chore,
+        ChoreAssignment,
+        UserPoints,
+        Streak,
+        Achievement,
+        UserAchievement,
+        Proposal,
+        BallotOption,
+        VoteRecord,
+        Notification,
+        AuditLog,
+        PlantSpecies,
+        Plant,
+        PlantLog,
+        Pet,
+        PetLog,
+        PetMedicalRecord,
+        Recipe,
+        RecipeIngredient,
+        RecipeStep,
+        MealPlan,
+        CalendarEvent,
+    )
+]
+
+_CATEGORIES = ["Groceries", "Rent", "Utilities", "Internet", "Household", "Dining", "Transport"]
+_VENDORS = ["Corner Market", "MegaMart", "City Power", "FiberNet", "HomeGoods", "Pizza Place"]
+_CHORES = [
+    ("Dishes", "DAILY", 1, 2),
+    ("Vacuum", "WEEKLY", 1, 5),
+    ("Bathroom", "WEEKLY", 1, 8),
+    ("Trash", "WEEKLY", 1, 2),
+    ("Laundry", "WEEKLY", 1, 4),
+    ("Mow lawn", "WEEKLY", 2, 10),
+    ("Fridge clean-out", "MONTHLY", 1, 6),
+    ("Windows", "MONTHLY", 3, 8),
+]
+_CHORE_DAYS = {"DAILY": 1, "WEEKLY": 7, "MONTHLY": 30}
+_SPECIES = [
+    ("Monstera deliciosa", "Swiss cheese plant", 7),
+    ("Epipremnum aureum", "Pothos", 7),
+    ("Sansevieria trifasciata", "Snake plant", 14),
+    ("Ficus lyrata", "Fiddle-leaf fig", 7),
+    ("Chlorophytum comosum", "Spider plant", 5),
+    ("Zamioculcas zamiifolia", "ZZ plant", 14),
+]
+_PLANT_ACTIONS = ["WATER", "FERTILIZE", "PRUNE"]
+_ACHIEVEMENTS = [
+    ("First Steps", "CHORES", "POINTS", 10),
+    ("Centurion", "CHORES", "POINTS", 100),
+    ("Household Hero", "CHORES", "POINTS", 1000),
+    ("Chore Master", "CHORES", "COUNT", 50),
+    ("Bookkeeper", "FINANCE", "COUNT", 25),
+    ("Big Spender", "FINANCE", "COUNT", 500),
+    ("On a Roll", "CHORES", "STREAK", 7),
+    ("Unstoppable", "CHORES", "STREAK", 30),
+]
+_PET_SPECIES = ["DOG", "CAT", "BIRD", "FISH", "RODENT"]
+_CUISINES = ["Italian", "Mexican", "Indian", "Japanese", "Thai", "French", "American"]
+_INGREDIENTS = ["flour", "eggs", "milk", "rice", "onion", "garlic", "tomato", "chicken", "beans"]
+_NOTIFICATION_TYPES = ["EXPENSE_ADDED", "CHORE_DUE", "PROPOSAL_CREATED", "SETTLEMENT", "COMMENT"]
+_CENT = Decimal("0.01")
+
+
+@dataclass
+class SeedConfig:
+    """Dataset size and distribution knobs. Rates are means; counts vary per group."""
+
+    groups: int = 10
+    members_min: int = 2
+    members_max: int = 6
+    years: float = 2.0
+    end_date: date = field(default_factory=lambda: datetime.now(UTC).date())
+    seed: int = 1
+    # Finance
+    expenses_per_member_month: float = 12.0
+    expense_amount_median: float = 25.0
+    expense_amount_sigma: float = 0.9
+    split_participation: float = 0.8
+    settlements_per_group_month: float = 2.0
+    recurring_bills_per_group: int = 3
+    # Chores
+    chores_per_group: int = 6
+    chore_completion_rate: float = 0.8
+    chore_skip_rate: float = 0.05
+    # Governance
+    proposals_per_group_month: float = 1.0
+    vote_participation: float = 0.7
+    ranked_choice_share: float = 0.3
+    ranked_choice_options: int = 4
+    # Notifications / audit
+    notifications_per_member_week: float = 5.0
+    notification_read_rate: float = 0.85
+    audit_logs_per_expense: float = 1.2
+    # Plants / pets
+    plants_per_group: int = 4
+    plant_logs_per_plant_week: float = 1.5
+    pets_per_group: float = 0.8
+    pet_logs_per_pet_day: float = 2.0
+    # Recipes / meal plans / calendar
+    recipes_per_group: int = 8
+    meal_plans_per_group_week: float = 4.0
+    events_per_group_month: float = 3.0
+
+    @property
+    def start(self) -> datetime:
+        end = datetime.combine(self.end_date, datetime.min.time())
+        return end - timedelta(days=round(self.years * 365))
+
+    @property
+    def end(self) -> datetime:
+        return datetime.combine(self.end_date, datetime.min.time())
+
+
+class _Ids:
+    """Primary keys handed out after each table's current max(id)."""
+
+    def __init__(self, start: dict[str, int]):
+        self._next = {name: value + 1 for name, value in start.items()}
+
+    def __call__(self, table: Table) -> int:
+        value = self._next[table.name]
+        self._next[table.name] = value + 1
+        return value
+
+
+class _Writer:
+    """Buffers rows per table; flushes every table, in dependency order, when one fills."""
+
+    def __init__(self, conn: AsyncConnection, batch_size: int):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.buffers: dict[str, list[dict[str, Any]]] = {t.name: [] for t in TABLES}
+        self.counts: dict[str, int] = {t.name: 0 for t in TABLES}
+        # timestamptz columns get aware datetimes; plain TIMESTAMP columns get naive ones.
+        self.aware = {
+            t.name: [c.name for c in t.columns if getattr(c.type, "timezone", False)]
+            for t in TABLES
+        }
+
+    async def add(self, table: Table, row: dict[str, Any]) -> None:
+        for name in self.aware[table.name]:
+            if isinstance(row.get(name), datetime):
+                row[name] = row[name].replace(tzinfo=UTC)
+        buffer = self.buffers[table.name]
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        for table in TABLES:
+            rows = self.buffers[table.name]
+            if rows:
+                await self.conn.execute(insert(table), rows)
+                self.counts[table.name] += len(rows)
+                self.buffers[table.name] = []
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    """Poisson sample (Knuth for small means, normal approximation above 30)."""
+    if mean <= 0:
+        return 0
+    if mean > 30:
+        return max(0, round(rng.gauss(mean, math.sqrt(mean))))
+    limit, k, p = math.exp(-mean), 0, 1.0
+    while True:
+        p *= rng.random()
+        if p <= limit:
+            return k
+        k += 1
+
+
+def _money(value: float) -> Decimal:
+    return Decimal(str(value)).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+def _split(amount: Decimal, n: int) -> list[Decimal]:
+    """Equal split in cents; the remainder goes to the first shares."""
+    cents = int(amount * 100)
+    base, extra = divmod(cents, n)
+    return [Decimal(base + (1 if i < extra else 0)) / 100 for i in range(n)]
+
+
+def _stamp(at: datetime) -> dict[str, datetime]:
+    return {"created_at": at, "updated_at": at}
+
+
+class _Generator:
+    def __init__(
+        self,
+        cfg: SeedConfig,
+        ids: _Ids,
+        writer: _Writer,
+        species_ids: list[int],
+        achievements: list[tuple[int, str, int]],
+    ):
+        self.cfg = cfg
+        self.rng = random.Random(cfg.seed)
+        self.ids = ids
+        self.w = writer
+        self.species_ids = species_ids
+        self.achievements = achievements
+        self.days = max(1, (cfg.end - cfg.start).days)
+
+    def _at(self, day: int, hour_lo: int = 7, hour_hi: int = 22) -> datetime:
+        rng = self.rng
+        return self.cfg.start + timedelta(
+            days=day, hours=rng.randint(hour_lo, hour_hi), minutes=rng.randint(0, 59)
+        )
+
+    def _random_time(self) -> datetime:
+        return self._at(self.rng.randrange(self.days))
+
+    async def run(self) -> None:
+        for index in range(self.cfg.groups):
+            await self.group(index)
+        await self.w.flush()
+
+    async def group(self, index: int) -> None:
+        cfg, rng, w, ids = self.cfg, self.rng, self.w, self.ids
+        created = cfg.start - timedelta(days=rng.randint(1, 60))
+        members = []
+        for _ in range(rng.randint(cfg.members_min, cfg.members_max)):
+            uid = ids(User.__table__)
+            members.append(uid)
+            await w.add(
+                User.__table__,
+                {
+                    "id": uid,
+                    "email": f"seed-user-{uid}@example.test",
+                    "hashed_password": "!",
+                    "name": f"Seed User {uid}",
+                    "birth_date": datetime(
+                        rng.randint(1960, 2005), rng.randint(1, 12), rng.randint(1, 28)
+                    ),
+                    "is_superuser": False,
+                    "is_active": True,
+                    "language_code": "en",
+                    "last_login_at": cfg.end - timedelta(hours=rng.randint(1, 24 * 30)),
+                    **_stamp(created),
+                },
+            )
+        gid = ids(Group.__table__)
+        await w.add(
+            Group.__table__,
+            {
+                "id": gid,
+                "name": f"Seed Household {index + 1}",
+                "created_by_id": members[0],
+                "default_currency": "USD",
+                "timezone": "UTC",
+                "lease_start_date": cfg.start,
+                "lease_end_date": cfg.end + timedelta(days=rng.randint(30, 365)),
+                **_stamp(created),
+            },
+        )
+        for i, uid in enumerate(members):
+            await w.add(
+                UserGroup.__table__,
+                {
+                    "id": ids(UserGroup.__table__),
+                    "user_id": uid,
+                    "group_id": gid,
+                    "role": "ADMIN" if i == 0 else "MEMBER",
+                    "joined_at": created,
+                    **_stamp(created),
+                },
+            )
+
+        categories = []
+        for name in _CATEGORIES:
+            cid = ids(Category.__table__)
+            categories.append(cid)
+            await w.add(
+                Category.__table__,
+                {"id": cid, "group_id": gid, "name": name, "is_income": False, **_stamp(created)},
+            )
+
+        await self.finance(gid, members, categories)
+        points = await self.chores(gid, members)
+        await self.gamification(gid, members, points)
+        await self.governance(gid, members)
+        await self.notifications(gid, members)
+        await self.plants(gid, members)
+        await self.pets(gid, members)
+        await self.recipes(gid, members)
+        await self.calendar(gid, members)
+
+    async def finance(self, gid: int, members: list[int], categories: list[int]) -> None:
+        cfg, rng, w, ids = self.cfg, self.rng, self.w, self.ids
+        months = self.days / 30
+        n_expenses = _poisson(rng, cfg.expenses_per_member_month * len(members) * months)
+        mu = math.log(cfg.expense_amount_median)
+        for _ in range(n_expenses):
+            eid = ids(Expense.__table__)
+            payer = rng.choice(members)
+            at = self._random_time()
+            amount = _money(min(rng.lognormvariate(mu, cfg.expense_amount_sigma), 9_999.0))
+            amount = max(amount, _CENT * len(members))
+            await w.add(
+                Expense.__table__,
+                {
+                    "id": eid,
+                    "group_id": gid,
+                    "paid_by_user_id": payer,
+                    "description": f"{rng.choice(_VENDORS)} #{eid}",
+                    "amount": amount,
+                    "currency_code": "USD",
+                    "category_id": rng.choice(categories),
+                    "expense_date": at,
+                    "payment_method": rng.choice(["CARD", "CASH", "TRANSFER"]),
+                    "vendor_name": rng.choice(_VENDORS),
+                    "is_reimbursable": False,
+                    "is_recurring_generated": False,
+                    "version_id": 1,
+                    **_stamp(at),
+                },
+            )
+            participants = [
+                m for m in members if m == payer or rng.random() < cfg.split_participation
+            ]
+            for uid, share in zip(participants, _split(amount, len(participants)), strict=True):
+                paid = uid == payer or rng.random() < 0.5
+                await w.add(
+                    ExpenseSplit.__table__,
+                    {
+                        "id": ids(ExpenseSplit.__table__),
+                        "expense_id": eid,
+                        "user_id": uid,
+                        "owed_amount": share,
+                        "is_paid": paid,
+                        "paid_at": at + timedelta(days=rng.randint(0, 20)) if paid else None,
+                        **_stamp(at),
+                    },
+                )
+            for n in range(_poisson(rng, cfg.audit_logs_per_expense)):
+                logged = at + timedelta(minutes=rng.randint(1, 60 * 24 * 7)) if n else at
+                await w.add(
+                    AuditLog.__table__,
+                    {
+                        "id": ids(AuditLog.__table__),
+                        "group_id": gid,
+                        "user_id": payer,
+                        "action": "UPDATED" if n else "CREATED",
+                        "entity_type": "expense",
+                        "entity_id": eid,
+                        "new_values": {"amount": str(amount)},
+                        "occurred_at": logged,
+                        **_stamp(logged),
+                    },
+                )
+
+        if len(members) > 1:
+            for _ in range(_poisson(rng, cfg.settlements_per_group_month * months)):
+                payer, payee = rng.sample(members, 2)
+                at = self._random_time()
+                await w.add(
+                    Settlement.__table__,
+                    {
+                        "id": ids(Settlement.__table__),
+                        "group_id": gid,
+                        "payer_id": payer,
+                        "payee_id": payee,
+                        "amount": _money(rng.uniform(5, 300)),
+                        "currency_code": "USD",
+                        "method": rng.choice(["CASH", "VENMO", "ZELLE", "BANK_TRANSFER"]),
+                        "settled_at": at,
+                        **_stamp(at),
+                    },
+                )
+
+        for i in range(cfg.recurring_bills_per_group):
+            start = self.cfg.start + timedelta(days=rng.randint(0, 28))
+            await w.add(
+                RecurringExpense.__table__,
+                {
+                    "id": ids(RecurringExpense.__table__),
+                    "group_id": gid,
+                    "paid_by_user_id": rng.choice(members),
+                    "description": ["Rent", "Electricity", "Internet", "Water"][i % 4],
+                    "amount": _money(rng.uniform(40, 2000)),
+                    "currency_code": "USD",
+                    "category_id": categories[1 + i % 3],
+                    "frequency_type": "MONTHLY",
+                    "interval_value": 1,
+                    "start_date": start,
+                    "next_due_date": cfg.end + timedelta(days=rng.randint(1, 30)),
+                    "auto_create_expense": True,
+                    "is_active": True,
+                    **_stamp(start),
+                },
+            )
+
+    async def chores(self, gid: int, members: list[int]) -> dict[int, int]:
+        """Chores and their assignments; returns effort points earned per member."""
+        cfg, rng, w, ids = self.cfg, self.rng, self.w, self.ids
+        points: dict[int, int] = {}
+        for name, frequency, interval, effort in rng.sample(
+            _CHORES, min(cfg.chores_per_group, len(_CHORES))
+        ):
+            cid = ids(Chore.__table__)
+            await w.add(
+                Chore.__table__,
+                {
+                    "id": cid,
+                    "group_id": gid,
+                    "name": name,
+                    "frequency_type": frequency,
+                    "interval_value": interval,
+                    "effort_value": effort,
+                    "estimated_duration_minutes": effort * 5,
+                    "category": "CLEANING",
+                    "is_rotating": True,
+                    "rotation_strategy": "ROUND_ROBIN",
+                    "last_assigned_to_id": members[-1],
+                    "is_active": True,
+                    **_stamp(cfg.start),
+                },
+            )
+            step = _CHORE_DAYS[frequency] * interval
+            # Past assignments plus a couple of pending ones ahead for the calendar feed.
+            for n, day in enumerate(range(0, self.days + 2 * step, step)):
+                due = self._at(day, 18, 21)
+                assignee = members[n % len(members)]
+                roll = rng.random()
+                if due >= cfg.end:
+                    status = "PENDING"
+                elif roll < cfg.chore_completion_rate:
+                    status = "COMPLETED"
+                elif roll < cfg.chore_completion_rate + cfg.chore_skip_rate:
+                    status = "SKIPPED"
+                else:
+                    status = "PENDING"
+                done = due - timedelta(hours=rng.randint(0, 12)) if status == "COMPLETED" else None
+                if done:
+                    points[assignee] = points.get(assignee, 0) + effort
+                await w.add(
+                    ChoreAssignment.__table__,
+                    {
+                        "id": ids(ChoreAssignment.__table__),
+                        "chore_id": cid,
+                        "assigned_to_id": assignee,
+                        "due_date": due,
+                        "completed_at": done,
+                        "completed_by_id": assignee if done else None,
+                        "status": status,
+                        "quality_rating": rng.randint(3, 5) if done else None,
+                        **_stamp(due - timedelta(days=step)),
+                    },
+                )
+        return points
+
+    async def governance(self, gid: int, members: list[int]) -> None:
+        cfg, rng, w, ids = self.cfg, self.rng, self.w, self.ids
+        for _ in range(_poisson(rng, cfg.proposals_per_group_month * self.days / 30)):
+            pid = ids(Proposal.__table__)
+            at = self._random_time()
+            deadline = at + timedelta(days=rng.randint(2, 14))
+            ranked = rng.random() < cfg.ranked_choice_share
+            await w.add(
+                Proposal.__table__,
+                {
+                    "id": pid,
+                    "group_id": gid,
+                    "created_by_id": rng.choice(members),
+                    "title": f"Proposal {pid}",
+                    "type": rng.choice(["GENERAL", "EXPENSE_REQUEST", "POLICY_CHANGE"]),
+                    "strategy": "RANKED_CHOICE" if ranked else "SIMPLE_MAJORITY",
+                    "status": rng.choice(["PASSED", "REJECTED"]) if deadline < cfg.end else "OPEN",
+                    "deadline_at": deadline,
+                    **_stamp(at),
+                },
+            )
+            if ranked:
+                labels = [f"Option {n + 1}" for n in range(cfg.ranked_choice_options)]
+            else:
+                labels = ["Yes", "No", "Abstain"]
+            options = [ids(BallotOption.__table__) for _ in labels]
+            # (user, option index, rank, voted_at); ranked ballots rank every option.
+            ballots = []
+            for uid in members:
+                if rng.random() < cfg.vote_participation:
+                    voted = at + timedelta(hours=rng.randint(1, 48))
+                    if ranked:
+                        order = rng.sample(range(len(options)), len(options))
+                        ballots += [(uid, i, rank, voted) for rank, i in enumerate(order, 1)]
+                    else:
+                        ballots.append(
+                            (uid, rng.choices(range(3), weights=(6, 3, 1))[0], None, voted)
+                        )
+            first_choices = [i for _, i, rank, _ in ballots if rank in (None, 1)]
+            for order, (oid, label) in enumerate(zip(options, labels, strict=True)):
+                await w.add(
+                    BallotOption.__table__,
+                    {
+                        "id": oid,
+                        "proposal_id": pid,
+                        "text": label,
+                        "display_order": order,
+                        "vote_count": first_choices.count(order),
+                        **_stamp(at),
+                    },
+                )
+            for uid, i, rank, voted in ballots:
+                await w.add(
+                    VoteRecord.__table__,
+                    {
+                        "id": ids(VoteRecord.__table__),
+                        "proposal_id": pid,
+                        "user_id": uid,
+                        "ballot_option_id": options[i],
+                        "rank_order": rank,
+                        "weight": 1,
+                        "is_anonymous": False,
+                        "voted_at": voted,
+                        **_stamp(voted),
+                    },
+                )
+
+    async def gamification(self, gid: int, members: list[int], points: dict[int, int]) -> None:
+        rng, w, ids = self.rng, self.w, self.ids
+        for uid in members:
+            total = points.get(uid, 0)
+            await w.add(
+                UserPoints.__table__,
+                {
+                    "id": ids(UserPoints.__table__),
+                    "user_id": uid,
+                    "group_id": gid,
+                    "total_points": total,
+                    "monthly_points": min(total, rng.randint(0, 120)),
+                    "last_reset_at": self.cfg.end.replace(day=1),
+                    **_stamp(self.cfg.start),
+                },
+            )
+            current = rng.randint(0, 21)
+            await w.add(
+                Streak.__table__,
+                {
+                    "id": ids(Streak.__table__),
+                    "user_id": uid,
+                    "group_id": gid,
+                    "activity_type": "CHORES",
+                    "current_streak_days": current,
+                    "longest_streak_days": current + rng.randint(0, 30),
+                    "last_activity_date": self.cfg.end - timedelta(days=1),
+                    **_stamp(self.cfg.start),
+                },
+            )
+            # Part of what the member qualifies for is already awarded; the rest is pending.
+            for achievement_id, requirement_type, value in self.achievements:
+                if requirement_type == "POINTS" and total >= value and rng.random() < 0.5:
+                    earned = self._random_time()
+                    await w.add(
+                        UserAchievement.__table__,
+                        {
+                            "id": ids(UserAchievement.__table__),
+                            "user_id": uid,
+                            "achievement_id": achievement_id,
+                            "earned_at": earned,
+                            "progress_percentage": 100,
+                            **_stamp(earned),
+                        },
+                    )
+
+    async def notifications(self, gid: int, members: list[int]) -> None:
+        cfg, rng, w, ids = self.cfg, self.rng, self.w, self.ids
+        for uid in members:
+            for _ in range(_poisson(rng, cfg.notifications_per_member_week * self.days / 7)):
+                at = self._random_time()
+                read = rng.random() < cfg.notification_read_rate
+                kind = rng.choice(_NOTIFICATION_TYPES)
+                await w.add(
+                    Notification.__table__,
+                    {
+                        "id": ids(Notification.__table__),
+                        "user_id": uid,
+                        "group_id": gid,
+                        "type": kind,
+                        "title": kind.replace("_", " ").title(),
+                        "body": f"Synthetic {kind.lower()} notification",
+                        "priority": "MEDIUM",
+                        "is_read": read,
+                        "read_at": at + timedelta(hours=rng.randint(0, 72)) if read else None,
+                        "delivered_at": at,
+                        **_stamp(at),
+                    },
+                )
+
+    async def plants(self, gid: int, members: list[int]) -> None:
+        cfg, rng, w, ids = self.cfg, self.rng, self.w, self.ids
+        for _ in range(cfg.plants_per_group):
+            plant_id = ids(Plant.__table__)
+            acquired = cfg.start + timedelta(days=rng.randint(0, 90))
+            await w.add(
+                Plant.__table__,
+                {
+                    "id": plant_id,
+                    "group_id": gid,
+                    "species_id": rng.choice(self.species_ids),
+                    "nickname": f"Plant {plant_id}",
+                    "acquired_at": acquired,
+                    "is_alive": True,
+                    **_stamp(acquired),
+                },
+            )
+            for _ in range(_poisson(rng, cfg.plant_logs_per_plant_week * self.days / 7)):
+                at = self._random_time()
+                await w.add(
+                    PlantLog.__table__,
+                    {
+                        "id": ids(PlantLog.__table__),
+                        "plant_id": plant_id,
+                        "user_id": rng.choice(members),
+                        "action": rng.choices(_PLANT_ACTIONS, weights=(8, 1, 1))[0],
+                        "quantity_value": round(rng.uniform(0.1, 1.0), 2),
+                        "quantity_unit": "L",
+                        "occurred_at": at,
+                        **_stamp(at),
+                    },
+                )
+
+    async def pets(self, gid: int, members: list[int]) -> None:
+        cfg, rng, w, ids = self.cfg, self.rng, self.w, self.ids
+        for _ in range(_poisson(rng, cfg.pets_per_group)):
+            pet_id = ids(Pet.__table__)
+            await w.add(
+                Pet.__table__,
+                {
+                    "id": pet_id,
+                    "group_id": gid,
+                    "name": f"Pet {pet_id}",
+                    "species": rng.choice(_PET_SPECIES),
+                    "date_of_birth": cfg.start - timedelta(days=rng.randint(100, 3000)),
+                    "is_alive": True,
+                    **_stamp(cfg.start),
+                },
+            )
+            for _ in range(_poisson(rng, cfg.pet_logs_per_pet_day * self.days)):
+                at = self._random_time()
+                await w.add(
+                    PetLog.__table__,
+                    {
+                        "id": ids(PetLog.__table__),
+                        "pet_id": pet_id,
+                        "user_id": rng.choice(members),
+                        "action": rng.choices(["FEED", "WALK", "PLAY"], weights=(6, 3, 1))[0],
+                        "occurred_at": at,
+                        **_stamp(at),
+                    },
+                )
+            for year in range(math.ceil(cfg.years) + 1):
+                performed = cfg.start + timedelta(days=365 * year + rng.randint(0, 60))
+                await w.add(
+                    PetMedicalRecord.__table__,
+                    {
+                        "id": ids(PetMedicalRecord.__table__),
+                        "pet_id": pet_id,
+                        "type": "VACCINE",
+                        "description": "Annual vaccination",
+                        "performed_at": performed,
+                        "expires_at": performed + timedelta(days=365),
+                        "reminder_days_before": 14,
+                        **_stamp(performed),
+                    },
+                )
+
+    async def recipes(self, gid: int, members: list[int]) -> None:
+        cfg, rng, w, ids = self.cfg, self.rng, self.w, self.ids
+        recipe_ids = []
+        for _ in range(cfg.recipes_per_group):
+            rid = ids(Recipe.__table__)
+            recipe_ids.append(rid)
+            at = self._random_time()
+            await w.add(
+                Recipe.__table__,
+                {
+                    "id": rid,
+                    "group_id": gid,
+                    "owner_user_id": rng.choice(members),
+                    "title": f"{rng.choice(_CUISINES)} dish {rid}",
+                    "cuisine_type": rng.choice(_CUISINES),
+                    "difficulty": rng.choice(["EASY", "MEDIUM", "HARD"]),
+                    "prep_time_minutes": rng.randint(5, 45),
+                    "cook_time_minutes": rng.randint(0, 120),
+                    "servings": rng.randint(1, 8),
+                    "is_favorite": rng.random() < 0.2,
+                    "times_cooked": rng.randint(0, 40),
+                    **_stamp(at),
+                },
+            )
+            for name in rng.sample(_INGREDIENTS, rng.randint(3, 7)):
+                await w.add(
+                    RecipeIngredient.__table__,
+                    {
+                        "id": ids(RecipeIngredient.__table__),
+                        "recipe_id": rid,
+                        "name": name,
+                        "quantity_value": rng.randint(1, 500),
+                        "quantity_unit": "g",
+                        "is_optional": False,
+                        **_stamp(at),
+                    },
+                )
+            for step in range(1, rng.randint(3, 8) + 1):
+                await w.add(
+                    RecipeStep.__table__,
+                    {
+                        "id": ids(RecipeStep.__table__),
+                        "recipe_id": rid,
+                        "step_number": step,
+                        "instruction": f"Step {step}",
+                        **_stamp(at),
+                    },
+                )
+        for _ in range(_poisson(rng, cfg.meal_plans_per_group_week * (self.days + 30) / 7)):
+            day = (cfg.start + timedelta(days=rng.randint(0, self.days + 30))).date()
+            await w.add(
+                MealPlan.__table__,
+                {
+                    "id": ids(MealPlan.__table__),
+                    "group_id": gid,
+                    "plan_date": day,
+                    "meal_type": rng.choice(["BREAKFAST", "LUNCH", "DINNER"]),
+                    "recipe_id": rng.choice(recipe_ids) if recipe_ids else None,
+                    "assigned_cook_id": rng.choice(members),
+                    "is_completed": day < cfg.end_date,
+                    **_stamp(cfg.start),
+                },
+            )
+
+    async def calendar(self, gid: int, members: list[int]) -> None:
+        cfg, rng, w, ids = self.cfg, self.rng, self.w, self.ids
+        for _ in range(_poisson(rng, cfg.events_per_group_month * (self.days + 60) / 30)):
+            at = self._at(rng.randint(0, self.days + 60))
+            await w.add(
+                CalendarEvent.__table__,
+                {
+                    "id": ids(CalendarEvent.__table__),
+                    "group_id": gid,
+                    "created_by_id": rng.choice(members),
+                    "title": rng.choice(["House meeting", "Dinner party", "Cleaning day"]),
+                    "event_date": at,
+                    "is_all_day": rng.random() < 0.3,
+                    "category": rng.choice(["SOCIAL", "MAINTENANCE", "OTHER"]),
+                    "is_cancelled": rng.random() < 0.05,
+                    **_stamp(at),
+                },
+            )
+
+
+async def _plant_species(conn: AsyncConnection, ids: _Ids) -> list[int]:
+    """Ids of the shared species catalogue, inserting the missing entries."""
+    table = PlantSpecies.__table__
+    existing = dict((await conn.execute(select(table.c.scientific_name, table.c.id))).all())
+    for scientific, common, water_days in _SPECIES:
+        if scientific not in existing:
+            existing[scientific] = ids(table)
+            await conn.execute(
+                insert(table),
+                {
+                    "id": existing[scientific],
+                    "scientific_name": scientific,
+                    "common_name": common,
+                    "toxicity": "SAFE",
+                    "light_needs": "INDIRECT",
+                    "water_interval_summer": water_days,
+                    "water_interval_winter": water_days * 2,
+                },
+            )
+    return [existing[s] for s, _, _ in _SPECIES]
+
+
+async def _achievements(conn: AsyncConnection, ids: _Ids) -> list[tuple[int, str, int]]:
+    """(id, requirement type, value) of the achievement catalogue, inserting missing entries."""
+    table = Achievement.__table__
+    existing = dict((await conn.execute(select(table.c.name, table.c.id))).all())
+    for name, category, requirement_type, value in _ACHIEVEMENTS:
+        if name not in existing:
+            existing[name] = ids(table)
+            await conn.execute(
+                insert(table),
+                {
+                    "id": existing[name],
+                    "name": name,
+                    "description": f"{requirement_type.title()} {value} ({category.lower()})",
+                    "category": category,
+                    "requirement_type": requirement_type,
+                    "requirement_value": value,
+                    "is_active": True,
+                    **_stamp(datetime.now(UTC)),
+                },
+            )
+    return [(existing[name], rtype, value) for name, _, rtype, value in _ACHIEVEMENTS]
+
+
+async def _advance_sequences(conn: AsyncConnection) -> None:
+    """Postgres: move each id sequence past the explicitly inserted keys."""
+    for table in TABLES:
+        await conn.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"(SELECT COALESCE(MAX(id), 1) FROM {table.name}))"
+            )
+        )
+
+
+async def seed(
+    engine: AsyncEngine, cfg: SeedConfig, batch_size: int = 5000, create_schema: bool = False
+) -> dict[str, int]:
+    """Generate a dataset into `engine` in one transaction. Returns rows inserted per table."""
+    async with engine.begin() as conn:
+        if create_schema:
+            import_all_models()
+            await conn.run_sync(Base.metadata.create_all)
+        start_ids = {}
+        for table in TABLES:
+            start_ids[table.name] = (await conn.execute(select(func.max(table.c.id)))).scalar() or 0
+        ids = _Ids(start_ids)
+        writer = _Writer(conn, batch_size)
+        species_ids = await _plant_species(conn, ids)
+        achievements = await _achievements(conn, ids)
+        await _Generator(cfg, ids, writer, species_ids, achievements).run()
+        if conn.dialect.name == "postgresql":
+            await _advance_sequences(conn)
+        # Rows were inserted behind the finance service: derive the balance ledger
+        async with AsyncSession(bind=conn) as db:
+            writer.counts["member_balances"] = await rebuild_member_balances(db)
+    return {name: n for name, n in writer.counts.items() if n}
+
+
+def _parse_range(value: str) -> tuple[int, int]:
+    lo, _, hi = value.partition("-")
+    return int(lo), int(hi or lo)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m mitlist.db.seed", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("--database-url", help="Defaults to the configured database")
+    parser.add_argument("--create-schema", action="store_true", help="create_all() first (SQLite)")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--members", type=_parse_range, default=None, help="e.g. 3-6")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None)
+    for f in fields(SeedConfig):
+        if f.name in ("members_min", "members_max", "end_date"):
+            continue
+        parser.add_argument(
+            f"--{f.name.replace('_', '-')}",
+            type=type(f.default),
+            default=None,
+            help=f"default {f.default}",
+        )
+    return parser
+
+
+def _config(args: argparse.Namespace) -> SeedConfig:
+    overrides = {
+        f.name: getattr(args, f.name)
+        for f in fields(SeedConfig)
+        if getattr(args, f.name, None) is not None
+    }
+    if args.members is not None:
+        overrides["members_min"], overrides["members_max"] = args.members
+    return SeedConfig(**overrides)
+
+
+async def _main(argv: Optional[list[str]] = None) -> None:
+    args = _parser().parse_args(argv)
+    cfg = _config(args)
+    if args.database_url:
+        engine = create_async_engine(args.database_url)
+    else:
+        from mitlist.db.engine import engine
+    started = time.perf_counter()
+    try:
+        counts = await seed(engine, cfg, args.batch_size, args.create_schema)
+    finally:
+        await engine.dispose()
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    for name, n in counts.items():
+        print(f"{name:24} {n:>10}")
+    print(f"{'total':24} {total:>10}  ({elapsed:.1f}s, {total / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,17 @@
+"""
+Domain events over a transactional outbox.
+
+    from mitlist import events
+
+    events.emit(db, "EXPENSE_CREATED", {"expense_id": expense.id}, group_id=group_id)
+
+    @events.subscribe("EXPENSE_CREATED")
+    async def on_expense_created(db: AsyncSession, event: events.Event) -> None: ...
+
+Subscribers are registered in each module's interface.py; the dispatcher
+(mitlist.events.dispatcher) delivers committed events in the background.
+"""
+
+from mitlist.events.bus import Event, emit, subscribe, subscribers
+
+__all__ = ["Event", "emit", "subscribe", "subscribers"]
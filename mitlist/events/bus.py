@@ -0,0 +1,95 @@
+"""
+Domain events: `emit` into the outbox, `subscribe` handlers to event types.
+
+`emit` only adds an outbox row to the caller's session, so the event commits (or rolls
+back) with the change it describes and the request pays for one INSERT, whatever the
+number of subscribers. Handlers run later, in the dispatcher (dispatcher.py), each event
+in its own transaction: they receive the session that marks the event delivered, so
+their writes commit together with that mark. Delivery is at-least-once (a failed
+handler makes every handler of the event run again), so handlers must tolerate repeats.
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from mitlist.events.models import OutboxEvent, OutboxStatus
+
+
+@dataclass(frozen=True)
+class Event:
+    """An outbox event as handed to subscribers."""
+
+    id: int
+    type: str
+    group_id: Optional[int]
+    payload: dict[str, Any]
+    occurred_at: datetime
+
+
+Handler = Callable[[AsyncSession, Event], Awaitable[None]]
+
+_subscribers: dict[str, list[Handler]] = {}
+_wakeup: Optional[Callable[[], None]] = None
+
+
+def subscribe(event_type: str) -> Callable[[Handler], Handler]:
+    """Register the decorated handler for `event_type` (call from a module's interface.py)."""
+
+    def register(handler: Handler) -> Handler:
+        handlers = _subscribers.setdefault(event_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
+        return handler
+
+    return register
+
+
+def subscribers(event_type: str) -> list[Handler]:
+    return list(_subscribers.get(event_type, ()))
+
+
+def emit(
+    db: AsyncSession,
+    event_type: str,
+    payload: dict[str, Any],
+    group_id: Optional[int] = None,
+) -> OutboxEvent:
+    """
+    Record an event in the outbox, in `db`'s transaction.
+
+    `payload` must be JSON-serializable (ids, strings, numbers as str/int). Events of
+    one group are delivered in emission order.
+    """
+    row = OutboxEvent(
+        event_type=event_type,
+        group_id=group_id,
+        payload=payload,
+        occurred_at=datetime.now(UTC),
+        status=OutboxStatus.PENDING,
+        attempts=0,
+    )
+    db.add(row)
+    db.info["outbox_emitted"] = True
+    return row
+
+
+def set_wakeup(callback: Optional[Callable[[], None]]) -> None:
+    """Called after each commit that emitted events (the local dispatcher's wake-up)."""
+    global _wakeup
+    _wakeup = callback
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    if session.info.pop("outbox_emitted", False) and _wakeup is not None:
+        _wakeup()
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop("outbox_emitted", None)
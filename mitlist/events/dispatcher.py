@@ -0,0 +1,310 @@
+"""
+Outbox dispatcher: delivers committed events to their subscribers in batches.
+
+One dispatcher is active across all processes at a time: delivery runs as the
+"events.dispatch" job of a dedicated scheduler (mitlist.jobs.scheduler), whose DB lease
+passes to another process when the holder dies. The job is due every
+EVENTS_POLL_INTERVAL_SECONDS, so the lease row is claimed once per interval across all
+processes. A process runs it at once, due or not, when a local commit emitted events or
+its last batch was full.
+
+Ordering: pending events are taken in id (emission) order. When an event fails, later
+events of its group wait until it is delivered or given up on (after
+EVENTS_MAX_ATTEMPTS, status FAILED); other groups carry on. Events without a group are
+not ordered. Transactions of one group that commit concurrently are ordered by emission,
+as far as the dispatcher has not yet delivered the later one.
+"""
+
+import asyncio
+import importlib
+import logging
+import pkgutil
+from datetime import UTC, datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import delete, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+
+from mitlist.core.config import settings
+from mitlist.core.metrics import (
+    EVENT_DELIVERY_LAG,
+    EVENTS_DELIVERED,
+    OUTBOX_OLDEST_PENDING_AGE,
+    OUTBOX_PENDING,
+)
+from mitlist.events.bus import Event, set_wakeup, subscribers
+from mitlist.events.models import OutboxEvent, OutboxStatus
+from mitlist.jobs.scheduler import Job, JobContext, Scheduler
+
+logger = logging.getLogger(__name__)
+
+# Backoff between delivery attempts of one event is capped here
+MAX_RETRY_DELAY_SECONDS = 3600.0
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite hands timezone-aware columns back naive (they are stored as UTC)
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def load_subscribers() -> None:
+    """Import every module's interface.py, where subscribers are registered."""
+    import mitlist.modules
+
+    for module in pkgutil.iter_modules(mitlist.modules.__path__):
+        try:
+            importlib.import_module(f"mitlist.modules.{module.name}.interface")
+        except ModuleNotFoundError as exc:
+            if exc.name != f"mitlist.modules.{module.name}.interface":
+                raise
+
+
+class EventDispatcher:
+    """Batched, lease-guarded delivery of pending outbox events."""
+
+    def __init__(
+        self,
+        batch_size: int = 200,
+        interval: float = 1.0,
+        max_attempts: int = 10,
+        retry_delay: float = 5.0,
+        lease_seconds: float = 120.0,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._clock = clock
+        self.scheduler = Scheduler(lease_seconds=lease_seconds, batch_size=batch_size, clock=clock)
+        self.scheduler.register(
+            Job(
+                "events.dispatch",
+                self._dispatch,
+                interval=interval,
+                retry_delay=retry_delay,
+                jitter=0,
+            )
+        )
+        self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._backlog = False
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def _dispatch(self, db: AsyncSession, ctx: JobContext) -> int:
+        # Each event gets its own session; the job's session stays unused
+        return await self.deliver_pending(self._session_factory, ctx.now)
+
+    async def _sample_backlog(self, db: AsyncSession, now: datetime) -> None:
+        count, oldest = (
+            await db.execute(
+                select(func.count(OutboxEvent.id), func.min(OutboxEvent.occurred_at)).where(
+                    OutboxEvent.status == OutboxStatus.PENDING
+                )
+            )
+        ).one()
+        OUTBOX_PENDING.set(count)
+        oldest = _aware(oldest)
+        OUTBOX_OLDEST_PENDING_AGE.set((now - oldest).total_seconds() if oldest else 0.0)
+
+    async def _deliver(
+        self, session_factory: async_sessionmaker[AsyncSession], row: OutboxEvent
+    ) -> None:
+        event = Event(
+            id=row.id,
+            type=row.event_type,
+            group_id=row.group_id,
+            payload=row.payload,
+            occurred_at=_aware(row.occurred_at),
+        )
+        async with session_factory() as db:
+            for handler in subscribers(event.type):
+                await handler(db, event)
+            await db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id == row.id)
+                .values(
+                    status=OutboxStatus.DELIVERED,
+                    attempts=row.attempts + 1,
+                    delivered_at=self._clock(),
+                    last_error=None,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+    async def _record_failure(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        row: OutboxEvent,
+        now: datetime,
+        exc: Exception,
+    ) -> str:
+        attempts = row.attempts + 1
+        gave_up = attempts >= self.max_attempts
+        delay = min(self.retry_delay * 2 ** (attempts - 1), MAX_RETRY_DELAY_SECONDS)
+        async with session_factory() as db:
+            await db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id == row.id)
+                .values(
+                    status=OutboxStatus.FAILED if gave_up else OutboxStatus.PENDING,
+                    attempts=attempts,
+                    available_at=now + timedelta(seconds=delay),
+                    last_error=f"{type(exc).__name__}: {exc}"[:2000],
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        if gave_up:
+            logger.error(
+                "Giving up on event %s (%s) after %d attempts",
+                row.id,
+                row.event_type,
+                attempts,
+                exc_info=exc,
+            )
+            return "failed"
+        logger.warning("Delivery of event %s (%s) failed", row.id, row.event_type, exc_info=exc)
+        return "retry"
+
+    async def deliver_pending(
+        self, session_factory: async_sessionmaker[AsyncSession], now: Optional[datetime] = None
+    ) -> int:
+        """Deliver one batch of pending events; returns how many were attempted."""
+        now = now or self._clock()
+        # Events still backing off, and those queued behind one in their group, are left
+        # out by the query itself, so a blocked group cannot fill every batch
+        earlier = aliased(OutboxEvent)
+        waiting = (
+            exists()
+            .where(
+                earlier.group_id == OutboxEvent.group_id,
+                earlier.status == OutboxStatus.PENDING,
+                earlier.id < OutboxEvent.id,
+                earlier.available_at > now,
+            )
+            .correlate(OutboxEvent)
+        )
+        async with session_factory() as db:
+            rows = list(
+                await db.scalars(
+                    select(OutboxEvent)
+                    .where(
+                        OutboxEvent.status == OutboxStatus.PENDING,
+                        or_(OutboxEvent.available_at.is_(None), OutboxEvent.available_at <= now),
+                        ~waiting,
+                    )
+                    .order_by(OutboxEvent.id)
+                    .limit(self.batch_size)
+                )
+            )
+            await self._sample_backlog(db, now)
+
+        blocked: set[int] = set()
+        hindered = False
+        attempted = 0
+        for row in rows:
+            if row.group_id in blocked:
+                continue
+            attempted += 1
+            try:
+                await self._deliver(session_factory, row)
+            except Exception as exc:
+                hindered = True
+                if row.group_id is not None:
+                    blocked.add(row.group_id)
+                outcome = await self._record_failure(session_factory, row, now, exc)
+                EVENTS_DELIVERED.labels(row.event_type, outcome).inc()
+                continue
+            EVENTS_DELIVERED.labels(row.event_type, "delivered").inc()
+            EVENT_DELIVERY_LAG.labels(row.event_type).observe(
+                max((self._clock() - _aware(row.occurred_at)).total_seconds(), 0.0)
+            )
+
+        # A full batch that went through unhindered: more are probably waiting
+        self._backlog = len(rows) == self.batch_size and not hindered
+        return attempted
+
+    async def run_once(
+        self, session_factory: async_sessionmaker[AsyncSession], immediate: bool = False
+    ) -> dict[str, str]:
+        """
+        Deliver a batch if the dispatch job is due (or `immediate`) and this process can
+        take its lease.
+        """
+        self._session_factory = session_factory
+        return await self.scheduler.run_pending(session_factory, immediate)
+
+    def wake(self) -> None:
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _run(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        immediate = False
+        while True:
+            self._backlog = False
+            try:
+                await self.run_once(session_factory, immediate)
+            except Exception:
+                logger.warning("Event dispatch failed", exc_info=True)
+            if self._backlog:
+                immediate = True
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+                immediate = True
+            except TimeoutError:
+                immediate = False
+            self._wake.clear()
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Dispatch in a background task: when due, after local emits and after full batches."""
+        load_subscribers()
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            set_wakeup(self.wake)
+            self._task = asyncio.create_task(self._run(session_factory))
+
+    async def stop(self) -> None:
+        set_wakeup(None)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+async def purge_delivered(db: AsyncSession, before: datetime, limit: int = 500) -> int:
+    """Delete up to `limit` events delivered before `before`. Returns how many."""
+    ids = (
+        select(OutboxEvent.id)
+        .where(OutboxEvent.status == OutboxStatus.DELIVERED, OutboxEvent.delivered_at < before)
+        .order_by(OutboxEvent.id)
+        .limit(limit)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        delete(OutboxEvent)
+        .where(OutboxEvent.id.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+event_dispatcher = EventDispatcher(
+    batch_size=settings.EVENTS_BATCH_SIZE,
+    interval=settings.EVENTS_POLL_INTERVAL_SECONDS,
+    max_attempts=settings.EVENTS_MAX_ATTEMPTS,
+    retry_delay=settings.EVENTS_RETRY_DELAY_SECONDS,
+    lease_seconds=settings.SCHEDULER_LEASE_SECONDS,
+)
@@ -0,0 +1,42 @@
+"""Event outbox ORM models."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, DateTime, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from mitlist.db.base import BaseModel
+
+
+class OutboxStatus(str):
+    """Outbox event delivery status."""
+
+    PENDING = "PENDING"
+    DELIVERED = "DELIVERED"
+    # Gave up after EVENTS_MAX_ATTEMPTS; kept for inspection
+    FAILED = "FAILED"
+
+
+class OutboxEvent(BaseModel):
+    """Domain event, written in the transaction of the change it describes."""
+
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # Dispatcher scan: pending events in id order
+        Index("ix_outbox_events_status_id", "status", "id"),
+        # Dispatcher scan: is an earlier event of the same group still backing off?
+        Index("ix_outbox_events_group_id_status_id", "group_id", "status", "id"),
+    )
+
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    # Ordering key: a group's events are delivered one after another, in id order
+    group_id: Mapped[Optional[int]] = mapped_column(nullable=True)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default=OutboxStatus.PENDING, nullable=False)
+    attempts: Mapped[int] = mapped_column(default=0, nullable=False)
+    # Not retried before this (backoff after a failed delivery)
+    available_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    delivered_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -0,0 +1,12 @@
+"""
+Idempotency-Key support for mutating endpoints.
+
+    router = APIRouter(prefix="/things", route_class=IdempotentRoute)
+
+Retried requests with the same key get the first response back; see
+mitlist.idempotency.route.
+"""
+
+from mitlist.idempotency.route import IDEMPOTENCY_KEY_HEADER, IdempotentRoute, purge_expired
+
+__all__ = ["IDEMPOTENCY_KEY_HEADER", "IdempotentRoute", "purge_expired"]
@@ -0,0 +1,30 @@
+"""Idempotency key ORM models."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, LargeBinary, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from mitlist.db.base import BaseModel
+
+
+class IdempotencyRecord(BaseModel):
+    """A client's Idempotency-Key and the response of the request that first used it."""
+
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        # Keys are scoped per user; concurrent duplicates wait on this index
+        UniqueConstraint("user_id", "key", name="uq_idempotency_keys_user_key"),
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    key: Mapped[str] = mapped_column(String(255), nullable=False)
+    # sha256 of method, path, query, group scope and body
+    request_fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Stored in the same transaction as the request's writes
+    status_code: Mapped[Optional[int]] = mapped_column(nullable=True)
+    response_headers: Mapped[Optional[list[Any]]] = mapped_column(JSON, nullable=True)
+    response_body: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
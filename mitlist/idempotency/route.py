@@ -0,0 +1,216 @@
+"""
+Idempotency-Key handling for mutating routes.
+
+A request carrying `Idempotency-Key` claims the key (per user) by inserting a row in its
+own transaction, before the endpoint runs; the response is written to that row in the
+same transaction. So:
+  - a retry after the first request committed gets the stored response back without
+    the endpoint running (`Idempotent-Replayed: true`);
+  - a concurrent duplicate blocks on the unique index until the first request finishes,
+    then replays its response (or, if the first one failed and rolled back, runs itself);
+  - failed requests store nothing, so they can be retried with the same key;
+  - reusing a key for a different request (method, path, query, group scope or body)
+    is rejected with 422.
+
+Keys expire after IDEMPOTENCY_TTL_SECONDS; the "idempotency.purge_expired" job deletes them.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable, Coroutine, Optional
+
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist.api.deps import get_current_user, get_db
+from mitlist.core.config import settings
+from mitlist.core.errors import ValidationError
+from mitlist.idempotency.models import IdempotencyRecord
+from mitlist.modules.auth.models import User
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+_MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+# Recomputed when the stored body is sent again
+_UNSTORED_HEADERS = {b"content-length"}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite hands timezone-aware columns back naive (they are stored as UTC)
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+@dataclass
+class _Claim:
+    db: AsyncSession
+    record_id: int
+
+
+class _Replay(Exception):
+    """Raised by the claim dependency to answer with a stored response."""
+
+    def __init__(self, record: IdempotencyRecord) -> None:
+        self.record = record
+
+    def response(self) -> Response:
+        response = Response(
+            content=self.record.response_body or b"", status_code=self.record.status_code
+        )
+        for name, value in self.record.response_headers or ():
+            response.headers.append(name, value)
+        response.headers[REPLAYED_HEADER] = "true"
+        return response
+
+
+def _fingerprint(request: Request, body: bytes) -> str:
+    digest = hashlib.sha256()
+    for part in (
+        request.method,
+        request.url.path,
+        request.url.query,
+        request.headers.get("X-Group-ID", ""),
+    ):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+async def _insert_claim(db: AsyncSession, values: dict[str, Any]) -> Optional[int]:
+    """Insert the key row; None if the key exists (after waiting for its writer to finish)."""
+    dialect = db.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    return await db.scalar(
+        insert(IdempotencyRecord)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=["user_id", "key"])
+        .returning(IdempotencyRecord.id)
+    )
+
+
+async def claim_idempotency_key(
+    request: Request,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> None:
+    """Claim the request's Idempotency-Key, or raise _Replay with the stored response."""
+    key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+    if key is None:
+        return
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise ValidationError(
+            code="INVALID_IDEMPOTENCY_KEY",
+            detail=f"{IDEMPOTENCY_KEY_HEADER} must be 1-{MAX_KEY_LENGTH} characters",
+        )
+    fingerprint = _fingerprint(request, await request.body())
+    now = _utcnow()
+    values = {
+        "user_id": user.id,
+        "key": key,
+        "request_fingerprint": fingerprint,
+        "expires_at": now + timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS),
+    }
+    # Second pass only after deleting an expired row for the key
+    for _ in range(2):
+        record_id = await _insert_claim(db, values)
+        if record_id is not None:
+            request.state.idempotency_claim = _Claim(db, record_id)
+            return
+        record = await db.scalar(
+            select(IdempotencyRecord).where(
+                IdempotencyRecord.user_id == user.id, IdempotencyRecord.key == key
+            )
+        )
+        if record is None:
+            continue
+        if _aware(record.expires_at) <= now:
+            await db.execute(delete(IdempotencyRecord).where(IdempotencyRecord.id == record.id))
+            continue
+        if record.request_fingerprint != fingerprint:
+            raise ValidationError(
+                code="IDEMPOTENCY_KEY_REUSED",
+                detail=f"{IDEMPOTENCY_KEY_HEADER} was already used for a different request",
+            )
+        raise _Replay(record)
+    raise ValidationError(
+        code="IDEMPOTENCY_KEY_CONFLICT",
+        detail=f"{IDEMPOTENCY_KEY_HEADER} is being claimed concurrently; retry",
+    )
+
+
+async def _store_response(claim: _Claim, response: Response) -> None:
+    body = getattr(response, "body", None)
+    if body is None:
+        # Streaming responses cannot be replayed: leave the key unclaimed
+        await claim.db.execute(
+            delete(IdempotencyRecord).where(IdempotencyRecord.id == claim.record_id)
+        )
+        return
+    headers = [
+        [name.decode("latin-1"), value.decode("latin-1")]
+        for name, value in response.raw_headers
+        if name.lower() not in _UNSTORED_HEADERS
+    ]
+    await claim.db.execute(
+        update(IdempotencyRecord)
+        .where(IdempotencyRecord.id == claim.record_id)
+        .values(status_code=response.status_code, response_headers=headers, response_body=body)
+        .execution_options(synchronize_session=False)
+    )
+
+
+class IdempotentRoute(APIRoute):
+    """
+    Route class adding Idempotency-Key support to mutating routes:
+    `APIRouter(route_class=IdempotentRoute)`. Requests without the header are unaffected.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        dependencies = list(kwargs.pop("dependencies", None) or [])
+        if set(kwargs.get("methods") or ()) & _MUTATING_METHODS and not any(
+            d.dependency is claim_idempotency_key for d in dependencies
+        ):
+            dependencies.append(Depends(claim_idempotency_key))
+        super().__init__(path, endpoint, dependencies=dependencies, **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def idempotent_handler(request: Request) -> Response:
+            try:
+                response = await handler(request)
+            except _Replay as replay:
+                return replay.response()
+            claim: Optional[_Claim] = getattr(request.state, "idempotency_claim", None)
+            if claim is not None:
+                await _store_response(claim, response)
+            return response
+
+        return idempotent_handler
+
+
+async def purge_expired(db: AsyncSession, now: datetime, limit: int = 500) -> int:
+    """Delete up to `limit` expired keys. Returns how many."""
+    ids = (
+        select(IdempotencyRecord.id)
+        .where(IdempotencyRecord.expires_at <= now)
+        .order_by(IdempotencyRecord.id)
+        .limit(limit)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        delete(IdempotencyRecord)
+        .where(IdempotencyRecord.id.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
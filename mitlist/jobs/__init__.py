@@ -0,0 +1 @@
+"""Background jobs: DB-leased scheduler (scheduler.py) and the built-in sweeps (registry.py)."""
@@ -0,0 +1,52 @@
+"""
+Standalone job worker: python -m mitlist.jobs [--once]
+
+Runs the scheduled jobs and the domain event dispatcher, for deployments that keep
+background work out of the API processes (SCHEDULER_ENABLED=false and
+EVENTS_DISPATCH_ENABLED=false there, one or more of these instead).
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from mitlist.core.config import settings
+from mitlist.core.logging import setup_logging, shutdown_logging
+from mitlist.db.engine import AsyncSessionLocal, engine
+from mitlist.events.dispatcher import event_dispatcher, load_subscribers
+from mitlist.jobs.registry import scheduler
+
+
+async def _main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m mitlist.jobs", description=__doc__)
+    parser.add_argument("--once", action="store_true", help="Run due jobs once and exit")
+    parser.add_argument(
+        "--poll-interval", type=float, default=settings.SCHEDULER_POLL_INTERVAL_SECONDS
+    )
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    try:
+        if args.once:
+            load_subscribers()
+            outcomes = await scheduler.run_pending(AsyncSessionLocal)
+            outcomes.update(await event_dispatcher.run_once(AsyncSessionLocal))
+            print(json.dumps(outcomes))
+        else:
+            scheduler.start(AsyncSessionLocal, args.poll_interval)
+            event_dispatcher.start(AsyncSessionLocal)
+            await asyncio.Event().wait()
+    finally:
+        await scheduler.stop()
+        await event_dispatcher.stop()
+        await engine.dispose()
+        shutdown_logging()
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(asyncio.run(_main(sys.argv[1:])))
+    except KeyboardInterrupt:
+        pass
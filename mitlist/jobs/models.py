@@ -0,0 +1,39 @@
+"""Job scheduler ORM models."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from mitlist.db.base import BaseModel
+
+
+class ScheduledJob(BaseModel):
+    """Scheduled job state: when it runs next and who holds its lease."""
+
+    __tablename__ = "scheduled_jobs"
+
+    name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    next_run_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    lease_owner: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Consecutive failed runs (reset on success or when retries are exhausted)
+    attempts: Mapped[int] = mapped_column(default=0, nullable=False)
+    last_started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Start of the last successful run: the end of the window it covered (held while
+    # the job is still paging through a window)
+    last_success_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Resume point within the current window, left by a run that stopped at a full batch
+    cursor: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_status: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
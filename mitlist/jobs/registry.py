@@ -0,0 +1,66 @@
+"""
+Built-in jobs and the process-wide scheduler.
+
+Each job is a batched sweep exposed by its module's interface; the scheduler replaces
+work that otherwise only ever happened when someone hit the matching endpoint.
+"""
+
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist.core.config import settings
+from mitlist.events.dispatcher import purge_delivered
+from mitlist.idempotency import purge_expired
+from mitlist.jobs.scheduler import Job, JobContext, Scheduler
+from mitlist.modules.assets.interface import remind_due_maintenance
+from mitlist.modules.finance.interface import generate_due_recurring_expenses
+from mitlist.modules.governance.interface import close_expired_proposals
+from mitlist.modules.plants.interface import remind_due_schedules
+
+
+async def recurring_expenses(db: AsyncSession, ctx: JobContext) -> int:
+    return await generate_due_recurring_expenses(db, ctx.now, ctx.batch_size)
+
+
+async def proposal_deadlines(db: AsyncSession, ctx: JobContext) -> int:
+    return await close_expired_proposals(db, ctx.now, ctx.batch_size)
+
+
+async def plant_care_reminders(db: AsyncSession, ctx: JobContext) -> int:
+    processed, ctx.cursor = await remind_due_schedules(
+        db, ctx.since, ctx.now, ctx.batch_size, ctx.cursor
+    )
+    return processed
+
+
+async def maintenance_reminders(db: AsyncSession, ctx: JobContext) -> int:
+    processed, ctx.cursor = await remind_due_maintenance(
+        db, ctx.since, ctx.now, ctx.batch_size, ctx.cursor
+    )
+    return processed
+
+
+async def outbox_cleanup(db: AsyncSession, ctx: JobContext) -> int:
+    before = ctx.now - timedelta(days=settings.EVENTS_RETENTION_DAYS)
+    return await purge_delivered(db, before, ctx.batch_size)
+
+
+async def idempotency_cleanup(db: AsyncSession, ctx: JobContext) -> int:
+    return await purge_expired(db, ctx.now, ctx.batch_size)
+
+
+JOBS = [
+    Job("finance.recurring_expenses", recurring_expenses, interval=3600),
+    Job("governance.proposal_deadlines", proposal_deadlines, interval=300),
+    Job("plants.care_reminders", plant_care_reminders, interval=900),
+    Job("assets.maintenance_reminders", maintenance_reminders, interval=3600),
+    Job("events.outbox_cleanup", outbox_cleanup, interval=3600),
+    Job("idempotency.purge_expired", idempotency_cleanup, interval=3600),
+]
+
+scheduler = Scheduler(
+    lease_seconds=settings.SCHEDULER_LEASE_SECONDS, batch_size=settings.SCHEDULER_BATCH_SIZE
+)
+for _job in JOBS:
+    scheduler.register(_job)
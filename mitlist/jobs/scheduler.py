@@ -0,0 +1,284 @@
+"""
+Lease-based job scheduler over the `scheduled_jobs` table.
+
+Every process polls for due jobs. A job is claimed with one conditional UPDATE (due,
+and no live lease), so across replicas exactly one process runs it; the lease is
+renewed while the job runs and expires if that process dies, letting another one take
+over. Nothing beyond the database is needed (SQLite or Postgres).
+
+A job is an async function `(db, ctx) -> items processed`; it runs in its own session,
+committed when it returns. Afterwards:
+
+- success: next run after `interval` (plus jitter), or immediately when it processed a
+  full batch (backlog left). A job paging through its window leaves `ctx.cursor`; the
+  cursor is stored and the window start held, so the next run resumes the same window;
+- failure: retried after `retry_delay` doubled per consecutive failure (plus jitter),
+  until `max_attempts`; then the job waits for its next regular interval.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from mitlist.core.metrics import JOB_DURATION, JOB_ITEMS, JOB_LAST_SUCCESS, JOB_RUNS
+from mitlist.jobs.models import ScheduledJob
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobContext:
+    """What a run covers: up to `now`, starting where the last successful run ended."""
+
+    now: datetime
+    since: datetime
+    batch_size: int
+    # Where the previous run stopped within this window; set it when stopping early
+    cursor: Optional[str] = None
+
+
+@dataclass
+class Job:
+    name: str
+    run: Callable[[AsyncSession, JobContext], Awaitable[int]]
+    # Seconds between successful runs
+    interval: float
+    max_attempts: int = 5
+    # Seconds before the first retry; doubles with each further failure
+    retry_delay: float = 30.0
+    # Random extra delay, as a fraction of the interval / retry delay
+    jitter: float = 0.1
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite hands timezone-aware columns back naive (they are stored as UTC)
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+class Scheduler:
+    """Registered jobs, and the polling loop that runs the due ones."""
+
+    def __init__(
+        self,
+        lease_seconds: float = 120.0,
+        batch_size: int = 500,
+        owner: Optional[str] = None,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        self.jobs: dict[str, Job] = {}
+        self.lease_seconds = lease_seconds
+        self.batch_size = batch_size
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._clock = clock
+        self._task: Optional[asyncio.Task[None]] = None
+        # Jobs whose state row is known to exist
+        self._ensured: set[str] = set()
+
+    def register(self, job: Job) -> Job:
+        if job.name in self.jobs:
+            raise ValueError(f"Job {job.name!r} is already registered")
+        self.jobs[job.name] = job
+        return job
+
+    def _delay(self, seconds: float, jitter: float) -> timedelta:
+        return timedelta(seconds=seconds * (1 + jitter * random.random()))
+
+    async def _ensure_rows(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Create state rows for new jobs (due now); replicas racing here is harmless."""
+        if self._ensured >= self.jobs.keys():
+            return
+        async with session_factory() as db:
+            existing = set(await db.scalars(select(ScheduledJob.name)))
+        for name in self.jobs.keys() - existing:
+            async with session_factory() as db:
+                db.add(ScheduledJob(name=name, next_run_at=self._clock()))
+                try:
+                    await db.commit()
+                except IntegrityError:
+                    await db.rollback()
+        self._ensured = set(self.jobs)
+
+    async def _claim(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        job: Job,
+        now: datetime,
+        immediate: bool = False,
+    ) -> Optional[ScheduledJob]:
+        """Take the job's lease if it is due (or `immediate`) and free; its state row if so."""
+        due = [] if immediate else [ScheduledJob.next_run_at <= now]
+        async with session_factory() as db:
+            result = await db.execute(
+                update(ScheduledJob)
+                .where(
+                    ScheduledJob.name == job.name,
+                    *due,
+                    or_(
+                        ScheduledJob.lease_expires_at.is_(None),
+                        ScheduledJob.lease_expires_at <= now,
+                    ),
+                )
+                .values(
+                    lease_owner=self.owner,
+                    lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                    last_started_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            if result.rowcount != 1:
+                return None
+            return await db.scalar(select(ScheduledJob).where(ScheduledJob.name == job.name))
+
+    async def _renew(self, session_factory: async_sessionmaker[AsyncSession], name: str) -> None:
+        """Keep extending the lease while the job runs (cancelled when it finishes)."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                async with session_factory() as db:
+                    await db.execute(
+                        update(ScheduledJob)
+                        .where(ScheduledJob.name == name, ScheduledJob.lease_owner == self.owner)
+                        .values(
+                            lease_expires_at=self._clock() + timedelta(seconds=self.lease_seconds)
+                        )
+                        .execution_options(synchronize_session=False)
+                    )
+                    await db.commit()
+            except Exception:
+                logger.warning("Could not renew lease of job %s", name, exc_info=True)
+
+    async def _release(
+        self, session_factory: async_sessionmaker[AsyncSession], name: str, **values
+    ) -> None:
+        async with session_factory() as db:
+            result = await db.execute(
+                update(ScheduledJob)
+                .where(ScheduledJob.name == name, ScheduledJob.lease_owner == self.owner)
+                .values(lease_owner=None, lease_expires_at=None, **values)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        if result.rowcount != 1:
+            logger.warning("Job %s lost its lease while running", name)
+
+    async def run_job(
+        self, session_factory: async_sessionmaker[AsyncSession], job: Job, immediate: bool = False
+    ) -> Optional[str]:
+        """
+        Run `job` if it is due and not leased elsewhere; the outcome, or None if skipped.
+        `immediate` runs it before it is due (still only where the lease is free).
+        """
+        now = self._clock()
+        state = await self._claim(session_factory, job, now, immediate)
+        if state is None:
+            return None
+
+        since = _aware(state.last_success_at) or now - timedelta(seconds=job.interval)
+        ctx = JobContext(now=now, since=since, batch_size=self.batch_size, cursor=state.cursor)
+        renewer = asyncio.create_task(self._renew(session_factory, job.name))
+        started = time.perf_counter()
+        try:
+            async with session_factory() as db:
+                processed = await job.run(db, ctx) or 0
+                await db.commit()
+        except Exception as exc:
+            attempts = state.attempts + 1
+            if attempts < job.max_attempts:
+                outcome, delay = "RETRY", job.retry_delay * 2 ** (attempts - 1)
+            else:
+                outcome, delay, attempts = "FAILED", job.interval, 0
+            logger.exception("Job %s failed (%s)", job.name, outcome.lower())
+            finished = self._clock()
+            await self._release(
+                session_factory,
+                job.name,
+                attempts=attempts,
+                next_run_at=finished + self._delay(delay, job.jitter),
+                last_finished_at=finished,
+                last_status=outcome,
+                last_error=f"{type(exc).__name__}: {exc}"[:2000],
+            )
+            JOB_RUNS.labels(job.name, "failure").inc()
+            return outcome
+        finally:
+            renewer.cancel()
+            JOB_DURATION.labels(job.name).observe(time.perf_counter() - started)
+
+        finished = self._clock()
+        backlog = processed >= self.batch_size
+        await self._release(
+            session_factory,
+            job.name,
+            attempts=0,
+            next_run_at=finished if backlog else now + self._delay(job.interval, job.jitter),
+            last_finished_at=finished,
+            last_success_at=now if ctx.cursor is None else since,
+            cursor=ctx.cursor,
+            last_status="SUCCESS",
+            last_error=None,
+        )
+        JOB_RUNS.labels(job.name, "success").inc()
+        JOB_ITEMS.labels(job.name).inc(processed)
+        JOB_LAST_SUCCESS.labels(job.name).set(time.time())
+        if processed:
+            logger.info("Job %s processed %d items", job.name, processed)
+        return "SUCCESS"
+
+    async def run_pending(
+        self, session_factory: async_sessionmaker[AsyncSession], immediate: bool = False
+    ) -> dict[str, str]:
+        """
+        One poll: run every due job this process can lease. Job name -> outcome.
+        With `immediate`, jobs run whether due or not.
+        """
+        await self._ensure_rows(session_factory)
+        outcomes = {}
+        for job in self.jobs.values():
+            outcome = await self.run_job(session_factory, job, immediate)
+            if outcome is not None:
+                outcomes[job.name] = outcome
+        return outcomes
+
+    async def _run(
+        self, session_factory: async_sessionmaker[AsyncSession], interval: float
+    ) -> None:
+        while True:
+            try:
+                await self.run_pending(session_factory)
+            except Exception:
+                logger.warning("Scheduler poll failed", exc_info=True)
+            # Jittered so replicas started together do not poll in lockstep
+            await asyncio.sleep(interval * (0.9 + 0.2 * random.random()))
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession], interval: float) -> None:
+        """Poll every `interval` seconds in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(session_factory, interval))
+
+    async def stop(self) -> None:
+        """Stop polling; a job still running is cancelled and its lease simply expires."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
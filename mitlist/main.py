@@ -1,21 +1,32 @@
 """FastAPI application factory and main entry point."""
 
 import logging
-import uuid
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 
-from mitlist.api.router import api_router, health_router
+from mitlist.api.compression import CompressionMiddleware
+from mitlist.api.middleware import (
+    MaintenanceModeMiddleware,
+    MetricsMiddleware,
+    RequestContextMiddleware,
+)
+from mitlist.api.principal import last_login_buffer
+from mitlist.api.router import api_router, health_router, metrics_router
+from mitlist.core.auth.zitadel import start_zitadel_client, stop_zitadel_client
 from mitlist.core.config import settings
 from mitlist.core.errors import AppError, app_error_handler
-from mitlist.core.logging import setup_logging
-from mitlist.core.otel import setup_otel
-from mitlist.core.request_context import set_trace_id
+from mitlist.core.logging import setup_logging, shutdown_logging
+from mitlist.core.metrics import mark_process_dead, metrics_sampler
+from mitlist.core.otel import instrument_app, otel_enabled, setup_otel, shutdown_otel
+from mitlist.core.state import state_backend
+from mitlist.db.engine import AsyncSessionLocal, replica_router
+from mitlist.events.dispatcher import event_dispatcher
+from mitlist.jobs.registry import scheduler
+from mitlist.modules.audit.interface import maintenance_mode
 
 logger = logging.getLogger(__name__)
 
@@ -45,14 +56,32 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info(f"Starting {settings.PROJECT_NAME} in {settings.ENVIRONMENT} environment")
     setup_logging()
-    otel_instrumentor = setup_otel()
-    if otel_instrumentor:
-        otel_instrumentor.instrument_app(app)
+    setup_otel()
+    await state_backend.start(settings.STATE_REFRESH_INTERVAL_SECONDS)
+    last_login_buffer.start(AsyncSessionLocal, settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS)
+    await start_zitadel_client()
+    replica_router.start(settings.DATABASE_REPLICA_LAG_CHECK_INTERVAL_SECONDS)
+    if settings.METRICS_ENABLED:
+        metrics_sampler.start(settings.METRICS_REFRESH_INTERVAL_SECONDS)
+    if settings.SCHEDULER_ENABLED:
+        scheduler.start(AsyncSessionLocal, settings.SCHEDULER_POLL_INTERVAL_SECONDS)
+    if settings.EVENTS_DISPATCH_ENABLED:
+        event_dispatcher.start(AsyncSessionLocal)
 
     yield
 
     # Shutdown
     logger.info(f"Shutting down {settings.PROJECT_NAME}")
+    await scheduler.stop()
+    await event_dispatcher.stop()
+    await last_login_buffer.stop(AsyncSessionLocal)
+    await stop_zitadel_client()
+    await replica_router.stop()
+    await metrics_sampler.stop()
+    await state_backend.stop()
+    mark_process_dead()
+    shutdown_otel()
+    shutdown_logging()
 
 
 def create_application() -> FastAPI:
@@ -69,6 +98,14 @@ def create_application() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Maintenance mode: 503 for API requests (innermost, so CORS headers still apply)
+    application.add_middleware(
+        MaintenanceModeMiddleware,
+        state=maintenance_mode,
+        prefix=f"{api_router.prefix}/",
+        exempt=(f"{api_router.prefix}/admin/maintenance-mode",),
+    )
+
     # CORS middleware
     application.add_middleware(
         CORSMiddleware,
@@ -78,15 +115,23 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Trace ID middleware
-    @application.middleware("http")
-    async def trace_id_middleware(request: Request, call_next):
-        """Ensure every request has a trace_id."""
-        trace_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-        set_trace_id(trace_id)
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = trace_id
-        return response
+    # Response compression
+    if settings.COMPRESSION_ENABLED:
+        application.add_middleware(
+            CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE
+        )
+
+    # Request latency / in-flight metrics
+    if settings.METRICS_ENABLED:
+        application.add_middleware(MetricsMiddleware)
+
+    # Trace ID / request context / timing (pure ASGI, outermost)
+    application.add_middleware(RequestContextMiddleware)
+
+    # Server spans around the whole stack; must be set up before the first request
+    # (the lifespan startup) builds it, so this cannot wait for setup_otel()
+    if otel_enabled():
+        instrument_app(application)
 
     # Exception handlers
     application.add_exception_handler(AppError, app_error_handler)
@@ -94,6 +139,8 @@ def create_application() -> FastAPI:
 
     # Include routers
     application.include_router(health_router)
+    if settings.METRICS_ENABLED:
+        application.include_router(metrics_router)
     application.include_router(api_router)
 
     return application
@@ -19,6 +19,7 @@ __all__ = [
     "update_maintenance_task",
     "list_maintenance_logs",
     "create_maintenance_log",
+    "remind_due_maintenance",
     "get_insurance_by_id",
     "list_insurances",
     "create_insurance",
@@ -38,6 +39,7 @@ update_maintenance_task = service.update_maintenance_task
 
 list_maintenance_logs = service.list_maintenance_logs
 create_maintenance_log = service.create_maintenance_log
+remind_due_maintenance = service.remind_due_maintenance
 
 get_insurance_by_id = service.get_insurance_by_id
 list_insurances = service.list_insurances
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from mitlist.core.errors import NotFoundError
+from mitlist.core.pagination import apply_keyset, next_cursor
 from mitlist.modules.assets.models import (
     HomeAsset,
     MaintenanceTask,
@@ -284,6 +285,70 @@ async def create_maintenance_log(
     return log
 
 
+async def remind_due_maintenance(
+    db: AsyncSession,
+    since: datetime,
+    until: datetime,
+    limit: int = 500,
+    cursor: Optional[str] = None,
+) -> tuple[int, Optional[str]]:
+    """
+    Notify group members of maintenance tasks that came due in (since, until]
+    (scheduled sweep). At most `limit` tasks per call, in due order, resuming after
+    `cursor`. Returns how many tasks were processed and the cursor of the next page
+    (None when done).
+    """
+    from mitlist.modules.auth.models import UserGroup
+    from mitlist.modules.notifications.interface import create_notifications_bulk
+
+    q = (
+        select(
+            MaintenanceTask.id,
+            MaintenanceTask.next_due_date,
+            MaintenanceTask.name,
+            MaintenanceTask.priority,
+            HomeAsset,
+        )
+        .join(HomeAsset, HomeAsset.id == MaintenanceTask.asset_id)
+        .where(
+            MaintenanceTask.is_active.is_(True),
+            HomeAsset.disposed_at.is_(None),
+            MaintenanceTask.next_due_date > since.replace(tzinfo=None),
+            MaintenanceTask.next_due_date <= until.replace(tzinfo=None),
+        )
+    )
+    q = apply_keyset(q, MaintenanceTask.next_due_date, MaintenanceTask.id, cursor, descending=False)
+    due = (await db.execute(q.limit(limit))).all()
+    if not due:
+        return 0, None
+
+    rows = await db.execute(
+        select(UserGroup.group_id, UserGroup.user_id).where(
+            UserGroup.group_id.in_({row.HomeAsset.group_id for row in due}),
+            UserGroup.left_at.is_(None),
+        )
+    )
+    members: dict[int, list[int]] = {}
+    for group_id, user_id in rows:
+        members.setdefault(group_id, []).append(user_id)
+
+    notifications_data = [
+        {
+            "user_id": user_id,
+            "group_id": asset.group_id,
+            "type": "MAINTENANCE_DUE",
+            "title": f"{asset.name}: {name} due",
+            "body": f"Maintenance task \"{name}\" is due for {asset.name}.",
+            "link_url": f"/assets/{asset.id}",
+            "priority": priority if priority in ("LOW", "MEDIUM", "HIGH") else "MEDIUM",
+        }
+        for _, _, name, priority, asset in due
+        for user_id in members.get(asset.group_id, [])
+    ]
+    await create_notifications_bulk(db, notifications_data)
+    return len(due), next_cursor(due, limit, "next_due_date")
+
+
 # ---------- Insurance ----------
 async def get_insurance_by_id(db: AsyncSession, insurance_id: int) -> Optional[AssetInsurance]:
     """Get insurance by ID (for group ownership check)."""
@@ -5,8 +5,9 @@ from typing import List as ListType
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mitlist.api.deps import get_current_group_id, get_current_user, get_db, require_group_admin, require_introspection_user
+from mitlist.api.deps import get_current_group_id, get_current_user, get_db, get_read_db, require_group_admin, require_introspection_user
 from mitlist.core.errors import NotFoundError, ValidationError
+from mitlist.core.pagination import next_cursor
 from mitlist.modules.auth.models import User
 from mitlist.modules.audit import schemas
 from mitlist.modules.audit.interface import (
@@ -59,10 +60,11 @@ async def get_admin_audit_trail(
     action: str | None = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: str | None = None,
     group_id: int = Depends(get_current_group_id),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    """Query audit logs for the group."""
+    """Query audit logs for the group (offset or keyset `cursor` paging)."""
     logs = await list_audit_logs(
         db,
         group_id=group_id,
@@ -72,11 +74,13 @@ async def get_admin_audit_trail(
         action=action,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
     return schemas.AuditLogListResponse(
         logs=logs,
         total_count=len(logs),
         has_more=len(logs) == limit,
+        next_cursor=next_cursor(logs, limit, "occurred_at"),
     )
 
 
@@ -125,7 +129,7 @@ async def post_admin_maintenance_mode(
 ):
     """Toggle maintenance mode."""
     from mitlist.modules.audit.service import set_maintenance_mode
-    result = set_maintenance_mode(enabled=enabled, message=message, enabled_by=_user.id)
+    result = await set_maintenance_mode(enabled=enabled, message=message, enabled_by=_user.id)
     return result
 
 
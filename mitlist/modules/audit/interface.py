@@ -5,6 +5,7 @@ Other modules may ONLY import from this file (and schemas.py).
 Never import models or service directly from other modules.
 """
 
+from mitlist import events
 from mitlist.modules.audit import schemas, service
 
 __all__ = [
@@ -30,6 +31,9 @@ __all__ = [
     # Admin
     "get_system_stats",
     "broadcast_notification",
+    "maintenance_mode",
+    "get_maintenance_mode",
+    "set_maintenance_mode",
 ]
 
 log_action = service.log_action
@@ -52,3 +56,11 @@ get_entity_tags = service.get_entity_tags
 
 get_system_stats = service.get_system_stats
 broadcast_notification = service.broadcast_notification
+maintenance_mode = service.maintenance_mode
+get_maintenance_mode = service.get_maintenance_mode
+set_maintenance_mode = service.set_maintenance_mode
+
+# Event subscribers
+events.subscribe("EXPENSE_CREATED")(service.on_expense_created)
+events.subscribe("CHORE_COMPLETED")(service.on_chore_completed)
+events.subscribe("PROPOSAL_CLOSED")(service.on_proposal_closed)
@@ -67,6 +67,7 @@ class AuditLogListResponse(BaseModel):
     logs: list[AuditLogResponse]
     total_count: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 # ====================
@@ -7,6 +7,9 @@ from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from mitlist.core.errors import NotFoundError
+from mitlist.core.pagination import apply_keyset
+from mitlist.core.state import state_backend
+from mitlist.events import Event
 from mitlist.modules.audit.models import AuditLog, ReportSnapshot, Tag, TagAssignment
 
 
@@ -22,6 +25,7 @@ async def log_action(
     new_values: Optional[dict[str, Any]] = None,
     ip_address: Optional[str] = None,
     user_agent: Optional[str] = None,
+    occurred_at: Optional[datetime] = None,
 ) -> AuditLog:
     """Log an action in the audit trail."""
     log = AuditLog(
@@ -34,7 +38,7 @@ async def log_action(
         new_values=new_values,
         ip_address=ip_address,
         user_agent=user_agent,
-        occurred_at=datetime.now(timezone.utc),
+        occurred_at=occurred_at or datetime.now(timezone.utc),
     )
     db.add(log)
     await db.flush()
@@ -53,8 +57,9 @@ async def list_audit_logs(
     end_date: Optional[datetime] = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> list[AuditLog]:
-    """List audit logs with optional filters."""
+    """List audit logs with optional filters, newest first (offset or keyset cursor)."""
     q = select(AuditLog)
 
     if group_id is not None:
@@ -72,8 +77,8 @@ async def list_audit_logs(
     if end_date is not None:
         q = q.where(AuditLog.occurred_at <= end_date)
 
-    q = q.order_by(AuditLog.occurred_at.desc()).limit(limit).offset(offset)
-    result = await db.execute(q)
+    q = apply_keyset(q, AuditLog.occurred_at, AuditLog.id, cursor)
+    result = await db.execute(q.limit(limit).offset(offset))
     return list(result.scalars().all())
 
 
@@ -357,34 +362,32 @@ async def get_entity_tags(
 
 
 # ---------- Maintenance Mode ----------
-# In-memory state (in production, use Redis or a settings table)
-_maintenance_state = {
-    "enabled": False,
-    "message": "",
-    "enabled_at": None,
-    "enabled_by": None,
-}
+# Shared by all workers through the state backend; readers get the local copy
+maintenance_mode = state_backend.shared(
+    "maintenance_mode",
+    {"enabled": False, "message": "", "enabled_at": None, "enabled_by": None},
+)
 
 
 def get_maintenance_mode() -> dict[str, Any]:
     """Get current maintenance mode status."""
-    return _maintenance_state.copy()
+    return dict(maintenance_mode.value)
 
 
-def set_maintenance_mode(
+async def set_maintenance_mode(
     enabled: bool,
     message: str = "",
     enabled_by: Optional[int] = None,
 ) -> dict[str, Any]:
-    """Toggle maintenance mode."""
-    global _maintenance_state
-    _maintenance_state = {
+    """Toggle maintenance mode in every worker."""
+    state = {
         "enabled": enabled,
         "message": message,
         "enabled_at": datetime.now(timezone.utc).isoformat() if enabled else None,
         "enabled_by": enabled_by,
     }
-    return _maintenance_state.copy()
+    await maintenance_mode.set(state)
+    return dict(state)
 
 
 # ---------- Admin ----------
@@ -433,3 +436,52 @@ async def broadcast_notification(
     ]
 
     return await create_notifications_bulk(db, notifications_data)
+
+
+# ---------- Event subscribers ----------
+async def on_expense_created(db: AsyncSession, event: Event) -> None:
+    """Audit trail entry for a new expense."""
+    await log_action(
+        db,
+        action="CREATED",
+        entity_type="expense",
+        entity_id=event.payload["expense_id"],
+        group_id=event.group_id,
+        user_id=event.payload["paid_by_user_id"],
+        new_values={
+            "description": event.payload["description"],
+            "amount": event.payload["amount"],
+            "currency_code": event.payload["currency_code"],
+        },
+        occurred_at=event.occurred_at,
+    )
+
+
+async def on_chore_completed(db: AsyncSession, event: Event) -> None:
+    """Audit trail entry for a completed chore assignment."""
+    await log_action(
+        db,
+        action="UPDATED",
+        entity_type="chore_assignment",
+        entity_id=event.payload["assignment_id"],
+        group_id=event.group_id,
+        user_id=event.payload["completed_by_id"],
+        new_values={"status": "COMPLETED"},
+        occurred_at=event.occurred_at,
+    )
+
+
+async def on_proposal_closed(db: AsyncSession, event: Event) -> None:
+    """Audit trail entry for a closed proposal (APPROVED when it passed)."""
+    await log_action(
+        db,
+        action="APPROVED" if event.payload["status"] == "PASSED" else "REJECTED",
+        entity_type="proposal",
+        entity_id=event.payload["proposal_id"],
+        group_id=event.group_id,
+        new_values={
+            "status": event.payload["status"],
+            "winner_option_text": event.payload["winner_option_text"],
+        },
+        occurred_at=event.occurred_at,
+    )
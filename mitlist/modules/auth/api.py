@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from mitlist.api.deps import get_db
-from mitlist.api.deps import get_current_user
+from mitlist.api.deps import get_current_user, invalidate_cached_user
 from mitlist.api.deps import require_introspection_user
 from mitlist.core.errors import GoneError, NotFoundError
 from mitlist.modules.auth import interface, schemas
@@ -72,6 +72,7 @@ async def patch_users_me(
         language_code=data.language_code,
         preferences=data.preferences,
     )
+    invalidate_cached_user(db, user.id)
     return schemas.UserResponse.model_validate(updated_user)
 
 
@@ -82,6 +83,7 @@ async def delete_users_me(
 ):
     """Delete (soft) the current user's account. Requires re-authentication."""
     await interface.soft_delete_user(db, user.id)
+    invalidate_cached_user(db, user.id)
 
 
 # ---------- Groups ----------
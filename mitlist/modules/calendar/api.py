@@ -6,19 +6,17 @@ from typing import Any, List as ListType
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mitlist.api.deps import get_current_group_id, get_current_user, get_db
-from mitlist.modules.auth.interface import require_member
-from mitlist.modules.auth.models import User
+from mitlist.api.deps import get_current_group_id, get_read_db
+from mitlist.core.serialization import FastJSONResponse
 from mitlist.modules.calendar import service
 
 router = APIRouter(prefix="/calendar", tags=["calendar"])
 
 
-@router.get("/feed", response_model=ListType[dict[str, Any]])
+@router.get("/feed", response_model=ListType[dict[str, Any]], response_class=FastJSONResponse)
 async def get_calendar_feed(
     group_id: int = Depends(get_current_group_id),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     start_date: date | None = Query(None, description="Start date for calendar feed"),
     end_date: date | None = Query(None, description="End date for calendar feed"),
 ):
@@ -27,11 +25,11 @@ async def get_calendar_feed(
 
     Returns a list of calendar events sorted by date.
     """
-    await require_member(db, group_id, user.id)
     events = await service.get_calendar_feed(
         db,
         group_id,
         start_date=start_date,
         end_date=end_date,
     )
-    return events
+    # Plain dicts built by the service: nothing to validate, encode with orjson.
+    return FastJSONResponse(events)
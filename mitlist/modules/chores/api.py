@@ -5,9 +5,11 @@ from typing import List as ListType
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mitlist.api.deps import get_current_group_id, get_current_user, get_db
+from mitlist.api.conditional import ConditionalGet, get_conditional
+from mitlist.api.deps import get_current_group_id, get_current_user, get_db, get_read_db, get_read_only_db
 from mitlist.core.errors import NotFoundError, ValidationError
 from mitlist.modules.chores import interface, schemas
+from mitlist.modules.chores.models import Chore
 
 router = APIRouter(prefix="/chores", tags=["chores"])
 
@@ -16,9 +18,13 @@ router = APIRouter(prefix="/chores", tags=["chores"])
 async def get_chores(
     group_id: int = Depends(get_current_group_id),
     active_only: bool = Query(True),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_only_db),
+    conditional: ConditionalGet = Depends(get_conditional),
 ) -> ListType[schemas.ChoreResponse]:
-    """List chore definitions for the group."""
+    """List chore definitions for the group. Supports If-None-Match."""
+    not_modified = await conditional.collection(db, Chore, Chore.group_id == group_id)
+    if not_modified is not None:
+        return not_modified
     chores = await interface.list_chores(db, group_id, active_only=active_only)
     return [schemas.ChoreResponse.model_validate(c) for c in chores]
 
@@ -161,7 +167,7 @@ async def get_my_chore_stats(
 @router.get("/leaderboard", response_model=schemas.ChoreLeaderboardResponse)
 async def get_chore_leaderboard(
     group_id: int = Depends(get_current_group_id),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get leaderboard for the group."""
     rankings = await interface.get_leaderboard(db, group_id)
@@ -181,8 +187,12 @@ async def get_chore(
     chore_id: int,
     group_id: int = Depends(get_current_group_id),
     db: AsyncSession = Depends(get_db),
+    conditional: ConditionalGet = Depends(get_conditional),
 ) -> schemas.ChoreResponse:
-    """Get a chore by ID."""
+    """Get a chore by ID. Supports If-None-Match."""
+    not_modified = await conditional.row(db, Chore, chore_id, Chore.group_id == group_id)
+    if not_modified is not None:
+        return not_modified
     chore = await interface.get_chore_by_id(db, chore_id)
     if not chore or chore.group_id != group_id:
         raise NotFoundError(code="CHORE_NOT_FOUND", detail=f"Chore {chore_id} not found")
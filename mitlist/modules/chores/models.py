@@ -74,6 +74,11 @@ class Chore(BaseModel, TimestampMixin):
     last_assigned_to_id: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
 
+    # Bumped on every update so conditional GETs see writes that leave updated_at alone
+    version_id: Mapped[int] = mapped_column(nullable=False, default=1)
+
+    __mapper_args__ = {"version_id_col": version_id}
+
     # Relationships
     assignments: Mapped[list["ChoreAssignment"]] = relationship(
         "ChoreAssignment", back_populates="chore", cascade="all, delete-orphan"
@@ -6,6 +6,7 @@ from sqlalchemy import and_, case, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import contains_eager, selectinload
 
+from mitlist import events
 from mitlist.core.errors import NotFoundError, ValidationError
 from mitlist.modules.chores.models import (
     Chore,
@@ -182,6 +183,24 @@ async def complete_assignment(
         a.actual_duration_minutes = actual_duration_minutes
     if notes is not None:
         a.notes = notes
+    group_id, chore_name, effort_value = (
+        await db.execute(
+            select(Chore.group_id, Chore.name, Chore.effort_value).where(Chore.id == a.chore_id)
+        )
+    ).one()
+    events.emit(
+        db,
+        "CHORE_COMPLETED",
+        {
+            "assignment_id": a.id,
+            "chore_id": a.chore_id,
+            "chore_name": chore_name,
+            "assigned_to_id": a.assigned_to_id,
+            "completed_by_id": completed_by_id,
+            "effort_value": effort_value,
+        },
+        group_id=group_id,
+    )
     await db.flush()
     await db.refresh(a)
     return a
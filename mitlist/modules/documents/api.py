@@ -5,7 +5,8 @@ from typing import List as ListType
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mitlist.api.deps import get_current_group_id, get_current_user, get_db, require_group_admin
+from mitlist.api.compression import uncompressed
+from mitlist.api.deps import get_current_group_id, get_current_user, get_db, get_read_only_db, require_group_admin
 from mitlist.api.deps import require_introspection_user
 from mitlist.core.errors import ForbiddenError, NotFoundError
 from mitlist.modules.auth.models import User
@@ -18,11 +19,9 @@ router = APIRouter(tags=["documents", "credentials"])
 @router.get("/documents", response_model=ListType[schemas.DocumentResponse])
 async def get_documents(
     group_id: int = Depends(get_current_group_id),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_only_db),
 ):
     """List documents for the current group."""
-    await require_member(db, group_id, user.id)
     docs = await service.list_documents(db, group_id)
     return [schemas.DocumentResponse.model_validate(d) for d in docs]
 
@@ -63,6 +62,7 @@ async def post_documents_upload(
 
 
 @router.get("/documents/{document_id}/download", response_model=schemas.DocumentDownloadResponse)
+@uncompressed
 async def get_documents_download(
     document_id: int,
     user: User = Depends(get_current_user),
@@ -105,11 +105,9 @@ async def delete_document(
 @router.get("/credentials", response_model=ListType[schemas.SharedCredentialResponse])
 async def get_credentials(
     group_id: int = Depends(get_current_group_id),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_only_db),
 ):
     """List shared credentials for the current group."""
-    await require_member(db, group_id, user.id)
     creds = await service.list_credentials(db, group_id)
     return [schemas.SharedCredentialResponse.model_validate(c) for c in creds]
 
@@ -2,17 +2,26 @@
 
 from typing import List as ListType
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mitlist.api.deps import get_current_group_id, get_current_user, get_db
+from mitlist.api.deps import get_current_group_id, get_current_user, get_db, get_read_db, get_read_only_db
 from mitlist.core.errors import NotFoundError, ValidationError
+from mitlist.core.pagination import NEXT_CURSOR_HEADER, next_cursor
+from mitlist.core.serialization import FastJSONResponse, ORMSerializer
+from mitlist.idempotency import IdempotentRoute
 from mitlist.modules.finance import interface, schemas
 
-router = APIRouter(tags=["finance"])
+router = APIRouter(tags=["finance"], route_class=IdempotentRoute)
 
+_expense_serializer = ORMSerializer(schemas.ExpenseResponse)
 
-@router.get("/expenses", response_model=ListType[schemas.ExpenseResponse])
+
+@router.get(
+    "/expenses",
+    response_model=ListType[schemas.ExpenseResponse],
+    response_class=FastJSONResponse,
+)
 async def get_expenses(
     group_id: int = Depends(get_current_group_id),
     user_id: int | None = Query(None),
@@ -21,9 +30,10 @@ async def get_expenses(
     date_to: str | None = Query(None, description="ISO datetime"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None, description="Keyset cursor from X-Next-Cursor"),
+    db: AsyncSession = Depends(get_read_only_db),
 ) -> ListType[schemas.ExpenseResponse]:
-    """List group expenses (filter by date, user, category)."""
+    """List group expenses (filter by date, user, category); next page cursor in X-Next-Cursor."""
     from datetime import datetime
 
     date_from_dt = None
@@ -47,8 +57,13 @@ async def get_expenses(
         date_to=date_to_dt,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
-    return [schemas.ExpenseResponse.model_validate(e) for e in expenses]
+    headers = {}
+    if (cursor_out := next_cursor(expenses, limit, "expense_date")) is not None:
+        headers[NEXT_CURSOR_HEADER] = cursor_out
+    # Trusted ORM rows with splits eager-loaded: serialize straight to bytes.
+    return FastJSONResponse(_expense_serializer.dump(expenses), headers=headers)
 
 
 @router.post("/expenses", response_model=schemas.ExpenseResponse, status_code=status.HTTP_201_CREATED)
@@ -94,7 +109,7 @@ async def create_expense(
 async def get_expense(
     expense_id: int,
     group_id: int = Depends(get_current_group_id),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_only_db),
 ) -> schemas.ExpenseResponse:
     """Get full split details and comments."""
     expense = await interface.get_expense_by_id(db, expense_id)
@@ -148,7 +163,7 @@ async def delete_expense(
 @router.get("/balances", response_model=schemas.GroupBalanceSummaryResponse)
 async def get_balances(
     group_id: int = Depends(get_current_group_id),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> schemas.GroupBalanceSummaryResponse:
     """Calculate group balances."""
     gid, balances, total_owed, currency = await interface.calculate_group_balances(db, group_id)
@@ -168,7 +183,7 @@ async def get_balance_history(
     group_id: int = Depends(get_current_group_id),
     user_id: int | None = Query(None),
     limit: int = Query(100, ge=1, le=500),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> ListType[schemas.BalanceSnapshotResponse]:
     """Get historical balance snapshots."""
     snapshots = await interface.list_balance_snapshots(
@@ -180,7 +195,7 @@ async def get_balance_history(
 @router.get("/categories", response_model=ListType[schemas.CategoryResponse])
 async def get_categories(
     group_id: int = Depends(get_current_group_id),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_only_db),
 ) -> ListType[schemas.CategoryResponse]:
     """List categories."""
     categories = await interface.list_categories(db, group_id=group_id)
@@ -251,15 +266,19 @@ async def delete_category(
 
 @router.get("/settlements", response_model=ListType[schemas.SettlementResponse])
 async def get_settlements(
+    response: Response,
     group_id: int = Depends(get_current_group_id),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None, description="Keyset cursor from X-Next-Cursor"),
+    db: AsyncSession = Depends(get_read_only_db),
 ) -> ListType[schemas.SettlementResponse]:
-    """List group settlements."""
+    """List group settlements; next page cursor in X-Next-Cursor."""
     settlements = await interface.list_settlements(
-        db, group_id=group_id, limit=limit, offset=offset
+        db, group_id=group_id, limit=limit, offset=offset, cursor=cursor
     )
+    if (cursor_out := next_cursor(settlements, limit, "settled_at")) is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_out
     return [schemas.SettlementResponse.model_validate(s) for s in settlements]
 
 
@@ -319,7 +338,7 @@ async def delete_settlement(
 @router.get("/budgets", response_model=ListType[schemas.BudgetStatusResponse])
 async def get_budgets(
     group_id: int = Depends(get_current_group_id),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_only_db),
 ) -> ListType[schemas.BudgetStatusResponse]:
     """List budgets with current spending status."""
     budgets_data = await interface.list_budgets_with_status(db, group_id=group_id)
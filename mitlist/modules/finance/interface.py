@@ -24,6 +24,8 @@ __all__ = [
     "calculate_group_balances",
     "list_balance_snapshots",
     "create_balance_snapshot",
+    "rebuild_member_balances",
+    "verify_member_balances",
     # Settlements
     "list_settlements",
     "get_settlement_by_id",
@@ -44,6 +46,7 @@ __all__ = [
     "update_recurring_expense",
     "deactivate_recurring_expense",
     "generate_expense_from_recurring",
+    "generate_due_recurring_expenses",
     # Split Presets
     "list_split_presets",
     "get_split_preset_by_id",
@@ -70,6 +73,8 @@ delete_category = service.delete_category
 calculate_group_balances = service.calculate_group_balances
 list_balance_snapshots = service.list_balance_snapshots
 create_balance_snapshot = service.create_balance_snapshot
+rebuild_member_balances = service.rebuild_member_balances
+verify_member_balances = service.verify_member_balances
 
 # Settlements
 list_settlements = service.list_settlements
@@ -93,6 +98,7 @@ create_recurring_expense = service.create_recurring_expense
 update_recurring_expense = service.update_recurring_expense
 deactivate_recurring_expense = service.deactivate_recurring_expense
 generate_expense_from_recurring = service.generate_expense_from_recurring
+generate_due_recurring_expenses = service.generate_due_recurring_expenses
 
 # Split Presets
 list_split_presets = service.list_split_presets
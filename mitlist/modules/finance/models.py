@@ -255,3 +255,22 @@ class BalanceSnapshot(BaseModel, TimestampMixin):
     __table_args__ = (
         UniqueConstraint("group_id", "user_id", "snapshot_date", name="uq_balance_snapshot"),
     )
+
+
+class MemberBalance(BaseModel, TimestampMixin):
+    """
+    Running balance per group member: paid - owed (unpaid splits) + settlements received
+    - settlements paid. Kept up to date by the finance service as deltas in the same
+    transaction as the change; `python -m mitlist.db.balances` verifies or rebuilds it.
+    """
+
+    __tablename__ = "member_balances"
+
+    group_id: Mapped[int] = mapped_column(ForeignKey("groups.id"), nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    balance: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+
+    __table_args__ = (
+        # Balance reads and delta upserts are lookups on this index
+        UniqueConstraint("group_id", "user_id", name="uq_member_balance"),
+    )
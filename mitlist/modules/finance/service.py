@@ -4,17 +4,21 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import and_, delete, func, or_, select, text, union_all
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from mitlist import events
 from mitlist.core.errors import NotFoundError, StaleDataError, ValidationError
+from mitlist.core.pagination import apply_keyset
 from mitlist.modules.finance.models import (
     BalanceSnapshot,
     Budget,
     Category,
     Expense,
     ExpenseSplit,
+    MemberBalance,
     RecurringExpense,
     Settlement,
     SplitPreset,
@@ -31,8 +35,9 @@ async def list_expenses(
     date_to: Optional[datetime] = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> list[Expense]:
-    """List group expenses with optional filters."""
+    """List group expenses with optional filters, newest first (offset or keyset cursor)."""
     q = (
         select(Expense)
         .where(Expense.group_id == group_id, Expense.deleted_at.is_(None))
@@ -46,8 +51,8 @@ async def list_expenses(
         q = q.where(Expense.expense_date >= date_from)
     if date_to is not None:
         q = q.where(Expense.expense_date <= date_to)
-    q = q.order_by(Expense.expense_date.desc(), Expense.id.desc()).limit(limit).offset(offset)
-    result = await db.execute(q)
+    q = apply_keyset(q, Expense.expense_date, Expense.id, cursor)
+    result = await db.execute(q.limit(limit).offset(offset))
     return list(result.scalars().all())
 
 
@@ -110,6 +115,25 @@ async def create_expense(
             )
             db.add(split)
         await db.flush()
+
+    deltas = {paid_by_user_id: amount}
+    for s in splits or []:
+        _add_delta(deltas, s["user_id"], -Decimal(s["owed_amount"]))
+    await _apply_balance_deltas(db, group_id, deltas)
+
+    events.emit(
+        db,
+        "EXPENSE_CREATED",
+        {
+            "expense_id": expense.id,
+            "paid_by_user_id": paid_by_user_id,
+            "description": description,
+            "amount": str(amount),
+            "currency_code": currency_code,
+            "participant_user_ids": [s["user_id"] for s in splits or []],
+        },
+        group_id=group_id,
+    )
     
     # Reload expense with splits relationship loaded
     result = await db.execute(
@@ -145,7 +169,11 @@ async def update_expense(
         raise StaleDataError(detail=f"Expense {expense_id} was modified by another request")
     if description is not None:
         expense.description = description
-    if amount is not None:
+    if amount is not None and amount != expense.amount:
+        if expense.deleted_at is None:
+            await _apply_balance_deltas(
+                db, expense.group_id, {expense.paid_by_user_id: amount - expense.amount}
+            )
         expense.amount = amount
     if currency_code is not None:
         expense.currency_code = currency_code
@@ -176,11 +204,21 @@ async def update_expense(
 
 
 async def delete_expense(db: AsyncSession, expense_id: int) -> None:
-    """Soft-delete expense (re-calculates balances when we add balance logic)."""
-    result = await db.execute(select(Expense).where(Expense.id == expense_id))
+    """Soft-delete expense and take it out of the members' balances."""
+    result = await db.execute(select(Expense).where(Expense.id == expense_id).with_for_update())
     expense = result.scalar_one_or_none()
     if not expense:
         raise NotFoundError(code="EXPENSE_NOT_FOUND", detail=f"Expense {expense_id} not found")
+    if expense.deleted_at is None:
+        deltas = {expense.paid_by_user_id: -expense.amount}
+        unpaid = await db.execute(
+            select(ExpenseSplit.user_id, ExpenseSplit.owed_amount).where(
+                ExpenseSplit.expense_id == expense.id, ExpenseSplit.is_paid.is_(False)
+            )
+        )
+        for user_id, owed in unpaid.all():
+            _add_delta(deltas, user_id, owed)
+        await _apply_balance_deltas(db, expense.group_id, deltas)
     expense.deleted_at = datetime.now(timezone.utc)
     await db.flush()
 
@@ -277,89 +315,142 @@ async def calculate_group_balances(
     db: AsyncSession,
     group_id: int,
 ) -> tuple[int, list[dict], Decimal, str]:
-    """Calculate real-time balances for all group members."""
-    from decimal import Decimal as D
-
-    from sqlalchemy import func
-
+    """Current balances of all group members, read from the member_balances ledger."""
     from mitlist.modules.auth.models import UserGroup
 
-    members_result = await db.execute(
-        select(UserGroup.user_id).where(
-            UserGroup.group_id == group_id, UserGroup.left_at.is_(None)
+    currency_code = "USD"
+    result = await db.execute(
+        select(UserGroup.user_id, MemberBalance.balance)
+        .outerjoin(
+            MemberBalance,
+            and_(
+                MemberBalance.group_id == UserGroup.group_id,
+                MemberBalance.user_id == UserGroup.user_id,
+            ),
         )
+        .where(UserGroup.group_id == group_id, UserGroup.left_at.is_(None))
     )
-    member_ids = [row[0] for row in members_result.all()]
 
     balances = []
-    total_owed = D("0.00")
-    currency_code = "USD"
+    total_owed = Decimal("0.00")
+    for user_id, balance in result.all():
+        balance = balance if balance is not None else Decimal("0.00")
+        balances.append({"user_id": user_id, "balance": balance, "currency_code": currency_code})
+        if balance > 0:
+            total_owed += balance
 
-    # Optimization: Fetch all totals in bulk grouped by user_id to avoid N+1 queries
-    # 1. Total Paid by User
-    paid_q = (
-        select(Expense.paid_by_user_id, func.sum(Expense.amount))
-        .where(
-            Expense.group_id == group_id,
-            Expense.deleted_at.is_(None),
+    return group_id, balances, total_owed, currency_code
+
+
+# ---------- Member balance ledger ----------
+# Writes apply their effect on balances as deltas in the caller's transaction; the
+# ledger can always be recomputed from expense and settlement history.
+
+
+def _add_delta(deltas: dict[int, Decimal], user_id: int, amount: Decimal) -> None:
+    deltas[user_id] = deltas.get(user_id, Decimal("0")) + amount
+
+
+async def _apply_balance_deltas(
+    db: AsyncSession, group_id: int, deltas: dict[int, Decimal]
+) -> None:
+    """Add `deltas` (user_id -> amount) to the members' ledger rows, creating missing ones."""
+    # Sorted, so concurrent writers lock the rows in the same order
+    rows = [
+        {"group_id": group_id, "user_id": user_id, "balance": amount}
+        for user_id, amount in sorted(deltas.items())
+        if amount
+    ]
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    stmt = (postgresql.insert if dialect == "postgresql" else sqlite.insert)(MemberBalance)
+    stmt = stmt.values(rows)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["group_id", "user_id"],
+            set_={
+                "balance": MemberBalance.balance + stmt.excluded.balance,
+                "updated_at": func.now(),
+            },
         )
-        .group_by(Expense.paid_by_user_id)
     )
-    paid_result = await db.execute(paid_q)
-    paid_map = {row[0]: row[1] for row in paid_result.all()}
 
-    # 2. Total Owed by User (Unpaid Splits)
-    owed_q = (
-        select(ExpenseSplit.user_id, func.sum(ExpenseSplit.owed_amount))
-        .join(Expense, ExpenseSplit.expense_id == Expense.id)
-        .where(
-            Expense.group_id == group_id,
-            ExpenseSplit.is_paid == False,
-            Expense.deleted_at.is_(None),
+
+def _balances_from_history(group_id: Optional[int] = None):
+    """(group_id, user_id, balance) aggregated from expenses, splits and settlements."""
+
+    def scoped(query, column):
+        return query if group_id is None else query.where(column == group_id)
+
+    live = Expense.deleted_at.is_(None)
+    movements = union_all(
+        scoped(
+            select(
+                Expense.group_id,
+                Expense.paid_by_user_id.label("user_id"),
+                Expense.amount.label("delta"),
+            ).where(live),
+            Expense.group_id,
+        ),
+        scoped(
+            select(Expense.group_id, ExpenseSplit.user_id, -ExpenseSplit.owed_amount)
+            .join(Expense, ExpenseSplit.expense_id == Expense.id)
+            .where(live, ExpenseSplit.is_paid.is_(False)),
+            Expense.group_id,
+        ),
+        scoped(
+            select(Settlement.group_id, Settlement.payee_id, Settlement.amount),
+            Settlement.group_id,
+        ),
+        scoped(
+            select(Settlement.group_id, Settlement.payer_id, -Settlement.amount),
+            Settlement.group_id,
+        ),
+    ).subquery()
+    return select(
+        movements.c.group_id, movements.c.user_id, func.sum(movements.c.delta).label("balance")
+    ).group_by(movements.c.group_id, movements.c.user_id)
+
+
+async def rebuild_member_balances(db: AsyncSession, group_id: Optional[int] = None) -> int:
+    """Recompute the ledger (one group, or all) from history. Returns rows written."""
+    if db.get_bind().dialect.name == "postgresql":
+        # Writers committing meanwhile either are in the snapshot below or wait for
+        # this transaction before applying their delta
+        await db.execute(text("LOCK TABLE member_balances IN EXCLUSIVE MODE"))
+    stale = delete(MemberBalance)
+    if group_id is not None:
+        stale = stale.where(MemberBalance.group_id == group_id)
+    await db.execute(stale)
+    history = _balances_from_history(group_id).subquery()
+    result = await db.execute(
+        MemberBalance.__table__.insert().from_select(
+            ["group_id", "user_id", "balance"],
+            select(history.c.group_id, history.c.user_id, history.c.balance),
         )
-        .group_by(ExpenseSplit.user_id)
-    )
-    owed_result = await db.execute(owed_q)
-    owed_map = {row[0]: row[1] for row in owed_result.all()}
-
-    # 3. Settlements Received (User is Payee)
-    settled_in_q = (
-        select(Settlement.payee_id, func.sum(Settlement.amount))
-        .where(Settlement.group_id == group_id)
-        .group_by(Settlement.payee_id)
-    )
-    settled_in_result = await db.execute(settled_in_q)
-    settled_in_map = {row[0]: row[1] for row in settled_in_result.all()}
-
-    # 4. Settlements Paid (User is Payer)
-    settled_out_q = (
-        select(Settlement.payer_id, func.sum(Settlement.amount))
-        .where(Settlement.group_id == group_id)
-        .group_by(Settlement.payer_id)
     )
-    settled_out_result = await db.execute(settled_out_q)
-    settled_out_map = {row[0]: row[1] for row in settled_out_result.all()}
-
-    for user_id in member_ids:
-        paid_total = paid_map.get(user_id, D("0.00")) or D("0.00")
-        owed_total = owed_map.get(user_id, D("0.00")) or D("0.00")
-        settled_in = settled_in_map.get(user_id, D("0.00")) or D("0.00")
-        settled_out = settled_out_map.get(user_id, D("0.00")) or D("0.00")
-
-        balance = paid_total - owed_total + settled_in - settled_out
-
-        balances.append(
-            {
-                "user_id": user_id,
-                "balance": balance,
-                "currency_code": currency_code,
-            }
-        )
+    return result.rowcount
 
-        if balance > 0:
-            total_owed += balance
 
-    return group_id, balances, total_owed, currency_code
+async def verify_member_balances(db: AsyncSession, group_id: Optional[int] = None) -> list[dict]:
+    """Ledger rows that differ from history: dicts with group_id, user_id, ledger, expected."""
+    expected = {
+        (g, u): balance for g, u, balance in (await db.execute(_balances_from_history(group_id)))
+    }
+    q = select(MemberBalance.group_id, MemberBalance.user_id, MemberBalance.balance)
+    if group_id is not None:
+        q = q.where(MemberBalance.group_id == group_id)
+    ledger = {(g, u): balance for g, u, balance in await db.execute(q)}
+
+    cent = Decimal("0.01")
+    mismatches = []
+    for g, u in sorted(expected.keys() | ledger.keys()):
+        want = Decimal(expected.get((g, u)) or 0).quantize(cent)
+        have = Decimal(ledger.get((g, u)) or 0).quantize(cent)
+        if want != have:
+            mismatches.append({"group_id": g, "user_id": u, "ledger": have, "expected": want})
+    return mismatches
 
 
 async def list_balance_snapshots(
@@ -405,16 +496,12 @@ async def list_settlements(
     group_id: int,
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> list[Settlement]:
-    """List group settlements."""
-    q = (
-        select(Settlement)
-        .where(Settlement.group_id == group_id)
-        .order_by(Settlement.settled_at.desc(), Settlement.id.desc())
-        .limit(limit)
-        .offset(offset)
-    )
-    result = await db.execute(q)
+    """List group settlements, newest first (offset or keyset cursor)."""
+    q = select(Settlement).where(Settlement.group_id == group_id)
+    q = apply_keyset(q, Settlement.settled_at, Settlement.id, cursor)
+    result = await db.execute(q.limit(limit).offset(offset))
     return list(result.scalars().all())
 
 
@@ -450,19 +537,27 @@ async def create_settlement(
     )
     db.add(settlement)
     await db.flush()
+    deltas = {payee_id: amount}
+    _add_delta(deltas, payer_id, -amount)
+    await _apply_balance_deltas(db, group_id, deltas)
     await db.refresh(settlement)
     return settlement
 
 
 async def delete_settlement(db: AsyncSession, settlement_id: int) -> None:
-    """Hard delete settlement."""
-    result = await db.execute(select(Settlement).where(Settlement.id == settlement_id))
+    """Hard delete settlement and take it out of the members' balances."""
+    result = await db.execute(
+        select(Settlement).where(Settlement.id == settlement_id).with_for_update()
+    )
     settlement = result.scalar_one_or_none()
     if not settlement:
         raise NotFoundError(
             code="SETTLEMENT_NOT_FOUND", detail=f"Settlement {settlement_id} not found"
         )
 
+    deltas = {settlement.payee_id: -settlement.amount}
+    _add_delta(deltas, settlement.payer_id, settlement.amount)
+    await _apply_balance_deltas(db, settlement.group_id, deltas)
     await db.delete(settlement)
     await db.flush()
 
@@ -805,21 +900,12 @@ async def deactivate_recurring_expense(
     return await update_recurring_expense(db, recurring_expense_id, is_active=False)
 
 
-async def generate_expense_from_recurring(
+async def _materialize_recurring(
     db: AsyncSession,
-    recurring_expense_id: int,
+    recurring: RecurringExpense,
+    expense_date: datetime,
 ) -> Expense:
-    """Manually generate an expense from a recurring template."""
-    result = await db.execute(
-        select(RecurringExpense).where(RecurringExpense.id == recurring_expense_id)
-    )
-    recurring = result.scalar_one_or_none()
-    if not recurring:
-        raise NotFoundError(
-            code="RECURRING_EXPENSE_NOT_FOUND",
-            detail=f"Recurring expense {recurring_expense_id} not found",
-        )
-
+    """Create the expense for one occurrence and advance the template's next due date."""
     expense = await create_expense(
         db,
         group_id=recurring.group_id,
@@ -827,7 +913,7 @@ async def generate_expense_from_recurring(
         description=recurring.description,
         amount=recurring.amount,
         category_id=recurring.category_id,
-        expense_date=datetime.now(timezone.utc),
+        expense_date=expense_date,
         currency_code=recurring.currency_code,
     )
 
@@ -839,7 +925,25 @@ async def generate_expense_from_recurring(
         recurring.frequency_type,
         recurring.interval_value,
     )
+    return expense
+
+
+async def generate_expense_from_recurring(
+    db: AsyncSession,
+    recurring_expense_id: int,
+) -> Expense:
+    """Manually generate an expense from a recurring template."""
+    result = await db.execute(
+        select(RecurringExpense).where(RecurringExpense.id == recurring_expense_id)
+    )
+    recurring = result.scalar_one_or_none()
+    if not recurring:
+        raise NotFoundError(
+            code="RECURRING_EXPENSE_NOT_FOUND",
+            detail=f"Recurring expense {recurring_expense_id} not found",
+        )
 
+    expense = await _materialize_recurring(db, recurring, datetime.now(timezone.utc))
     await db.flush()
     
     # Reload expense with splits relationship loaded
@@ -852,6 +956,45 @@ async def generate_expense_from_recurring(
     return expense
 
 
+async def generate_due_recurring_expenses(
+    db: AsyncSession,
+    now: datetime,
+    limit: int = 500,
+) -> int:
+    """
+    Create the expenses of auto-creating templates that have come due (scheduled sweep).
+
+    Templates that are several periods behind get one expense per missed occurrence,
+    dated at its due date. At most `limit` expenses per call; returns how many were created.
+    """
+    due = now.replace(tzinfo=None)
+    result = await db.execute(
+        select(RecurringExpense)
+        .where(
+            RecurringExpense.is_active == True,
+            RecurringExpense.auto_create_expense == True,
+            RecurringExpense.next_due_date <= due,
+        )
+        .order_by(RecurringExpense.next_due_date, RecurringExpense.id)
+        .limit(limit)
+    )
+    created = 0
+    for recurring in result.scalars().all():
+        while (
+            created < limit
+            and recurring.next_due_date <= due
+            and (recurring.end_date is None or recurring.next_due_date <= recurring.end_date)
+        ):
+            await _materialize_recurring(db, recurring, recurring.next_due_date)
+            created += 1
+        if recurring.end_date is not None and recurring.next_due_date > recurring.end_date:
+            recurring.is_active = False
+        if created >= limit:
+            break
+    await db.flush()
+    return created
+
+
 async def list_split_presets(
     db: AsyncSession,
     group_id: int,
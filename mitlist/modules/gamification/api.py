@@ -5,7 +5,7 @@ from typing import List as ListType
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mitlist.api.deps import get_current_group_id, get_current_user, get_db, require_group_admin
+from mitlist.api.deps import get_current_group_id, get_current_user, get_db, get_read_db, require_group_admin
 from mitlist.modules.auth.models import User
 from mitlist.modules.gamification import schemas
 from mitlist.modules.gamification.interface import (
@@ -118,7 +118,7 @@ async def get_leaderboard_endpoint(
     metric: str = "POINTS",
     group_id: int = Depends(get_current_group_id),
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get group leaderboard."""
     from datetime import datetime
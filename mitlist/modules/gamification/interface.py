@@ -5,6 +5,7 @@ Other modules may ONLY import from this file (and schemas.py).
 Never import models or service directly from other modules.
 """
 
+from mitlist import events
 from mitlist.modules.gamification import schemas, service
 
 __all__ = [
@@ -46,3 +47,6 @@ record_activity = service.record_activity
 
 get_leaderboard = service.get_leaderboard
 get_user_gamification_summary = service.get_user_gamification_summary
+
+# Event subscribers
+events.subscribe("CHORE_COMPLETED")(service.on_chore_completed)
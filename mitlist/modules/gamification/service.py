@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from mitlist.core.errors import NotFoundError
+from mitlist.events import Event
 from mitlist.modules.gamification.models import (
     Achievement,
     Leaderboard,
@@ -372,3 +373,18 @@ async def get_user_gamification_summary(
         "longest_streak_ever": longest_streak_ever,
         "recent_achievements": achievements[:5],
     }
+
+
+# ---------- Event subscribers ----------
+async def on_chore_completed(db: AsyncSession, event: Event) -> None:
+    """Credit a completed chore: effort as points, the CHORES streak, achievements."""
+    user_id = event.payload["completed_by_id"]
+    await award_points(
+        db,
+        user_id,
+        event.group_id,
+        event.payload["effort_value"],
+        f"Chore completed: {event.payload['chore_name']}",
+    )
+    await record_activity(db, user_id, event.group_id, "CHORES")
+    await check_and_award_achievements(db, user_id, event.group_id)
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from mitlist.api.deps import get_current_group_id, get_current_user, get_db
 from mitlist.core.errors import NotFoundError
+from mitlist.idempotency import IdempotentRoute
 from mitlist.modules.auth.interface import require_member
 from mitlist.modules.auth.models import User
 from mitlist.modules.governance import schemas
@@ -24,7 +25,7 @@ from mitlist.modules.governance.interface import (
     update_proposal,
 )
 
-router = APIRouter(prefix="/proposals", tags=["governance"])
+router = APIRouter(prefix="/proposals", tags=["governance"], route_class=IdempotentRoute)
 
 
 @router.get("", response_model=ListType[schemas.ProposalResponse])
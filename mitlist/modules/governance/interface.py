@@ -23,6 +23,7 @@ __all__ = [
     # Closing/Execution
     "close_proposal",
     "execute_proposal",
+    "close_expired_proposals",
 ]
 
 list_proposals = service.list_proposals
@@ -38,3 +39,4 @@ cast_ranked_votes = service.cast_ranked_votes
 
 close_proposal = service.close_proposal
 execute_proposal = service.execute_proposal
+close_expired_proposals = service.close_expired_proposals
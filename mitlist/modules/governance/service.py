@@ -7,6 +7,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from mitlist import events
 from mitlist.core.errors import ConflictError, ForbiddenError, NotFoundError, ValidationError
 from mitlist.modules.auth.interface import require_member
 from mitlist.modules.governance.models import (
@@ -543,6 +544,13 @@ async def close_proposal(db: AsyncSession, proposal_id: int, closed_by_id: int)
     # Ensure user is a group member (and ideally admin or creator)
     await require_member(db, proposal.group_id, closed_by_id)
 
+    await _tally_and_close(db, proposal)
+    await db.refresh(proposal)
+    return proposal
+
+
+async def _tally_and_close(db: AsyncSession, proposal: Proposal) -> None:
+    """Tally an OPEN proposal's votes and set its final status and result."""
     # Get group size for quorum calculation
     from mitlist.modules.auth.models import UserGroup
 
@@ -606,10 +614,36 @@ async def close_proposal(db: AsyncSession, proposal_id: int, closed_by_id: int)
         "quorum_met": quorum_met,
         "group_size": group_size,
     }
+    events.emit(
+        db,
+        "PROPOSAL_CLOSED",
+        {
+            "proposal_id": proposal.id,
+            "title": proposal.title,
+            "status": str(final_status),
+            "winner_option_text": winner_option_text,
+        },
+        group_id=proposal.group_id,
+    )
 
     await db.flush()
-    await db.refresh(proposal)
-    return proposal
+
+
+async def close_expired_proposals(db: AsyncSession, now: datetime, limit: int = 500) -> int:
+    """Close OPEN proposals whose deadline has passed (scheduled sweep). Returns how many."""
+    result = await db.execute(
+        select(Proposal)
+        .where(
+            Proposal.status == ProposalStatus.OPEN,
+            Proposal.deadline_at <= now.replace(tzinfo=None),
+        )
+        .order_by(Proposal.deadline_at, Proposal.id)
+        .limit(limit)
+    )
+    proposals = list(result.scalars().all())
+    for proposal in proposals:
+        await _tally_and_close(db, proposal)
+    return len(proposals)
 
 
 async def execute_proposal(db: AsyncSession, proposal_id: int, executed_by_id: int) -> Proposal:
@@ -5,11 +5,14 @@ from typing import List as ListType
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from mitlist.api.conditional import ConditionalGet, get_conditional
 from mitlist.api.deps import get_current_group_id, get_db
 from mitlist.core.errors import NotFoundError, ValidationError
+from mitlist.idempotency import IdempotentRoute
 from mitlist.modules.lists import interface, schemas
+from mitlist.modules.lists.models import Item, List
 
-router = APIRouter(prefix="/lists", tags=["lists"])
+router = APIRouter(prefix="/lists", tags=["lists"], route_class=IdempotentRoute)
 inventory_router = APIRouter(prefix="/inventory", tags=["inventory"])
 
 
@@ -19,12 +22,16 @@ async def get_lists(
     db: AsyncSession = Depends(get_db),
     is_archived: bool | None = None,
     list_type: str | None = None,
+    conditional: ConditionalGet = Depends(get_conditional),
 ) -> ListType[schemas.ListResponse]:
     """
     Get all lists for a group.
 
-    Returns list directly (no envelope) per API contract.
+    Returns list directly (no envelope) per API contract. Supports If-None-Match.
     """
+    not_modified = await conditional.collection(db, List, List.group_id == group_id)
+    if not_modified is not None:
+        return not_modified
     lists = await interface.list_lists(db, group_id, is_archived=is_archived, list_type=list_type)
     return [schemas.ListResponse.model_validate(lst) for lst in lists]
 
@@ -34,12 +41,16 @@ async def get_list(
     list_id: int,
     group_id: int = Depends(get_current_group_id),
     db: AsyncSession = Depends(get_db),
+    conditional: ConditionalGet = Depends(get_conditional),
 ) -> schemas.ListResponse:
     """
     Get a single list by ID.
 
-    Returns list directly (no envelope) per API contract.
+    Returns list directly (no envelope) per API contract. Supports If-None-Match.
     """
+    not_modified = await conditional.row(db, List, list_id, List.group_id == group_id)
+    if not_modified is not None:
+        return not_modified
     list_obj = await interface.get_list_by_id(db, list_id, load_items=False)
     if not list_obj:
         raise NotFoundError(code="LIST_NOT_FOUND", detail=f"List {list_id} not found")
@@ -98,11 +109,15 @@ async def get_list_items(
     list_id: int,
     group_id: int = Depends(get_current_group_id),
     db: AsyncSession = Depends(get_db),
+    conditional: ConditionalGet = Depends(get_conditional),
 ) -> ListType[schemas.ItemResponse]:
-    """Get all items on a specific list."""
+    """Get all items on a specific list. Supports If-None-Match."""
     list_obj = await interface.get_list_by_id(db, list_id, load_items=False)
     if not list_obj or list_obj.group_id != group_id:
         raise NotFoundError(code="LIST_NOT_FOUND", detail=f"List {list_id} not found")
+    not_modified = await conditional.collection(db, Item, Item.list_id == list_id)
+    if not_modified is not None:
+        return not_modified
     items = await interface.get_items_by_list_id(db, list_id)
     return [schemas.ItemResponse.model_validate(i) for i in items]
 
@@ -2,12 +2,15 @@
 
 from typing import List as ListType
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mitlist.api.deps import get_current_user, get_db
+from mitlist.api.conditional import ConditionalGet, get_conditional
+from mitlist.api.deps import get_current_user, get_db, get_read_only_db
+from mitlist.core.pagination import NEXT_CURSOR_HEADER, next_cursor
 from mitlist.modules.auth.models import User
 from mitlist.modules.notifications import schemas
+from mitlist.modules.notifications.models import Notification
 from mitlist.modules.notifications.interface import (
     create_comment,
     delete_comment,
@@ -32,11 +35,24 @@ async def get_notifications(
     unread_only: bool = False,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_only_db),
+    conditional: ConditionalGet = Depends(get_conditional),
 ):
-    """List notifications for the current user."""
-    notifications = await list_notifications(db, user.id, unread_only=unread_only, limit=limit, offset=offset)
+    """
+    List notifications for the current user (offset or keyset `cursor` paging).
+
+    Supports If-None-Match: polling an unchanged inbox costs one aggregate query.
+    """
+    not_modified = await conditional.collection(
+        db, Notification, Notification.user_id == user.id
+    )
+    if not_modified is not None:
+        return not_modified
+    notifications = await list_notifications(
+        db, user.id, unread_only=unread_only, limit=limit, offset=offset, cursor=cursor
+    )
     unread = await get_unread_count(db, user.id)
     
     return schemas.NotificationListResponse(
@@ -44,6 +60,7 @@ async def get_notifications(
         total_count=len(notifications),
         unread_count=unread,
         has_more=len(notifications) == limit,
+        next_cursor=next_cursor(notifications, limit, "created_at"),
     )
 
 
@@ -72,7 +89,7 @@ async def post_notifications_clear(
 @router.get("/count", response_model=dict)
 async def get_notifications_count(
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_only_db),
 ):
     """Get unread notification count."""
     count = await get_unread_count(db, user.id)
@@ -115,12 +132,18 @@ comments_router = APIRouter(prefix="/comments", tags=["comments"])
 async def get_comments_list(
     parent_type: str,
     parent_id: int,
+    response: Response,
     limit: int = 100,
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_read_only_db),
 ):
-    """List comments for an entity."""
-    comments = await list_comments(db, parent_type, parent_id, limit=limit, offset=offset)
+    """List comments for an entity; next page cursor in X-Next-Cursor."""
+    comments = await list_comments(
+        db, parent_type, parent_id, limit=limit, offset=offset, cursor=cursor
+    )
+    if (cursor_out := next_cursor(comments, limit, "created_at")) is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_out
     
     # Build response with reaction counts
     result = []
@@ -5,6 +5,7 @@ Other modules may ONLY import from this file (and schemas.py).
 Never import models or service directly from other modules.
 """
 
+from mitlist import events
 from mitlist.modules.notifications import schemas, service
 
 __all__ = [
@@ -54,3 +55,7 @@ delete_comment = service.delete_comment
 get_reaction = service.get_reaction
 toggle_reaction = service.toggle_reaction
 list_reactions = service.list_reactions
+
+# Event subscribers
+events.subscribe("EXPENSE_CREATED")(service.on_expense_created)
+events.subscribe("PROPOSAL_CLOSED")(service.on_proposal_closed)
@@ -78,6 +78,11 @@ class Notification(BaseModel, TimestampMixin):
     read_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     delivered_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
 
+    # Bumped on every update so conditional GETs see writes that leave updated_at alone
+    version_id: Mapped[int] = mapped_column(nullable=False, default=1)
+
+    __mapper_args__ = {"version_id_col": version_id}
+
 
 class Comment(BaseModel, TimestampMixin):
     """Comment - comment on any entity."""
@@ -254,6 +254,7 @@ class NotificationListResponse(BaseModel):
     total_count: int
     unread_count: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 # Update forward reference
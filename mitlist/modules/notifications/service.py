@@ -8,6 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from mitlist.core.errors import ForbiddenError, NotFoundError
+from mitlist.events import Event
+from mitlist.core.pagination import apply_keyset
 from mitlist.modules.notifications.models import (
     Comment,
     Mention,
@@ -24,13 +26,14 @@ async def list_notifications(
     unread_only: bool = False,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> list[Notification]:
-    """List notifications for a user."""
+    """List notifications for a user, newest first (offset or keyset cursor)."""
     q = select(Notification).where(Notification.user_id == user_id)
     if unread_only:
         q = q.where(Notification.is_read == False)  # noqa: E712
-    q = q.order_by(Notification.created_at.desc()).limit(limit).offset(offset)
-    result = await db.execute(q)
+    q = apply_keyset(q, Notification.created_at, Notification.id, cursor)
+    result = await db.execute(q.limit(limit).offset(offset))
     return list(result.scalars().all())
 
 
@@ -110,7 +113,11 @@ async def mark_all_read(db: AsyncSession, user_id: int, group_id: Optional[int]
     q = (
         update(Notification)
         .where(Notification.user_id == user_id, Notification.is_read == False)  # noqa: E712
-        .values(is_read=True, read_at=datetime.now(timezone.utc))
+        .values(
+            is_read=True,
+            read_at=datetime.now(timezone.utc),
+            version_id=Notification.version_id + 1,
+        )
     )
     if group_id is not None:
         q = q.where(Notification.group_id == group_id)
@@ -193,9 +200,10 @@ async def list_comments(
     parent_id: int,
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ) -> list[Comment]:
-    """List comments for an entity."""
-    result = await db.execute(
+    """List comments for an entity, oldest first (offset or keyset cursor)."""
+    q = (
         select(Comment)
         .where(
             Comment.parent_type == parent_type,
@@ -203,10 +211,9 @@ async def list_comments(
             Comment.deleted_at.is_(None),
         )
         .options(selectinload(Comment.mentions), selectinload(Comment.reactions))
-        .order_by(Comment.created_at.asc())
-        .limit(limit)
-        .offset(offset)
     )
+    q = apply_keyset(q, Comment.created_at, Comment.id, cursor, descending=False)
+    result = await db.execute(q.limit(limit).offset(offset))
     return list(result.scalars().all())
 
 
@@ -344,3 +351,55 @@ async def list_reactions(
         )
     )
     return list(result.scalars().all())
+
+
+# ---------- Event subscribers ----------
+async def on_expense_created(db: AsyncSession, event: Event) -> None:
+    """Tell the expense's participants (other than the payer) that they owe a share."""
+    payer = event.payload["paid_by_user_id"]
+    await create_notifications_bulk(
+        db,
+        [
+            {
+                "user_id": user_id,
+                "group_id": event.group_id,
+                "type": "EXPENSE_ADDED",
+                "title": f"New expense: {event.payload['description']}",
+                "body": (
+                    f"{event.payload['amount']} {event.payload['currency_code']} "
+                    "was added and split with you."
+                ),
+                "link_url": f"/expenses/{event.payload['expense_id']}",
+            }
+            for user_id in dict.fromkeys(event.payload["participant_user_ids"])
+            if user_id != payer
+        ],
+    )
+
+
+async def on_proposal_closed(db: AsyncSession, event: Event) -> None:
+    """Tell the group's current members how a proposal ended."""
+    from mitlist.modules.auth.models import UserGroup
+
+    result = await db.execute(
+        select(UserGroup.user_id).where(
+            UserGroup.group_id == event.group_id, UserGroup.left_at.is_(None)
+        )
+    )
+    outcome = event.payload["status"].lower()
+    if event.payload["winner_option_text"]:
+        outcome += f": {event.payload['winner_option_text']}"
+    await create_notifications_bulk(
+        db,
+        [
+            {
+                "user_id": user_id,
+                "group_id": event.group_id,
+                "type": "PROPOSAL_CLOSED",
+                "title": f"Vote closed: {event.payload['title']}",
+                "body": f"The proposal was {outcome}.",
+                "link_url": f"/proposals/{event.payload['proposal_id']}",
+            }
+            for user_id in result.scalars().all()
+        ],
+    )
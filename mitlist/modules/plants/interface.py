@@ -23,6 +23,7 @@ __all__ = [
     "create_schedule",
     "mark_schedule_done",
     "get_overdue_schedules",
+    "remind_due_schedules",
 ]
 
 list_species = service.list_species
@@ -43,3 +44,4 @@ list_plant_schedules = service.list_plant_schedules
 create_schedule = service.create_schedule
 mark_schedule_done = service.mark_schedule_done
 get_overdue_schedules = service.get_overdue_schedules
+remind_due_schedules = service.remind_due_schedules
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from mitlist.core.errors import NotFoundError, ValidationError
+from mitlist.core.pagination import apply_keyset, next_cursor
 from mitlist.modules.plants.models import (
     Plant,
     PlantLog,
@@ -322,3 +323,70 @@ async def get_overdue_schedules(db: AsyncSession, group_id: int) -> list[PlantSc
         .order_by(PlantSchedule.next_due_date)
     )
     return list(result.scalars().all())
+
+
+async def remind_due_schedules(
+    db: AsyncSession,
+    since: datetime,
+    until: datetime,
+    limit: int = 500,
+    cursor: Optional[str] = None,
+) -> tuple[int, Optional[str]]:
+    """
+    Notify about schedules that came due in (since, until] (scheduled sweep).
+
+    The assignee is notified, or every current group member when nobody is assigned.
+    At most `limit` schedules per call, in due order, resuming after `cursor`. Returns
+    how many schedules were processed and the cursor of the next page (None when done).
+    """
+    from mitlist.modules.auth.models import UserGroup
+    from mitlist.modules.notifications.interface import create_notifications_bulk
+
+    q = (
+        select(
+            PlantSchedule.id,
+            PlantSchedule.next_due_date,
+            PlantSchedule.action_type,
+            PlantSchedule.assigned_to_id,
+            Plant,
+        )
+        .join(Plant, Plant.id == PlantSchedule.plant_id)
+        .where(
+            Plant.is_alive.is_(True),
+            PlantSchedule.next_due_date > since.replace(tzinfo=None),
+            PlantSchedule.next_due_date <= until.replace(tzinfo=None),
+        )
+        .options(selectinload(Plant.species))
+    )
+    q = apply_keyset(q, PlantSchedule.next_due_date, PlantSchedule.id, cursor, descending=False)
+    due = (await db.execute(q.limit(limit))).all()
+    if not due:
+        return 0, None
+
+    unassigned_groups = {row.Plant.group_id for row in due if row.assigned_to_id is None}
+    members: dict[int, list[int]] = {}
+    if unassigned_groups:
+        rows = await db.execute(
+            select(UserGroup.group_id, UserGroup.user_id).where(
+                UserGroup.group_id.in_(unassigned_groups), UserGroup.left_at.is_(None)
+            )
+        )
+        for group_id, user_id in rows:
+            members.setdefault(group_id, []).append(user_id)
+
+    notifications_data = []
+    for _, _, action_type, assignee, plant in due:
+        name = plant.nickname or plant.species.common_name or plant.species.scientific_name
+        for user_id in [assignee] if assignee is not None else members.get(plant.group_id, []):
+            notifications_data.append(
+                {
+                    "user_id": user_id,
+                    "group_id": plant.group_id,
+                    "type": "PLANT_CARE_DUE",
+                    "title": f"{name}: {action_type.lower()} due",
+                    "body": f"{action_type.capitalize()} is due for {name}.",
+                    "link_url": f"/plants/{plant.id}",
+                }
+            )
+    await create_notifications_bulk(db, notifications_data)
+    return len(due), next_cursor(due, limit, "next_due_date")
@@ -6,26 +6,31 @@ from typing import List as ListType
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mitlist.api.deps import get_current_group_id, get_current_user, get_db
+from mitlist.api.deps import get_current_group_id, get_current_user, get_db, get_read_only_db
 from mitlist.core.errors import NotFoundError
+from mitlist.core.serialization import FastJSONResponse, ORMSerializer
 from mitlist.modules.auth.interface import require_member
 from mitlist.modules.auth.models import User
 from mitlist.modules.recipes import schemas, service
 
 router = APIRouter(tags=["recipes", "content"])
 
+_recipe_serializer = ORMSerializer(schemas.RecipeResponse)
 
-@router.get("/recipes", response_model=ListType[schemas.RecipeResponse])
+
+@router.get(
+    "/recipes",
+    response_model=ListType[schemas.RecipeResponse],
+    response_class=FastJSONResponse,
+)
 async def get_recipes(
     group_id: int = Depends(get_current_group_id),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_only_db),
     cuisine_type: str | None = None,
     difficulty: str | None = None,
     is_favorite: bool | None = None,
 ):
     """List recipes for the current group."""
-    await require_member(db, group_id, user.id)
     recipes = await service.list_recipes(
         db,
         group_id,
@@ -33,7 +38,8 @@ async def get_recipes(
         difficulty=difficulty,
         is_favorite=is_favorite,
     )
-    return [schemas.RecipeResponse.model_validate(r) for r in recipes]
+    # Trusted ORM rows with ingredients/steps eager-loaded: serialize straight to bytes.
+    return FastJSONResponse(_recipe_serializer.dump(recipes))
 
 
 @router.post("/recipes", response_model=schemas.RecipeResponse, status_code=status.HTTP_201_CREATED)
@@ -83,13 +89,10 @@ async def get_recipe(
 @router.get("/meal-plans", response_model=schemas.WeeklyMealPlanResponse)
 async def get_meal_plans(
     group_id: int = Depends(get_current_group_id),
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_only_db),
     week_start: date | None = Query(None, description="Start of week (defaults to current week)"),
 ):
     """Get weekly meal plans for the current group."""
-    await require_member(db, group_id, user.id)
-
     # Default to current week start (Monday)
     if week_start is None:
         today = date.today()
@@ -0,0 +1 @@
+"""Performance tooling: load generator and benchmarks over seeded data (mitlist.db.seed)."""
@@ -0,0 +1,372 @@
+"""Service-layer microbenchmarks over seeded datasets of increasing size.
+
+Each benchmark calls one hot service function the way the API does (own session,
+target group from the dataset) and is timed per call. Every tier is a fresh dataset
+from `mitlist.db.seed` (temporary SQLite files by default), so medians per tier give a
+scaling curve; `growth` is the log-log slope of median time against dataset rows
+between the smallest and largest tier (1.0 = linear).
+
+Writes are never kept: each call runs in its own transaction, rolled back afterwards.
+
+Regression gate: `--check` compares the fastest call per benchmark and tier (noise only
+ever adds time) with a stored baseline (default mitlist/perf/baseline.json) and exits 1
+when one is slower by more than `--tolerance` and by more than `--min-delta-ms`
+(flagged entries are re-timed once first, keeping the faster run). Each
+measurement records the time of a fixed pure-Python calibration workload run around it,
+and baseline timings are scaled by the ratio, so a baseline from a faster or slower
+machine (or a noisy phase of the same one) still compares roughly like-for-like.
+
+Usage:
+    python -m mitlist.perf.bench --output bench.json
+    python -m mitlist.perf.bench --check                 # CI gate
+    python -m mitlist.perf.bench --save-baseline         # after an intended change
+    python -m mitlist.perf.bench --tiers small --only finance.calculate_group_balances
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from mitlist.db.seed import SeedConfig, seed
+from mitlist.modules.auth.models import UserGroup
+from mitlist.modules.calendar import service as calendar_service
+from mitlist.modules.chores import service as chores_service
+from mitlist.modules.finance import service as finance_service
+from mitlist.modules.finance.models import Expense
+from mitlist.modules.gamification import service as gamification_service
+from mitlist.modules.governance import service as governance_service
+from mitlist.modules.governance.models import Proposal, VoteRecord
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+# Per-group volume grows with members and history; the group count stays small because
+# every benchmarked function is group-scoped.
+_END = date(2026, 1, 1)
+TIERS: dict[str, SeedConfig] = {
+    "small": SeedConfig(groups=2, members_min=4, members_max=4, years=0.5, end_date=_END),
+    "medium": SeedConfig(groups=2, members_min=8, members_max=8, years=1.5, end_date=_END),
+    "large": SeedConfig(groups=2, members_min=12, members_max=12, years=3.0, end_date=_END),
+}
+
+
+@dataclass
+class Context:
+    """Benchmark targets in a dataset: its busiest group, a member, a ranked proposal."""
+
+    group_id: int
+    user_id: int
+    group_size: int
+    proposal_id: Optional[int]
+    end_date: date
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # Untimed: load whatever the call needs (e.g. ORM objects) in the same session.
+    setup: Callable[[AsyncSession, Context], Awaitable[tuple]]
+    # Timed.
+    call: Callable[..., Awaitable[Any]]
+
+
+async def _no_setup(db: AsyncSession, ctx: Context) -> tuple:
+    return ()
+
+
+async def _ranked_choice_setup(db: AsyncSession, ctx: Context) -> tuple:
+    proposal = await db.get(Proposal, ctx.proposal_id)
+    voters = await db.scalar(
+        select(func.count(func.distinct(VoteRecord.user_id))).where(
+            VoteRecord.proposal_id == ctx.proposal_id
+        )
+    )
+    return (proposal, voters, ctx.group_size)
+
+
+BENCHMARKS = {
+    b.name: b
+    for b in (
+        Benchmark(
+            "finance.calculate_group_balances",
+            _no_setup,
+            lambda db, ctx: finance_service.calculate_group_balances(db, ctx.group_id),
+        ),
+        Benchmark(
+            "chores.get_leaderboard",
+            _no_setup,
+            lambda db, ctx: chores_service.get_leaderboard(db, ctx.group_id),
+        ),
+        Benchmark(
+            "governance._tally_ranked_choice",
+            _ranked_choice_setup,
+            lambda db, ctx, proposal, voters, size: governance_service._tally_ranked_choice(
+                db, proposal, voters, size
+            ),
+        ),
+        Benchmark(
+            "calendar.get_calendar_feed",
+            _no_setup,
+            lambda db, ctx: calendar_service.get_calendar_feed(
+                db, ctx.group_id, ctx.end_date, ctx.end_date + timedelta(days=31)
+            ),
+        ),
+        Benchmark(
+            "gamification.check_and_award_achievements",
+            _no_setup,
+            lambda db, ctx: gamification_service.check_and_award_achievements(
+                db, ctx.user_id, ctx.group_id
+            ),
+        ),
+    )
+}
+
+
+async def load_context(engine: AsyncEngine, end_date: date) -> Context:
+    """Pick the group with the most expenses, its first member and busiest ranked proposal."""
+    async with AsyncSession(engine) as db:
+        group_id = await db.scalar(
+            select(Expense.group_id)
+            .group_by(Expense.group_id)
+            .order_by(func.count(Expense.id).desc(), Expense.group_id)
+            .limit(1)
+        )
+        members = list(
+            await db.scalars(
+                select(UserGroup.user_id)
+                .where(UserGroup.group_id == group_id, UserGroup.left_at.is_(None))
+                .order_by(UserGroup.id)
+            )
+        )
+        proposal_id = await db.scalar(
+            select(Proposal.id)
+            .join(VoteRecord, VoteRecord.proposal_id == Proposal.id)
+            .where(Proposal.group_id == group_id, Proposal.strategy == "RANKED_CHOICE")
+            .group_by(Proposal.id)
+            .order_by(func.count(VoteRecord.id).desc(), Proposal.id)
+            .limit(1)
+        )
+    return Context(group_id, members[0], len(members), proposal_id, end_date)
+
+
+async def time_benchmark(
+    engine: AsyncEngine, bench: Benchmark, ctx: Context, rounds: int, warmup: int
+) -> list[float]:
+    """Seconds per call for `rounds` calls, after `warmup` untimed ones."""
+    timings = []
+    for i in range(warmup + rounds):
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            args = await bench.setup(db, ctx)
+            started = time.perf_counter()
+            await bench.call(db, ctx, *args)
+            elapsed = time.perf_counter() - started
+            await db.rollback()
+        if i >= warmup:
+            timings.append(elapsed)
+    return timings
+
+
+def calibrate(repeats: int = 20) -> float:
+    """
+    Milliseconds for a fixed pure-Python workload: the machine-speed yardstick.
+
+    Best of many short runs, since the minimum is what is least affected by other load.
+    """
+    best = math.inf
+    for _ in range(repeats):
+        started = time.perf_counter()
+        data = [(i * 7919) % 10007 for i in range(50_000)]
+        totals: dict[int, int] = {}
+        for value in sorted(data):
+            totals[value % 97] = totals.get(value % 97, 0) + value
+        best = min(best, time.perf_counter() - started)
+    return round(best * 1000, 3)
+
+
+def _stats(timings: list[float]) -> dict[str, float]:
+    ordered = sorted(timings)
+    return {
+        "median_ms": round(statistics.median(ordered) * 1000, 4),
+        "min_ms": round(ordered[0] * 1000, 4),
+        "p95_ms": round(ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)] * 1000, 4),
+    }
+
+
+def _growth(points: list[tuple[int, float]]) -> Optional[float]:
+    """Log-log slope between the smallest and largest dataset (1.0 = linear in rows)."""
+    if len(points) < 2:
+        return None
+    (rows_lo, ms_lo), (rows_hi, ms_hi) = min(points), max(points)
+    if rows_hi <= rows_lo or ms_lo <= 0 or ms_hi <= 0:
+        return None
+    return round(math.log(ms_hi / ms_lo) / math.log(rows_hi / rows_lo), 3)
+
+
+async def run_suite(
+    tiers: dict[str, SeedConfig],
+    benchmarks: list[Benchmark],
+    rounds: int = 20,
+    warmup: int = 3,
+    database_url: Optional[str] = None,
+) -> dict[str, Any]:
+    """Seed every tier, time every benchmark on it, and build the report."""
+    results: dict[str, dict[str, Any]] = {b.name: {"tiers": {}} for b in benchmarks}
+    datasets = {}
+    with tempfile.TemporaryDirectory(prefix="mitlist-bench-") as tmp:
+        for tier, cfg in tiers.items():
+            if database_url:
+                url = database_url.format(tier=tier)
+            else:
+                url = f"sqlite+aiosqlite:///{Path(tmp) / f'{tier}.db'}"
+            engine = create_async_engine(url)
+            try:
+                counts = await seed(engine, cfg, create_schema=True)
+                ctx = await load_context(engine, cfg.end_date)
+                datasets[tier] = {"rows": sum(counts.values()), "group_size": ctx.group_size}
+                for bench in benchmarks:
+                    if bench.setup is _ranked_choice_setup and ctx.proposal_id is None:
+                        continue
+                    # Calibrated right before timing: this machine's speed at that moment.
+                    calibration = calibrate()
+                    timings = await time_benchmark(engine, bench, ctx, rounds, warmup)
+                    stats = _stats(timings)
+                    stats["calibration_ms"] = min(calibration, calibrate())
+                    results[bench.name]["tiers"][tier] = stats
+            finally:
+                await engine.dispose()
+
+    for result in results.values():
+        points = [(datasets[t]["rows"], s["median_ms"]) for t, s in result["tiers"].items()]
+        result["growth"] = _growth(points)
+    return {
+        "rounds": rounds,
+        "datasets": datasets,
+        "benchmarks": results,
+    }
+
+
+def check(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    tolerance: float = 0.3,
+    min_delta_ms: float = 1.0,
+) -> list[str]:
+    """Regressions of `current` against `baseline` (min_ms, scaled by calibration ratios)."""
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        old_tiers = baseline["benchmarks"].get(name, {}).get("tiers", {})
+        for tier, stats in result["tiers"].items():
+            if tier not in old_tiers:
+                continue
+            old = old_tiers[tier]
+            expected = old["min_ms"] * stats["calibration_ms"] / old["calibration_ms"]
+            actual = stats["min_ms"]
+            if actual > expected * (1 + tolerance) and actual - expected > min_delta_ms:
+                regressions.append(
+                    f"{name} [{tier}]: {actual:.3f} ms vs baseline {expected:.3f} ms "
+                    f"(+{(actual / expected - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def _flagged(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float, min_delta_ms: float
+) -> dict[str, set[str]]:
+    """Benchmark name -> tiers that `check` reports as regressed."""
+    flagged: dict[str, set[str]] = {}
+    for name, result in current["benchmarks"].items():
+        for tier in result["tiers"]:
+            single = {"benchmarks": {name: {"tiers": {tier: result["tiers"][tier]}}}}
+            if check(baseline, single, tolerance, min_delta_ms):
+                flagged.setdefault(name, set()).add(tier)
+    return flagged
+
+
+def _keep_faster(current: dict[str, Any], retry: dict[str, Any]) -> None:
+    """Take `retry`'s stats where they are faster relative to calibration."""
+    for name, result in retry["benchmarks"].items():
+        for tier, stats in result["tiers"].items():
+            old = current["benchmarks"][name]["tiers"][tier]
+            if stats["min_ms"] / stats["calibration_ms"] < old["min_ms"] / old["calibration_ms"]:
+                current["benchmarks"][name]["tiers"][tier] = stats
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m mitlist.perf.bench", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("--tiers", default=",".join(TIERS), help="Comma-separated tier names")
+    parser.add_argument("--only", help="Comma-separated benchmark names")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument(
+        "--database-url",
+        help="URL template with {tier} (empty databases, e.g. Postgres); default temp SQLite",
+    )
+    parser.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    parser.add_argument(
+        "--check", nargs="?", const=str(DEFAULT_BASELINE), help="Baseline to gate on"
+    )
+    parser.add_argument("--save-baseline", nargs="?", const=str(DEFAULT_BASELINE))
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument("--min-delta-ms", type=float, default=1.0)
+    return parser
+
+
+async def _main(argv: Optional[list[str]] = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.database_url and "{tier}" not in args.database_url:
+        parser.error("--database-url must contain {tier}")
+    tiers = {name: TIERS[name] for name in args.tiers.split(",")}
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    benchmarks = [BENCHMARKS[name] for name in names]
+    rounds = max(1, args.rounds)
+
+    report = await run_suite(tiers, benchmarks, rounds, args.warmup, args.database_url)
+    if args.check:
+        # A single slow phase on a shared machine looks like a regression; re-time what was
+        # flagged once and keep the faster measurement before failing.
+        baseline = json.loads(Path(args.check).read_text())
+        flagged = _flagged(baseline, report, args.tolerance, args.min_delta_ms)
+        for tier in sorted({t for ts in flagged.values() for t in ts}):
+            retry = await run_suite(
+                {tier: tiers[tier]},
+                [BENCHMARKS[name] for name, ts in flagged.items() if tier in ts],
+                rounds,
+                args.warmup,
+                args.database_url,
+            )
+            _keep_faster(report, retry)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(text + "\n")
+        print(f"Baseline written to {args.save_baseline}", file=sys.stderr)
+    if args.check:
+        regressions = check(baseline, report, args.tolerance, args.min_delta_ms)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions against the baseline", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main()))
@@ -0,0 +1,363 @@
+"""HTTP load generator with a weighted scenario mix and per-route latency percentiles.
+
+Drives the API as real group members: actors are (user, group) memberships read from
+the database (typically a dataset from `python -m mitlist.db.seed`) and authenticate
+with dev tokens (`Bearer dev:<email>`, DEV_TEST_USER_ENABLED). Each of `--concurrency`
+workers loops for `--duration` seconds (closed loop: next request as soon as the last
+one finished), picking an actor and a scenario by weight. Requests during the first
+`--warmup` seconds are not recorded.
+
+Targets:
+    in-process    mitlist.main.app through httpx.ASGITransport (no sockets; the app's
+                  lifespan runs and DEV_TEST_USER_ENABLED is switched on)
+    http://...    a running server (uvicorn/gunicorn), which must have
+                  DEV_TEST_USER_ENABLED=true
+
+The report is JSON (throughput, p50/p95/p99 per route, status counts, commit), so runs
+can be diffed across commits; `--baseline old.json` prints the p95/throughput change.
+
+Note: complete_chore writes (it completes seeded PENDING assignments); re-seed between
+runs when comparing numbers.
+
+Usage:
+    python -m mitlist.perf.loadtest --concurrency 32 --duration 30 --output run.json
+    python -m mitlist.perf.loadtest --target http://localhost:8000 --mix balances=1,unread_count=3
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Callable, Optional
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from mitlist.modules.auth.models import User, UserGroup
+from mitlist.modules.chores.models import Chore, ChoreAssignment
+
+
+@dataclass
+class Actor:
+    """A group member the workers act as."""
+
+    user_id: int
+    group_id: int
+    email: str
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer dev:{self.email}", "X-Group-ID": str(self.group_id)}
+
+
+@dataclass
+class Fixtures:
+    actors: list[Actor]
+    # group_id -> PENDING assignment ids still available to complete
+    pending_assignments: dict[int, list[int]] = field(default_factory=dict)
+
+
+@dataclass
+class Call:
+    method: str
+    url: str
+    route: str
+    json: Optional[dict[str, Any]] = None
+
+
+@dataclass
+class Scenario:
+    name: str
+    weight: float
+    build: Callable[[Actor, Fixtures], Optional[Call]]
+
+
+def _list_expenses(actor: Actor, fixtures: Fixtures) -> Call:
+    return Call("GET", "/api/v1/expenses?limit=50", "GET /api/v1/expenses")
+
+
+def _balances(actor: Actor, fixtures: Fixtures) -> Call:
+    return Call("GET", "/api/v1/balances", "GET /api/v1/balances")
+
+
+def _complete_chore(actor: Actor, fixtures: Fixtures) -> Optional[Call]:
+    pending = fixtures.pending_assignments.get(actor.group_id)
+    if not pending:
+        return None
+    return Call(
+        "PATCH",
+        f"/api/v1/chores/assignments/{pending.pop()}/complete",
+        "PATCH /api/v1/chores/assignments/{assignment_id}/complete",
+        json={"actual_duration_minutes": 15},
+    )
+
+
+def _calendar_feed(actor: Actor, fixtures: Fixtures) -> Call:
+    return Call("GET", "/api/v1/calendar/feed", "GET /api/v1/calendar/feed")
+
+
+def _unread_count(actor: Actor, fixtures: Fixtures) -> Call:
+    return Call("GET", "/api/v1/notifications/count", "GET /api/v1/notifications/count")
+
+
+# Default mix: read-heavy, roughly what the mobile client does on app open / refresh.
+SCENARIOS = {
+    s.name: s
+    for s in (
+        Scenario("list_expenses", 25, _list_expenses),
+        Scenario("balances", 20, _balances),
+        Scenario("complete_chore", 5, _complete_chore),
+        Scenario("calendar_feed", 15, _calendar_feed),
+        Scenario("unread_count", 35, _unread_count),
+    )
+}
+
+
+async def load_fixtures(
+    engine: AsyncEngine, max_actors: int = 500, assignments_per_group: int = 200
+) -> Fixtures:
+    """Pick active memberships as actors, and each of their groups' pending assignments."""
+    async with engine.connect() as conn:
+        rows = (
+            await conn.execute(
+                select(UserGroup.user_id, UserGroup.group_id, User.email)
+                .join(User, User.id == UserGroup.user_id)
+                .where(UserGroup.left_at.is_(None), User.is_active.is_(True))
+                .order_by(UserGroup.id)
+                .limit(max_actors)
+            )
+        ).all()
+        actors = [Actor(user_id, group_id, email) for user_id, group_id, email in rows]
+        pending: dict[int, list[int]] = {}
+        for group_id in {a.group_id for a in actors}:
+            pending[group_id] = list(
+                (
+                    await conn.execute(
+                        select(ChoreAssignment.id)
+                        .join(Chore, Chore.id == ChoreAssignment.chore_id)
+                        .where(Chore.group_id == group_id, ChoreAssignment.status == "PENDING")
+                        .order_by(ChoreAssignment.id)
+                        .limit(assignments_per_group)
+                    )
+                ).scalars()
+            )
+    if not actors:
+        raise SystemExit("No group memberships found; seed data first (python -m mitlist.db.seed)")
+    return Fixtures(actors, pending)
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, round(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _summary(latencies: list[float], errors: int, seconds: float) -> dict[str, Any]:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / seconds, 2) if seconds else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(_percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(_percentile(ordered, 99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+    }
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def record(self, route: str, status: str, seconds: float) -> None:
+        self.latencies[route].append(seconds)
+        self.statuses[route][status] += 1
+        if not status.isdigit() or int(status) >= 400:
+            self.errors[route] += 1
+
+    def report(self, seconds: float) -> dict[str, Any]:
+        everything = [x for values in self.latencies.values() for x in values]
+        routes = {}
+        for route in sorted(self.latencies):
+            routes[route] = _summary(self.latencies[route], self.errors[route], seconds)
+            routes[route]["status"] = dict(sorted(self.statuses[route].items()))
+        return {"total": _summary(everything, sum(self.errors.values()), seconds), "routes": routes}
+
+
+async def run(
+    client: httpx.AsyncClient,
+    fixtures: Fixtures,
+    scenarios: list[Scenario],
+    concurrency: int = 16,
+    duration: float = 30.0,
+    warmup: float = 0.0,
+    seed: int = 1,
+) -> dict[str, Any]:
+    """Run the closed-loop load and return the report's measurements."""
+    recorder = _Recorder()
+    started = time.perf_counter()
+    measure_from = started + warmup
+    deadline = measure_from + duration
+    weights = [s.weight for s in scenarios]
+
+    async def worker(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        while (now := time.perf_counter()) < deadline:
+            actor = rng.choice(fixtures.actors)
+            call = rng.choices(scenarios, weights)[0].build(actor, fixtures)
+            if call is None:  # e.g. no pending assignment left in the actor's group
+                await asyncio.sleep(0)
+                continue
+            try:
+                response = await client.request(
+                    call.method, call.url, headers=actor.headers, json=call.json
+                )
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            finished = time.perf_counter()
+            if now >= measure_from:
+                recorder.record(call.route, status, finished - now)
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    measured = time.perf_counter() - measure_from
+    return {"duration_s": round(measured, 3), **recorder.report(measured)}
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> dict[str, dict[str, float]]:
+    """Relative change (current / baseline - 1) of p95 and throughput per route."""
+    changes = {}
+    pairs = [("total", baseline["total"], current["total"])]
+    pairs += [
+        (r, baseline["routes"][r], s)
+        for r, s in current["routes"].items()
+        if r in baseline["routes"]
+    ]
+    for name, old, new in pairs:
+        changes[name] = {
+            key: round(new[key] / old[key] - 1, 4) if old[key] else 0.0 for key in ("p95_ms", "rps")
+        }
+    return changes
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _parse_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r} ({', '.join(SCENARIOS)})")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m mitlist.perf.loadtest", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("--target", default="in-process", help="in-process or a base URL")
+    parser.add_argument(
+        "--database-url", help="Read actors from here (http targets; default: configured DB)"
+    )
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Unrecorded seconds first")
+    parser.add_argument("--mix", type=_parse_mix, help="e.g. balances=2,unread_count=5")
+    parser.add_argument("--max-actors", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", help="Earlier JSON report to compare against")
+    return parser
+
+
+async def _main(argv: Optional[list[str]] = None) -> None:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.target == "in-process" and args.database_url:
+        parser.error("in-process runs against the configured database; drop --database-url")
+    mix = args.mix or {name: s.weight for name, s in SCENARIOS.items()}
+    scenarios = [Scenario(name, weight, SCENARIOS[name].build) for name, weight in mix.items()]
+
+    if args.database_url:
+        engine = create_async_engine(args.database_url)
+    else:
+        from mitlist.db.engine import engine
+    fixtures = await load_fixtures(engine, args.max_actors)
+    if args.database_url:
+        await engine.dispose()
+
+    options = dict(
+        concurrency=args.concurrency, duration=args.duration, warmup=args.warmup, seed=args.seed
+    )
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    if args.target == "in-process":
+        from mitlist.core.config import settings
+        from mitlist.main import app
+
+        settings.DEV_TEST_USER_ENABLED = True
+        # Background sweeps would write to the dataset mid-run and skew the numbers
+        settings.SCHEDULER_ENABLED = False
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+                result = await run(client, fixtures, scenarios, **options)
+    else:
+        async with httpx.AsyncClient(base_url=args.target, limits=limits, timeout=30.0) as client:
+            result = await run(client, fixtures, scenarios, **options)
+
+    report = {
+        "target": args.target,
+        "commit": _git_commit(),
+        "started_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "concurrency": args.concurrency,
+        "warmup_s": args.warmup,
+        "actors": len(fixtures.actors),
+        "mix": mix,
+        **result,
+    }
+    if args.baseline:
+        with open(args.baseline) as f:
+            report["vs_baseline"] = compare(json.load(f), report)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+        total = report["total"]
+        print(
+            f"{total['requests']} requests, {total['rps']} req/s, "
+            f"p50 {total['p50_ms']}ms p95 {total['p95_ms']}ms p99 {total['p99_ms']}ms, "
+            f"{total['errors']} errors -> {args.output}",
+            file=sys.stderr,
+        )
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -95,6 +95,7 @@ async def client(app_instance: FastAPI, db_session: AsyncSession) -> AsyncGenera
         yield db_session
 
     app_instance.dependency_overrides[deps.get_db] = override_get_db
+    app_instance.dependency_overrides[deps.get_read_only_db] = override_get_db
     
     # We use http://test as base URL for httpx
     transport = ASGITransport(app=app_instance)
@@ -1,17 +1,24 @@
 """Pytest fixtures for testing."""
 
 import asyncio
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
 
-from mitlist.db.base import Base
+from mitlist.db.base import Base, import_all_models
+from mitlist.db.instrumentation import QueryStats, track_queries
 from mitlist.main import app
 from mitlist.modules.auth.models import Group, User, UserGroup
 from mitlist.modules.finance.models import Category
@@ -48,6 +55,60 @@ async def db(engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+@pytest.fixture
+async def file_engine(tmp_path) -> AsyncGenerator[AsyncEngine, None]:
+    """
+    File-backed database with the full schema, for tests that commit.
+
+    Unlike the shared in-memory engine, every session gets its own connection, so
+    concurrent requests, separate transactions and connection checkouts behave as
+    they do against Postgres.
+    """
+    import_all_models()
+    test_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield test_engine
+    await test_engine.dispose()
+
+
+@pytest.fixture
+def session_factory(file_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Session factory on `file_engine`."""
+    return async_sessionmaker(file_engine, expire_on_commit=False)
+
+
+@pytest.fixture
+async def household(session_factory: async_sessionmaker[AsyncSession]) -> tuple[User, Group]:
+    """
+    Committed owner (id 1) and their group (id 1) in `session_factory`'s database.
+
+    The owner is already linked to the subject of the dev token `dev:owner@example.test`.
+    """
+    async with session_factory() as db:
+        owner = User(
+            email="owner@example.test",
+            hashed_password="x",
+            name="Owner",
+            preferences={"zitadel_sub": "dev-owner-at-example.test"},
+        )
+        db.add(owner)
+        await db.flush()
+        group = Group(name="Home", created_by_id=owner.id)
+        db.add(group)
+        await db.flush()
+        db.add(
+            UserGroup(
+                user_id=owner.id,
+                group_id=group.id,
+                role="ADMIN",
+                joined_at=datetime.now(timezone.utc),
+            )
+        )
+        await db.commit()
+    return owner, group
+
+
 @pytest.fixture
 async def test_user(db: AsyncSession) -> User:
     """Create test user."""
@@ -131,9 +192,10 @@ async def client(db: AsyncSession, test_user: User) -> AsyncGenerator[AsyncClien
     async def override_get_current_user():
         return test_user
 
-    from mitlist.api.deps import get_current_user, get_db
+    from mitlist.api.deps import get_current_user, get_db, get_read_only_db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_only_db] = override_get_db
     app.dependency_overrides[get_current_user] = override_get_current_user
 
     async with AsyncClient(
@@ -144,3 +206,23 @@ async def client(db: AsyncSession, test_user: User) -> AsyncGenerator[AsyncClien
         yield ac
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Assert that a block issues at most `max_queries` SQL statements.
+
+        with query_budget(3) as stats:
+            response = await client.get("/api/v1/chores")
+    """
+
+    @contextmanager
+    def _budget(max_queries: int) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"Expected <= {max_queries} queries, got {stats.count}: {dict(stats.shapes)}"
+        )
+
+    return _budget
@@ -0,0 +1,136 @@
+"""Batch API: shared principal, per-item results, ordering of writes and path checks."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from mitlist.api import deps
+from mitlist.api.deps import get_db, get_read_only_db
+from mitlist.api.principal import user_cache
+from mitlist.core.config import settings
+from mitlist.db.instrumentation import track_queries
+from mitlist.main import app
+
+TOKEN = "dev:owner@example.test:Owner"
+
+
+@pytest.fixture
+async def client(session_factory, household, monkeypatch):
+    """The real app with a session per request and dev tokens; `verified` counts tokens checked."""
+    _, group = household
+
+    async def session():
+        async with session_factory() as db:
+            yield db
+            await db.commit()
+
+    verified: list[str] = []
+    parse_dev_token = deps._parse_dev_token
+
+    def counting_parse(token):
+        verified.append(token)
+        return parse_dev_token(token)
+
+    monkeypatch.setattr(settings, "DEV_TEST_USER_ENABLED", True)
+    monkeypatch.setattr(deps, "_parse_dev_token", counting_parse)
+    user_cache.clear()
+    app.dependency_overrides[get_db] = session
+    app.dependency_overrides[get_read_only_db] = session
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+            headers={"Authorization": f"Bearer {TOKEN}", "X-Group-ID": str(group.id)},
+        ) as ac:
+            yield ac, verified
+    finally:
+        app.dependency_overrides.clear()
+        user_cache.clear()
+
+
+async def test_batch_runs_items_with_one_principal(client):
+    ac, verified = client
+    with track_queries() as stats:
+        response = await ac.post(
+            "/api/v1/batch",
+            json={
+                "requests": [
+                    {"id": "categories", "path": "/api/v1/categories"},
+                    {"id": "unread", "path": "/api/v1/notifications/count"},
+                    {
+                        "id": "create",
+                        "method": "POST",
+                        "path": "/api/v1/categories",
+                        "body": {"name": "Rent"},
+                    },
+                    {"id": "after", "path": "/api/v1/categories"},
+                    {
+                        "id": "other-group",
+                        "path": "/api/v1/categories",
+                        "headers": {"X-Group-ID": "999"},
+                    },
+                    {"id": "missing", "path": "/api/v1/nope"},
+                ]
+            },
+        )
+
+    assert response.status_code == 200
+    items = response.json()["responses"]
+    assert [i["id"] for i in items] == [
+        "categories",
+        "unread",
+        "create",
+        "after",
+        "other-group",
+        "missing",
+    ]
+    assert [i["status"] for i in items] == [200, 200, 201, 200, 403, 404]
+    assert items[0]["body"] == []
+    assert items[1]["body"] == {"unread_count": 0}
+    assert items[2]["headers"]["content-type"] == "application/json"
+    # The write finished before the reads listed after it ran
+    assert [c["name"] for c in items[3]["body"]] == ["Rent"]
+    assert items[4]["body"]["code"] == "NOT_A_MEMBER"
+
+    # Token verified and user loaded once for the whole batch. Membership is loaded with
+    # the user for the first reads, then checked again by the write and the reads after it
+    assert verified == [TOKEN]
+    assert sum(n for shape, n in stats.shapes.items() if "users.email = ?" in shape) == 1
+    membership = [s for s in stats.shapes if "user_groups" in s and "users" not in s]
+    assert sum(stats.shapes[s] for s in membership) == 3  # write, reads after it, group 999
+
+
+async def test_membership_is_checked_again_after_a_write(client):
+    ac, _ = client
+    response = await ac.post(
+        "/api/v1/batch",
+        json={
+            "requests": [
+                {"path": "/api/v1/categories"},
+                {"method": "POST", "path": "/api/v1/groups/1/leave"},
+                {"path": "/api/v1/categories"},
+            ]
+        },
+    )
+    items = response.json()["responses"]
+    assert [i["status"] for i in items] == [200, 204, 403]
+    assert items[2]["body"]["code"] == "NOT_A_MEMBER"
+
+
+async def test_batch_rejects_non_api_and_nested_paths(client):
+    ac, _ = client
+    for path, code in (("/health/live", "INVALID_BATCH_PATH"), ("/api/v1/batch", "NESTED_BATCH")):
+        response = await ac.post("/api/v1/batch", json={"requests": [{"path": path}]})
+        assert response.status_code == 422
+        assert response.json()["code"] == code
+
+    too_many = [{"path": "/api/v1/notifications/count"}] * (settings.BATCH_MAX_REQUESTS + 1)
+    response = await ac.post("/api/v1/batch", json={"requests": too_many})
+    assert response.status_code == 422
+
+    # Sub-requests still need a valid token on the batch
+    response = await ac.post(
+        "/api/v1/batch",
+        json={"requests": [{"path": "/api/v1/notifications/count"}]},
+        headers={"Authorization": ""},
+    )
+    assert response.status_code == 401
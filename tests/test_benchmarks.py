@@ -0,0 +1,74 @@
+"""Service microbenchmarks: suite machinery and the regression gate (no timing asserts)."""
+
+from datetime import date
+
+from mitlist.db.seed import SeedConfig
+from mitlist.perf.bench import BENCHMARKS, _growth, _keep_faster, check, run_suite
+
+_TINY = {
+    "tiny": SeedConfig(
+        groups=1, members_min=3, members_max=3, years=0.25, end_date=date(2026, 1, 1)
+    ),
+    "bigger": SeedConfig(
+        groups=1, members_min=4, members_max=4, years=0.5, end_date=date(2026, 1, 1)
+    ),
+}
+
+
+def _report(min_ms: float, calibration_ms: float) -> dict:
+    stats = {"median_ms": min_ms, "min_ms": min_ms, "p95_ms": min_ms}
+    stats["calibration_ms"] = calibration_ms
+    return {"benchmarks": {"finance.calculate_group_balances": {"tiers": {"small": stats}}}}
+
+
+async def test_suite_times_every_benchmark_per_tier():
+    report = await run_suite(_TINY, list(BENCHMARKS.values()), rounds=2, warmup=0)
+
+    assert report["datasets"]["tiny"]["rows"] < report["datasets"]["bigger"]["rows"]
+    assert report["datasets"]["tiny"]["group_size"] == 3
+    for name in BENCHMARKS:
+        if name == "governance._tally_ranked_choice":
+            # Only present when the dataset drew a ranked-choice proposal with votes.
+            continue
+        result = report["benchmarks"][name]
+        assert set(result["tiers"]) == {"tiny", "bigger"}, name
+        for stats in result["tiers"].values():
+            assert 0 < stats["min_ms"] <= stats["median_ms"] <= stats["p95_ms"]
+            assert stats["calibration_ms"] > 0
+        assert result["growth"] is not None
+
+
+def test_check_flags_slowdown_beyond_tolerance():
+    baseline = _report(10.0, 20.0)
+
+    assert check(baseline, _report(12.0, 20.0)) == []
+    regressions = check(baseline, _report(15.0, 20.0))
+    assert len(regressions) == 1
+    assert regressions[0].startswith("finance.calculate_group_balances [small]")
+
+
+def test_check_scales_baseline_by_calibration():
+    # Twice as slow, on a machine that is twice as slow: not a regression.
+    assert check(_report(10.0, 20.0), _report(20.0, 40.0)) == []
+    # Same time on a machine twice as fast: a regression.
+    assert check(_report(10.0, 20.0), _report(10.0, 10.0))
+
+
+def test_check_ignores_small_absolute_deltas_and_new_entries():
+    assert check(_report(0.5, 20.0), _report(1.2, 20.0)) == []
+    assert check({"benchmarks": {}}, _report(50.0, 20.0)) == []
+
+
+def test_keep_faster_prefers_calibrated_minimum():
+    current = _report(15.0, 20.0)
+    _keep_faster(current, _report(12.0, 20.0))
+    _keep_faster(current, _report(13.0, 10.0))
+
+    stats = current["benchmarks"]["finance.calculate_group_balances"]["tiers"]["small"]
+    assert stats["min_ms"] == 12.0
+
+
+def test_growth_is_log_log_slope():
+    assert _growth([(1000, 2.0), (10000, 20.0)]) == 1.0
+    assert _growth([(1000, 2.0), (100000, 2.0)]) == 0.0
+    assert _growth([(1000, 2.0)]) is None
@@ -0,0 +1,148 @@
+"""Response compression: negotiation, threshold, streaming, opt-out and byte counters."""
+
+import gzip
+import json
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from httpx import AsyncClient
+
+from mitlist.api.compression import (
+    CompressionMiddleware,
+    compression_stats,
+    negotiate,
+    uncompressed,
+)
+
+PAYLOAD = [{"id": i, "description": f"Expense {i}", "amount": "12.50"} for i in range(200)]
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/big")
+    async def big():
+        return PAYLOAD
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/download")
+    @uncompressed
+    async def download():
+        return PAYLOAD
+
+    @app.get("/png")
+    async def png():
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for row in PAYLOAD:
+                yield json.dumps(row).encode() + b"\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson+json")
+
+    return app
+
+
+async def _get(path: str, accept_encoding: str) -> tuple[dict[str, str], list[bytes]]:
+    """Call the ASGI app directly and return response headers and the raw body chunks."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"t"), (b"accept-encoding", accept_encoding.encode())],
+        "client": ("127.0.0.1", 1234),
+        "server": ("t", 80),
+    }
+    await _app()(scope, receive, send)
+    headers = {k.decode().lower(): v.decode() for k, v in messages[0]["headers"]}
+    return headers, [m["body"] for m in messages[1:] if m.get("body")]
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    compression_stats.reset()
+
+
+def test_negotiation():
+    available = ["zstd", "br", "gzip"]
+    assert negotiate("gzip, deflate", available) == "gzip"
+    assert negotiate("gzip, br, zstd", available) == "zstd"
+    assert negotiate("gzip;q=1.0, br;q=0.5", available) == "gzip"
+    assert negotiate("br;q=0, *", ["br", "gzip"]) == "gzip"
+    assert negotiate("identity", available) is None
+    assert negotiate("gzip;q=0", available) is None
+    assert negotiate(None, available) is None
+
+
+async def test_large_json_is_gzipped():
+    headers, chunks = await _get("/big", "gzip")
+
+    raw = b"".join(chunks)
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "Accept-Encoding"
+    assert int(headers["content-length"]) == len(raw)
+    assert json.loads(gzip.decompress(raw)) == PAYLOAD
+    assert compression_stats.responses == {"gzip": 1}
+    assert compression_stats.bytes_saved > 0
+
+
+async def test_identity_and_small_bodies_are_untouched():
+    identity_headers, identity = await _get("/big", "identity")
+    small_headers, small = await _get("/small", "gzip")
+
+    assert "content-encoding" not in identity_headers
+    assert json.loads(b"".join(identity)) == PAYLOAD
+    assert "content-encoding" not in small_headers
+    assert json.loads(b"".join(small)) == {"ok": True}
+    assert compression_stats.responses == {}
+
+
+async def test_opted_out_routes_and_binary_types_are_untouched():
+    download_headers, download = await _get("/download", "gzip")
+    png_headers, _ = await _get("/png", "gzip")
+
+    assert "content-encoding" not in download_headers
+    assert json.loads(b"".join(download)) == PAYLOAD
+    assert "content-encoding" not in png_headers
+
+
+async def test_streaming_response_is_compressed_incrementally():
+    headers, chunks = await _get("/stream", "gzip")
+
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    # Held back only up to the threshold, then one flushed chunk per app chunk.
+    assert len(chunks) > len(PAYLOAD) // 2
+    decoder = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    body = b"".join(decoder.decompress(chunk) for chunk in chunks)
+    assert [json.loads(line) for line in body.splitlines()] == PAYLOAD
+    assert compression_stats.bytes_in == {"gzip": len(body)}
+
+
+async def test_app_responses_decode_transparently(client: AsyncClient):
+    response = await client.get("/api/v1/notifications", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert "notifications" in response.json()
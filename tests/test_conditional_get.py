@@ -0,0 +1,152 @@
+"""Conditional GET: ETags from cheap probes and 304 on If-None-Match."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist.api.conditional import etag_matches, weak_etag
+from mitlist.api.deps import get_current_group_id, get_current_user
+from mitlist.main import app
+from mitlist.modules.auth.models import Group, User
+from mitlist.modules.lists.models import Item, List
+from mitlist.modules.notifications.models import Notification
+
+
+@pytest.fixture
+def group_client(client: AsyncClient, test_group: Group) -> AsyncClient:
+    app.dependency_overrides[get_current_group_id] = lambda: test_group.id
+    return client
+
+
+@pytest.fixture
+async def shopping_list(db: AsyncSession, test_group: Group, test_user: User) -> List:
+    lst = List(group_id=test_group.id, name="Groceries", type="SHOPPING", created_by_id=test_user.id)
+    db.add(lst)
+    await db.flush()
+    db.add(Item(list_id=lst.id, name="Milk", added_by_id=test_user.id))
+    await db.flush()
+    return lst
+
+
+def test_etag_matching():
+    etag = weak_etag("a", 1)
+    assert etag.startswith('W/"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"nope", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+async def test_unchanged_notifications_answer_304_with_one_query(
+    client: AsyncClient, db: AsyncSession, test_user: User, query_budget
+):
+    db.add(Notification(user_id=test_user.id, type="SYSTEM", title="hi", body="b"))
+    await db.flush()
+
+    first = await client.get("/api/v1/notifications")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    with query_budget(1):
+        second = await client.get("/api/v1/notifications", headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.content == b""
+
+
+async def test_new_notification_changes_etag(
+    client: AsyncClient, db: AsyncSession, test_user: User
+):
+    etag = (await client.get("/api/v1/notifications")).headers["ETag"]
+
+    db.add(Notification(user_id=test_user.id, type="SYSTEM", title="new", body="b"))
+    await db.flush()
+    response = await client.get("/api/v1/notifications", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+async def test_update_that_keeps_max_updated_at_changes_etag(
+    client: AsyncClient, db: AsyncSession, test_user: User
+):
+    older = Notification(user_id=test_user.id, type="SYSTEM", title="old", body="b")
+    db.add_all([older, Notification(user_id=test_user.id, type="SYSTEM", title="new", body="b")])
+    await db.flush()
+    etag = (await client.get("/api/v1/notifications")).headers["ETag"]
+
+    # Same-transaction (or same-second) writes leave max(updated_at) where it was.
+    latest = await db.scalar(select(func.max(Notification.updated_at)))
+    older.is_read = True
+    older.updated_at = latest
+    await db.flush()
+    assert await db.scalar(select(func.max(Notification.updated_at))) == latest
+
+    response = await client.get("/api/v1/notifications", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+async def test_query_string_is_part_of_the_etag(client: AsyncClient):
+    all_etag = (await client.get("/api/v1/notifications")).headers["ETag"]
+    unread_etag = (
+        await client.get("/api/v1/notifications", params={"unread_only": True})
+    ).headers["ETag"]
+
+    assert all_etag != unread_etag
+
+
+async def test_etag_is_scoped_to_the_caller_and_group(client: AsyncClient, db: AsyncSession):
+    # Nobody has notifications, so every caller's probe is the same
+    first = await client.get("/api/v1/notifications")
+    assert first.headers["Vary"].startswith("Authorization, X-Group-ID")
+
+    other_group = await client.get("/api/v1/notifications", headers={"X-Group-ID": "2"})
+    assert other_group.headers["ETag"] != first.headers["ETag"]
+
+    other = User(email="other@example.com", hashed_password="x", name="Other")
+    db.add(other)
+    await db.flush()
+    app.dependency_overrides[get_current_user] = lambda: other
+    response = await client.get(
+        "/api/v1/notifications", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first.headers["ETag"]
+
+
+async def test_item_update_changes_list_items_etag(
+    group_client: AsyncClient, db: AsyncSession, shopping_list: List
+):
+    url = f"/api/v1/lists/{shopping_list.id}/items"
+    etag = (await group_client.get(url)).headers["ETag"]
+    assert (await group_client.get(url, headers={"If-None-Match": etag})).status_code == 304
+
+    item = (await db.execute(select(Item).where(Item.list_id == shopping_list.id))).scalar_one()
+    item.is_checked = True
+    await db.flush()
+
+    response = await group_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()[0]["is_checked"] is True
+
+
+async def test_detail_etag_is_group_scoped(
+    group_client: AsyncClient, db: AsyncSession, shopping_list: List, test_user: User
+):
+    url = f"/api/v1/lists/{shopping_list.id}"
+    etag = (await group_client.get(url)).headers["ETag"]
+    assert (await group_client.get(url, headers={"If-None-Match": etag})).status_code == 304
+
+    other = Group(name="Other", created_by_id=test_user.id)
+    db.add(other)
+    await db.flush()
+    app.dependency_overrides[get_current_group_id] = lambda: other.id
+
+    response = await group_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 404
@@ -0,0 +1,229 @@
+"""Domain events: transactional outbox, dispatcher ordering/retries, module subscribers."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist import events
+from mitlist.events import bus
+from mitlist.events.dispatcher import EventDispatcher, load_subscribers, purge_delivered
+from mitlist.events.models import OutboxEvent
+from mitlist.modules.audit.models import AuditLog
+from mitlist.modules.auth.models import Group, User, UserGroup
+from mitlist.modules.chores.interface import complete_assignment
+from mitlist.modules.chores.models import Chore, ChoreAssignment
+from mitlist.modules.finance.interface import create_expense
+from mitlist.modules.finance.models import Category
+from mitlist.modules.gamification.models import Streak, UserPoints
+from mitlist.modules.notifications.models import Notification
+
+T0 = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+NAIVE_T0 = T0.replace(tzinfo=None)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = T0
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def received(monkeypatch):
+    """Subscribe a recording handler to TEST_EVENT; payloads with "fail" set raise."""
+    seen: list[events.Event] = []
+
+    async def handler(db: AsyncSession, event: events.Event) -> None:
+        if event.payload.get("fail"):
+            raise RuntimeError("handler failed")
+        seen.append(event)
+
+    monkeypatch.setitem(bus._subscribers, "TEST_EVENT", [handler])
+    return seen
+
+
+async def _statuses(session_factory) -> dict[int, str]:
+    async with session_factory() as db:
+        return dict((await db.execute(select(OutboxEvent.id, OutboxEvent.status))).all())
+
+
+async def test_events_commit_and_roll_back_with_the_transaction(session_factory, received):
+    wakeups = []
+    bus.set_wakeup(lambda: wakeups.append(1))
+    try:
+        async with session_factory() as db:
+            events.emit(db, "TEST_EVENT", {"n": 1}, group_id=1)
+            await db.rollback()
+        async with session_factory() as db:
+            events.emit(db, "TEST_EVENT", {"n": 2}, group_id=1)
+            await db.commit()
+    finally:
+        bus.set_wakeup(None)
+
+    assert wakeups == [1]
+    dispatcher = EventDispatcher(clock=Clock())
+    assert await dispatcher.run_once(session_factory) == {"events.dispatch": "SUCCESS"}
+    assert [e.payload for e in received] == [{"n": 2}]
+    assert list((await _statuses(session_factory)).values()) == ["DELIVERED"]
+
+
+async def test_dispatch_job_is_claimed_once_per_interval_unless_woken(session_factory, received):
+    clock = Clock()
+    dispatcher = EventDispatcher(interval=5, clock=clock)
+    assert await dispatcher.run_once(session_factory) == {"events.dispatch": "SUCCESS"}
+
+    # Not due yet: the lease row is left alone and the outbox is not read
+    clock.now = T0 + timedelta(seconds=1)
+    async with session_factory() as db:
+        events.emit(db, "TEST_EVENT", {"n": 1}, group_id=1)
+        await db.commit()
+    assert await dispatcher.run_once(session_factory) == {}
+    assert received == []
+
+    # A local emit wakes the dispatcher, which runs the job ahead of schedule
+    result = await dispatcher.run_once(session_factory, immediate=True)
+    assert result == {"events.dispatch": "SUCCESS"}
+    assert [e.payload["n"] for e in received] == [1]
+
+
+async def test_failed_event_holds_back_its_group_only(session_factory, received):
+    async with session_factory() as db:
+        events.emit(db, "TEST_EVENT", {"n": 1, "fail": True}, group_id=1)
+        events.emit(db, "TEST_EVENT", {"n": 2}, group_id=1)
+        events.emit(db, "TEST_EVENT", {"n": 3}, group_id=2)
+        await db.commit()
+
+    clock = Clock()
+    dispatcher = EventDispatcher(retry_delay=10, clock=clock)
+    await dispatcher.run_once(session_factory)
+    assert [e.payload["n"] for e in received] == [3]
+    async with session_factory() as db:
+        first = await db.get(OutboxEvent, 1)
+        assert (first.status, first.attempts) == ("PENDING", 1)
+        assert first.last_error == "RuntimeError: handler failed"
+
+    # Still backing off: group 1 stays blocked
+    clock.now = T0 + timedelta(seconds=5)
+    await dispatcher.run_once(session_factory)
+    assert [e.payload["n"] for e in received] == [3]
+
+    # The first event now succeeds, and the second follows it
+    async with session_factory() as db:
+        (await db.get(OutboxEvent, 1)).payload = {"n": 1}
+        await db.commit()
+    clock.now = T0 + timedelta(seconds=10)
+    await dispatcher.run_once(session_factory)
+    assert [e.payload["n"] for e in received] == [3, 1, 2]
+    assert set((await _statuses(session_factory)).values()) == {"DELIVERED"}
+
+
+async def test_group_backing_off_does_not_starve_other_groups(session_factory, received):
+    async with session_factory() as db:
+        events.emit(db, "TEST_EVENT", {"n": 1, "fail": True}, group_id=1)
+        for n in range(2, 6):
+            events.emit(db, "TEST_EVENT", {"n": n}, group_id=1)
+        events.emit(db, "TEST_EVENT", {"n": 6}, group_id=2)
+        await db.commit()
+
+    clock = Clock()
+    dispatcher = EventDispatcher(batch_size=3, retry_delay=10, clock=clock)
+    await dispatcher.run_once(session_factory)
+    assert received == []
+
+    # Group 1 has a full batch of events queued behind the one backing off
+    clock.now = T0 + timedelta(seconds=5)
+    assert await dispatcher.deliver_pending(session_factory) == 1
+    assert [e.payload["n"] for e in received] == [6]
+
+
+async def test_event_is_given_up_after_max_attempts(session_factory, received):
+    async with session_factory() as db:
+        events.emit(db, "TEST_EVENT", {"n": 1, "fail": True}, group_id=1)
+        events.emit(db, "TEST_EVENT", {"n": 2}, group_id=1)
+        await db.commit()
+
+    clock = Clock()
+    dispatcher = EventDispatcher(max_attempts=2, retry_delay=1, clock=clock)
+    await dispatcher.run_once(session_factory)
+    clock.now += timedelta(seconds=1)
+    await dispatcher.run_once(session_factory)
+    clock.now += timedelta(seconds=1)
+    await dispatcher.run_once(session_factory)
+
+    assert await _statuses(session_factory) == {1: "FAILED", 2: "DELIVERED"}
+    assert [e.payload["n"] for e in received] == [2]
+
+
+async def test_purge_deletes_only_old_delivered_events(session_factory, received):
+    async with session_factory() as db:
+        events.emit(db, "TEST_EVENT", {"n": 1})
+        events.emit(db, "TEST_EVENT", {"n": 2, "fail": True})
+        await db.commit()
+    await EventDispatcher(clock=Clock()).run_once(session_factory)
+
+    async with session_factory() as db:
+        assert await purge_delivered(db, T0) == 0
+        assert await purge_delivered(db, T0 + timedelta(days=1)) == 1
+        await db.commit()
+    assert await _statuses(session_factory) == {2: "PENDING"}
+
+
+async def test_module_subscribers(session_factory):
+    load_subscribers()
+    async with session_factory() as db:
+        users = [
+            User(email=f"u{i}@example.test", hashed_password="x", name=f"User {i}")
+            for i in range(2)
+        ]
+        db.add_all(users)
+        await db.flush()
+        group = Group(name="Home", created_by_id=users[0].id)
+        db.add(group)
+        await db.flush()
+        db.add_all(
+            UserGroup(user_id=u.id, group_id=group.id, role="MEMBER", joined_at=NAIVE_T0)
+            for u in users
+        )
+        category = Category(group_id=group.id, name="Food", is_income=False)
+        chore = Chore(group_id=group.id, name="Dishes", frequency_type="DAILY", effort_value=5)
+        db.add_all([category, chore])
+        await db.flush()
+        assignment = ChoreAssignment(
+            chore_id=chore.id, assigned_to_id=users[1].id, due_date=NAIVE_T0, status="PENDING"
+        )
+        db.add(assignment)
+        await db.flush()
+
+        await create_expense(
+            db,
+            group_id=group.id,
+            paid_by_user_id=users[0].id,
+            description="Groceries",
+            amount=Decimal("30.00"),
+            category_id=category.id,
+            expense_date=NAIVE_T0,
+            splits=[
+                {"user_id": users[0].id, "owed_amount": Decimal("15.00")},
+                {"user_id": users[1].id, "owed_amount": Decimal("15.00")},
+            ],
+        )
+        await complete_assignment(db, assignment.id, completed_by_id=users[1].id)
+        await db.commit()
+
+    await EventDispatcher().run_once(session_factory)
+
+    async with session_factory() as db:
+        audit = (await db.execute(select(AuditLog.entity_type, AuditLog.action))).all()
+        assert sorted(audit) == [("chore_assignment", "UPDATED"), ("expense", "CREATED")]
+
+        notified = (await db.execute(select(Notification.user_id, Notification.type))).all()
+        assert notified == [(users[1].id, "EXPENSE_ADDED")]
+
+        points = await db.scalar(select(UserPoints).where(UserPoints.user_id == users[1].id))
+        assert points.total_points == 5
+        streak = await db.scalar(select(Streak).where(Streak.user_id == users[1].id))
+        assert streak.activity_type == "CHORES"
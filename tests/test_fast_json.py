@@ -0,0 +1,110 @@
+"""Fast JSON path: ORMSerializer parity with pydantic and a 10k-row benchmark."""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel, TypeAdapter, field_validator
+
+from mitlist.core.serialization import FastJSONResponse, ORMSerializer
+from mitlist.modules.finance.models import Expense, ExpenseSplit
+from mitlist.modules.finance.schemas import ExpenseResponse
+
+NOW = datetime(2026, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+
+
+def _expenses(n: int) -> list[Expense]:
+    rows = []
+    for i in range(n):
+        expense = Expense(
+            id=i + 1,
+            group_id=1,
+            paid_by_user_id=1,
+            description=f"Expense {i}",
+            amount=Decimal("12.50") + i,
+            currency_code="USD",
+            exchange_rate=None if i % 2 else Decimal("1.250000"),
+            category_id=3,
+            expense_date=NOW - timedelta(days=i),
+            payment_method="CARD",
+            vendor_name=None,
+            receipt_img_url=None,
+            is_reimbursable=False,
+            is_recurring_generated=False,
+            version_id=1,
+            created_at=NOW,
+            updated_at=datetime(2026, 5, 6, 7, 8, 9),
+        )
+        expense.splits = [
+            ExpenseSplit(
+                id=i * 2 + k,
+                expense_id=i + 1,
+                user_id=k + 1,
+                owed_amount=Decimal("6.25"),
+                is_paid=bool(k),
+                paid_at=NOW if k else None,
+                manual_override={"note": "x"} if k else None,
+                created_at=NOW,
+                updated_at=NOW,
+            )
+            for k in range(2)
+        ]
+        rows.append(expense)
+    return rows
+
+
+def _default_path(rows: list[Expense]) -> bytes:
+    # What FastAPI does today: handler model_validate, then response_model validation
+    # and pydantic JSON serialization.
+    adapter = TypeAdapter(list[ExpenseResponse])
+    models = [ExpenseResponse.model_validate(e) for e in rows]
+    return adapter.dump_json(adapter.validate_python(models))
+
+
+def test_orm_serializer_matches_pydantic_output():
+    rows = _expenses(3)
+
+    fast = ORMSerializer(ExpenseResponse).dump(rows)
+
+    assert json.loads(fast) == json.loads(_default_path(rows))
+
+
+def test_schemas_with_validators_are_rejected():
+    class Custom(BaseModel):
+        name: str
+
+        @field_validator("name")
+        @classmethod
+        def upper(cls, v: str) -> str:
+            return v.upper()
+
+    with pytest.raises(TypeError):
+        ORMSerializer(Custom)
+
+
+def test_fast_response_passes_encoded_bytes_through():
+    assert FastJSONResponse(b'[{"a":1}]').body == b'[{"a":1}]'
+    assert FastJSONResponse({"amount": Decimal("1.10"), "at": NOW}).body == (
+        b'{"amount":"1.10","at":"2026-05-06T07:08:09.123456Z"}'
+    )
+
+
+def test_benchmark_10k_rows():
+    rows = _expenses(10_000)
+    serializer = ORMSerializer(ExpenseResponse)
+
+    def best_of(fn, runs: int = 3) -> float:
+        best = float("inf")
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn(rows)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    default = best_of(_default_path)
+    fast = best_of(serializer.dump)
+
+    print(f"\n10k expenses: default {default * 1000:.1f}ms, orjson direct {fast * 1000:.1f}ms")
+    assert fast < default
@@ -0,0 +1,88 @@
+"""Query budgets for authenticated, group-scoped endpoints (real auth dependencies)."""
+
+from typing import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist.api.deps import get_db, get_read_only_db
+from mitlist.api.principal import user_cache
+from mitlist.core.config import settings
+from mitlist.db.instrumentation import track_queries
+from mitlist.main import app
+from mitlist.modules.auth.models import Group, User
+
+
+@pytest.fixture
+async def dev_client(
+    db: AsyncSession, test_user: User, test_group: Group, monkeypatch
+) -> AsyncGenerator[AsyncClient, None]:
+    """Client that authenticates through the real dependency chain with a dev token."""
+    monkeypatch.setattr(settings, "DEV_TEST_USER_ENABLED", True)
+    user_cache.clear()
+    # Already linked to the dev-token subject, so first sight does not rewrite preferences.
+    test_user.preferences = {"zitadel_sub": f"dev-{test_user.email.replace('@', '-at-')}"}
+    await db.flush()
+
+    async def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_only_db] = override_get_db
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        headers={
+            "Authorization": f"Bearer dev:{test_user.email}",
+            "X-Group-ID": str(test_group.id),
+        },
+    ) as ac:
+        yield ac
+    app.dependency_overrides.clear()
+    user_cache.clear()
+
+
+# (method, url, handler queries excluding auth/membership)
+GROUP_SCOPED_ENDPOINTS = [
+    ("GET", "/api/v1/chores", 2),  # conditional-GET probe + list
+    ("GET", "/api/v1/documents", 1),
+    ("GET", "/api/v1/credentials", 1),
+    ("GET", "/api/v1/recipes", 1),
+    ("GET", "/api/v1/admin/tags", 1),
+]
+
+
+@pytest.mark.parametrize("method,url,handler_queries", GROUP_SCOPED_ENDPOINTS)
+async def test_cold_principal_resolves_user_and_membership_in_one_query(
+    dev_client: AsyncClient, query_budget, method: str, url: str, handler_queries: int
+):
+    with query_budget(handler_queries + 1):
+        response = await dev_client.request(method, url)
+    assert response.status_code == 200, response.text
+
+
+@pytest.mark.parametrize("method,url,handler_queries", GROUP_SCOPED_ENDPOINTS)
+async def test_warm_principal_costs_one_membership_query(
+    dev_client: AsyncClient, query_budget, method: str, url: str, handler_queries: int
+):
+    await dev_client.request(method, url)
+
+    with query_budget(handler_queries + 1):
+        response = await dev_client.request(method, url)
+    assert response.status_code == 200, response.text
+
+
+async def test_admin_endpoint_does_not_reselect_membership(
+    dev_client: AsyncClient, test_group: Group
+):
+    await dev_client.get("/api/v1/admin/tags")
+
+    with track_queries() as stats:
+        response = await dev_client.post(
+            "/api/v1/admin/tags",
+            json={"group_id": test_group.id, "name": "Budget", "color_hex": "#112233"},
+        )
+    assert response.status_code == 201, response.text
+    membership_queries = sum(n for s, n in stats.shapes.items() if "FROM user_groups" in s)
+    assert membership_queries == 1, stats.shapes
@@ -0,0 +1,145 @@
+"""Idempotency-Key: replay, concurrent duplicates, key reuse, failures and expiry."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, status
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist.api.deps import get_current_user, get_db
+from mitlist.core.errors import AppError, ValidationError, app_error_handler
+from mitlist.idempotency import IdempotentRoute, purge_expired
+from mitlist.idempotency.models import IdempotencyRecord
+from mitlist.modules.audit.models import Tag
+
+
+@pytest.fixture
+async def api(session_factory, household):
+    """App with one idempotent route creating a tag; `calls` counts endpoint runs."""
+    calls: list[str] = []
+    gate = {"event": None}
+    router = APIRouter(route_class=IdempotentRoute)
+
+    @router.post("/tags", status_code=status.HTTP_201_CREATED)
+    async def create_tag(payload: dict, db: AsyncSession = Depends(get_db)):
+        calls.append(payload["name"])
+        if gate["event"] is not None:
+            await gate["event"].wait()
+        tag = Tag(group_id=1, name=payload["name"])
+        db.add(tag)
+        await db.flush()
+        if payload.get("fail"):
+            raise ValidationError(code="NOPE", detail="rejected")
+        return {"id": tag.id, "name": tag.name}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_exception_handler(AppError, app_error_handler)
+
+    async def session():
+        async with session_factory() as db:
+            try:
+                yield db
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    async def user():
+        return household[0]
+
+    app.dependency_overrides[get_db] = session
+    app.dependency_overrides[get_current_user] = user
+    async with AsyncClient(transport=ASGITransport(app), base_url="http://t") as client:
+        yield client, calls, gate
+
+
+async def _tags(session_factory) -> int:
+    async with session_factory() as db:
+        return await db.scalar(select(func.count(Tag.id)))
+
+
+async def test_retry_replays_stored_response(api, session_factory):
+    client, calls, _ = api
+    headers = {"Idempotency-Key": "k1"}
+    first = await client.post("/tags", json={"name": "a"}, headers=headers)
+    again = await client.post("/tags", json={"name": "a"}, headers=headers)
+
+    assert first.status_code == again.status_code == 201
+    assert again.json() == first.json()
+    assert again.headers["content-type"] == "application/json"
+    assert again.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+    assert calls == ["a"]
+    assert await _tags(session_factory) == 1
+
+    # Without a key, or with another one, requests run as usual
+    await client.post("/tags", json={"name": "a"})
+    await client.post("/tags", json={"name": "a"}, headers={"Idempotency-Key": "k2"})
+    assert calls == ["a", "a", "a"]
+
+
+async def test_key_reused_for_different_request_is_rejected(api):
+    client, calls, _ = api
+    headers = {"Idempotency-Key": "k1"}
+    await client.post("/tags", json={"name": "a"}, headers=headers)
+    response = await client.post("/tags", json={"name": "b"}, headers=headers)
+    assert response.status_code == 422
+    assert response.json()["code"] == "IDEMPOTENCY_KEY_REUSED"
+    assert calls == ["a"]
+
+
+async def test_concurrent_duplicate_waits_for_the_first(api, session_factory):
+    client, calls, gate = api
+    gate["event"] = asyncio.Event()
+    headers = {"Idempotency-Key": "k1"}
+    first = asyncio.create_task(client.post("/tags", json={"name": "a"}, headers=headers))
+    await asyncio.sleep(0.05)
+    second = asyncio.create_task(client.post("/tags", json={"name": "a"}, headers=headers))
+    await asyncio.sleep(0.2)
+    # The duplicate is parked on the key row, not running the endpoint
+    assert calls == ["a"] and not second.done()
+
+    gate["event"].set()
+    responses = await asyncio.gather(first, second)
+    assert [r.json() for r in responses] == [responses[0].json()] * 2
+    assert responses[1].headers["idempotent-replayed"] == "true"
+    assert calls == ["a"]
+    assert await _tags(session_factory) == 1
+
+
+async def test_failed_request_stores_nothing(api, session_factory):
+    client, calls, _ = api
+    headers = {"Idempotency-Key": "k1"}
+    failed = await client.post("/tags", json={"name": "a", "fail": True}, headers=headers)
+    assert failed.status_code == 422
+    async with session_factory() as db:
+        assert await db.scalar(select(func.count(IdempotencyRecord.id))) == 0
+
+    # The retry (same request) runs again
+    retried = await client.post("/tags", json={"name": "a", "fail": True}, headers=headers)
+    assert retried.status_code == 422
+    assert calls == ["a", "a"]
+    assert await _tags(session_factory) == 0
+
+
+async def test_expired_keys_run_again_and_are_purged(api, session_factory):
+    client, calls, _ = api
+    headers = {"Idempotency-Key": "k1"}
+    await client.post("/tags", json={"name": "a"}, headers=headers)
+    async with session_factory() as db:
+        record = await db.scalar(select(IdempotencyRecord))
+        record.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+        await db.commit()
+
+    response = await client.post("/tags", json={"name": "a"}, headers=headers)
+    assert "idempotent-replayed" not in response.headers
+    assert calls == ["a", "a"]
+
+    async with session_factory() as db:
+        assert await purge_expired(db, datetime.now(UTC)) == 0
+        assert await purge_expired(db, datetime.now(UTC) + timedelta(days=2)) == 1
+        await db.commit()
@@ -0,0 +1,160 @@
+"""Keyset (cursor) pagination for list endpoints."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist.core.errors import ValidationError
+from mitlist.core.pagination import decode_cursor, encode_cursor, next_cursor
+from mitlist.modules.auth.models import Group, User
+from mitlist.modules.finance.interface import list_expenses
+from mitlist.modules.finance.models import Category, Expense
+from mitlist.modules.notifications.interface import list_comments
+from mitlist.modules.notifications.models import Comment, Notification
+
+BASE = datetime(2026, 1, 1)
+
+
+async def _insert_expenses(db: AsyncSession, group: Group, user: User, category: Category, n: int):
+    # Several rows share each expense_date so the id tiebreaker matters.
+    await db.execute(
+        insert(Expense),
+        [
+            {
+                "group_id": group.id,
+                "paid_by_user_id": user.id,
+                "category_id": category.id,
+                "description": f"Expense {i}",
+                "amount": Decimal("10.00"),
+                "currency_code": "USD",
+                "expense_date": BASE + timedelta(minutes=i // 3),
+                "is_reimbursable": False,
+                "is_recurring_generated": False,
+                "version_id": 1,
+            }
+            for i in range(n)
+        ],
+    )
+
+
+def test_cursor_round_trip():
+    ts = datetime(2026, 3, 4, 5, 6, 7, 890, tzinfo=timezone.utc)
+    assert decode_cursor(encode_cursor(ts, 42)) == (ts, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "W10", encode_cursor(BASE, 1)[:-3]])
+def test_malformed_cursor_is_a_validation_error(cursor: str):
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
+
+
+async def test_cursor_pages_match_offset_pages(
+    db: AsyncSession, test_user: User, test_group: Group, test_category: Category
+):
+    await _insert_expenses(db, test_group, test_user, test_category, 25)
+    by_offset = await list_expenses(db, test_group.id, limit=100)
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        page = await list_expenses(db, test_group.id, limit=10, cursor=cursor)
+        seen.extend(e.id for e in page)
+        cursor = next_cursor(page, 10, "expense_date")
+        if cursor is None:
+            break
+
+    assert seen == [e.id for e in by_offset]
+
+
+async def test_ascending_cursor_for_comments(db: AsyncSession, test_user: User):
+    for i in range(5):
+        db.add(
+            Comment(
+                author_id=test_user.id,
+                parent_type="expense",
+                parent_id=999,
+                content=f"c{i}",
+                created_at=BASE,
+                updated_at=BASE,
+            )
+        )
+    await db.flush()
+
+    first = await list_comments(db, "expense", 999, limit=3)
+    rest = await list_comments(
+        db, "expense", 999, limit=3, cursor=next_cursor(first, 3, "created_at")
+    )
+
+    assert [c.content for c in first + rest] == ["c0", "c1", "c2", "c3", "c4"]
+
+
+async def test_notifications_response_carries_next_cursor(
+    client: AsyncClient, db: AsyncSession, test_user: User
+):
+    # Explicit timestamps: SQLite's CURRENT_TIMESTAMP default has a different text format
+    # than bound datetimes, and these should sort ahead of any other rows for the user.
+    future = datetime(2100, 1, 1)
+    for i in range(3):
+        db.add(
+            Notification(
+                user_id=test_user.id,
+                type="SYSTEM",
+                title=f"n{i}",
+                body="b",
+                created_at=future + timedelta(seconds=i),
+                updated_at=future,
+            )
+        )
+    await db.flush()
+
+    first = (await client.get("/api/v1/notifications", params={"limit": 2})).json()
+    second = (
+        await client.get(
+            "/api/v1/notifications", params={"limit": 2, "cursor": first["next_cursor"]}
+        )
+    ).json()
+
+    assert first["next_cursor"] is not None
+    assert [n["title"] for n in first["notifications"]] == ["n2", "n1"]
+    assert second["notifications"][0]["title"] == "n0"
+
+
+async def test_invalid_cursor_returns_422(client: AsyncClient):
+    response = await client.get("/api/v1/notifications", params={"cursor": "garbage"})
+
+    assert response.status_code == 422
+    assert response.json()["code"] == "INVALID_CURSOR"
+
+
+async def test_deep_cursor_page_is_as_fast_as_first_page(
+    db: AsyncSession, test_user: User, test_group: Group, test_category: Category
+):
+    """Benchmark: page 1 vs page 1000 (limit 10) with offset and with a cursor."""
+    await _insert_expenses(db, test_group, test_user, test_category, 10_010)
+    limit, deep_page = 10, 1000
+
+    async def timed(**kwargs) -> tuple[float, list[Expense]]:
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            rows = await list_expenses(db, test_group.id, limit=limit, **kwargs)
+            best = min(best, time.perf_counter() - start)
+        return best, rows
+
+    first_page, _ = await timed()
+    deep_offset, offset_rows = await timed(offset=limit * (deep_page - 1))
+    # Cursor pointing just before page 1000, as a client paging forward would hold.
+    _, previous = await timed(offset=limit * (deep_page - 2))
+    deep_cursor, cursor_rows = await timed(cursor=next_cursor(previous, limit, "expense_date"))
+
+    print(
+        f"\npage 1: {first_page * 1000:.2f}ms, page {deep_page} offset: "
+        f"{deep_offset * 1000:.2f}ms, page {deep_page} cursor: {deep_cursor * 1000:.2f}ms"
+    )
+    assert [e.id for e in cursor_rows] == [e.id for e in offset_rows]
+    assert deep_cursor < first_page * 3
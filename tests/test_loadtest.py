@@ -0,0 +1,85 @@
+"""Load generator: scenario mix against the in-process app on a seeded database."""
+
+from datetime import date
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from mitlist.api.deps import get_db, get_read_only_db
+from mitlist.api.principal import last_login_buffer, user_cache
+from mitlist.core.config import settings
+from mitlist.db.seed import SeedConfig, seed
+from mitlist.main import app
+from mitlist.perf.loadtest import SCENARIOS, _percentile, compare, load_fixtures, run
+
+
+@pytest.fixture
+async def seeded_app(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'load.db'}")
+    await seed(
+        engine,
+        SeedConfig(groups=2, members_min=3, members_max=3, years=0.25, end_date=date.today()),
+        create_schema=True,
+    )
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def session():
+        async with factory() as db:
+            yield db
+            await db.commit()
+
+    monkeypatch.setattr(settings, "DEV_TEST_USER_ENABLED", True)
+    monkeypatch.setattr(last_login_buffer, "_pending", {})
+    app.dependency_overrides[get_db] = session
+    app.dependency_overrides[get_read_only_db] = session
+    user_cache.clear()
+    yield engine
+    app.dependency_overrides.clear()
+    user_cache.clear()
+    await engine.dispose()
+
+
+async def test_mix_reports_every_route(seeded_app):
+    fixtures = await load_fixtures(seeded_app)
+    pending_before = sum(len(ids) for ids in fixtures.pending_assignments.values())
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+        report = await run(client, fixtures, list(SCENARIOS.values()), concurrency=4, duration=1.5)
+
+    assert len(fixtures.actors) == 6
+    assert set(report["routes"]) == {
+        "GET /api/v1/expenses",
+        "GET /api/v1/balances",
+        "PATCH /api/v1/chores/assignments/{assignment_id}/complete",
+        "GET /api/v1/calendar/feed",
+        "GET /api/v1/notifications/count",
+    }
+    total = report["total"]
+    assert total["errors"] == 0, report["routes"]
+    assert total["requests"] == sum(r["requests"] for r in report["routes"].values())
+    assert 0 < total["p50_ms"] <= total["p95_ms"] <= total["p99_ms"] <= total["max_ms"]
+    completed = report["routes"]["PATCH /api/v1/chores/assignments/{assignment_id}/complete"]
+    assert completed["status"] == {"200": completed["requests"]}
+    remaining = sum(len(ids) for ids in fixtures.pending_assignments.values())
+    assert pending_before - remaining >= completed["requests"]
+
+
+def test_percentiles_and_comparison():
+    ordered = [i / 1000 for i in range(1, 101)]
+    assert _percentile(ordered, 50) == 0.05
+    assert _percentile(ordered, 99) == 0.099
+    assert _percentile([], 95) == 0.0
+
+    old = {
+        "total": {"p95_ms": 10.0, "rps": 100.0},
+        "routes": {"GET /a": {"p95_ms": 4.0, "rps": 50.0}},
+    }
+    new = {
+        "total": {"p95_ms": 12.0, "rps": 90.0},
+        "routes": {"GET /a": {"p95_ms": 2.0, "rps": 50.0}},
+    }
+    assert compare(old, new) == {
+        "total": {"p95_ms": 0.2, "rps": -0.1},
+        "GET /a": {"p95_ms": -0.5, "rps": 0.0},
+    }
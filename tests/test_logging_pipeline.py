@@ -0,0 +1,93 @@
+"""Queue-based logging: call-site context capture, non-blocking enqueue, drop counting."""
+
+import logging
+import queue
+import threading
+import time
+
+from mitlist.core.logging import ContextFilter, DroppingQueueHandler, LogQueueListener
+from mitlist.core.request_context import group_id_var, trace_id_var, user_id_var
+
+
+class _Collect(logging.Handler):
+    def __init__(self, gate: threading.Event | None = None):
+        super().__init__()
+        self.gate = gate
+        self.lines: list[str] = []
+        self.setFormatter(logging.Formatter("%(trace_id)s|%(user_id)s|%(group_id)s|%(message)s"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.gate is not None:
+            self.gate.wait()
+        self.lines.append(self.format(record))
+
+
+def _logger(handler: DroppingQueueHandler) -> logging.Logger:
+    logger = logging.getLogger(f"test.pipeline.{id(handler)}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.handlers = [handler]
+    return logger
+
+
+def _queue_handler(maxsize: int) -> DroppingQueueHandler:
+    handler = DroppingQueueHandler(queue.Queue(maxsize=maxsize))
+    handler.addFilter(ContextFilter())
+    return handler
+
+
+def test_context_is_captured_at_call_site():
+    handler = _queue_handler(100)
+    target = _Collect()
+    listener = LogQueueListener(handler.queue, target)
+    listener.start()
+    logger = _logger(handler)
+
+    tokens = (trace_id_var.set("t-1"), user_id_var.set(7), group_id_var.set(3))
+    items = ["a"]
+    logger.info("items=%s", items)
+    items.append("b")  # mutated after the call: the record must not change
+    for var, token in zip((trace_id_var, user_id_var, group_id_var), tokens, strict=True):
+        var.reset(token)
+    listener.stop()
+
+    assert target.lines == ["t-1|7|3|items=['a']"]
+
+
+def test_full_queue_drops_instead_of_blocking():
+    gate = threading.Event()
+    handler = _queue_handler(5)
+    target = _Collect(gate)
+    listener = LogQueueListener(handler.queue, target)
+    listener.start()
+    logger = _logger(handler)
+
+    start = time.perf_counter()
+    for i in range(100):
+        logger.info("record %d", i)
+    elapsed = time.perf_counter() - start
+    gate.set()
+    listener.stop()
+
+    # The writer is stuck, yet logging returned immediately.
+    assert elapsed < 0.5
+    assert handler.dropped >= 100 - 5 - 1
+    assert len(target.lines) + handler.dropped == 100
+
+
+def test_exceptions_are_formatted_by_the_listener():
+    handler = _queue_handler(10)
+    target = _Collect()
+    target.setFormatter(logging.Formatter("%(message)s"))
+    listener = LogQueueListener(handler.queue, target)
+    listener.start()
+    logger = _logger(handler)
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+    listener.stop()
+
+    assert target.lines[0].startswith("failed\nTraceback")
+    assert "ValueError: boom" in target.lines[0]
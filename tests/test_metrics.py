@@ -0,0 +1,123 @@
+"""Prometheus /metrics: route latency, in-flight gauge, pool and cache stats, workers."""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+from httpx import AsyncClient
+
+from mitlist.core.cache import TTLCache
+from mitlist.core.metrics import REQUEST_LATENCY, REQUESTS_IN_FLIGHT
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    selector = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    prefix = f"{name}{{{selector}}} " if labels else f"{name} "
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line.split()[-1])
+    raise AssertionError(f"{prefix!r} not exposed")
+
+
+async def test_latency_histogram_uses_route_templates(client: AsyncClient):
+    route = "/api/v1/notifications/{notification_id}/read"
+    before = REQUEST_LATENCY.labels("PATCH", route, "4xx")._sum.get()
+
+    await client.patch("/api/v1/notifications/999999/read")
+    await client.get("/no/such/path")
+    text = (await client.get("/metrics")).text
+
+    assert _sample(
+        text,
+        "mitlist_http_request_duration_seconds_count",
+        method="PATCH",
+        route=route,
+        status="4xx",
+    ) >= 1
+    assert REQUEST_LATENCY.labels("PATCH", route, "4xx")._sum.get() > before
+    assert "/notifications/999999" not in text
+    assert "/no/such/path" not in text
+    assert 'route="unmatched"' in text
+
+
+async def test_route_label_is_the_template_even_when_a_value_matches_a_segment(
+    client: AsyncClient,
+):
+    await client.get("/api/v1/invites/v1")
+    text = (await client.get("/metrics")).text
+
+    assert 'route="/api/v1/invites/{code}"' in text
+    assert 'route="/api/{code}/invites/v1"' not in text
+
+
+async def test_in_flight_gauge_counts_the_scrape_itself(client: AsyncClient):
+    text = (await client.get("/metrics")).text
+
+    assert _sample(text, "mitlist_http_requests_in_flight") == 1
+    assert REQUESTS_IN_FLIGHT._value.get() == 0
+
+
+async def test_pool_and_cache_stats(client: AsyncClient):
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60, name="test_metrics")
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    response = await client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert _sample(text, "mitlist_db_pool_size", pool="primary") >= 1
+    assert _sample(text, "mitlist_db_pool_checked_out", pool="primary") == 0
+    assert _sample(text, "mitlist_cache_hits", cache="test_metrics") == 2
+    assert _sample(text, "mitlist_cache_entries", cache="test_metrics") == 1
+    assert abs(_sample(text, "mitlist_cache_hit_ratio", cache="test_metrics") - 2 / 3) < 1e-9
+    assert "mitlist_db_pool_wait_seconds_bucket" in text
+
+
+def test_values_are_aggregated_across_worker_processes(tmp_path):
+    # Two "workers" each serve a request and hold a cache; a third process scrapes.
+    script = textwrap.dedent(
+        """
+        import sys
+        from mitlist.core.cache import TTLCache
+        from mitlist.core import metrics
+
+        if sys.argv[1] == "worker":
+            cache = TTLCache(maxsize=10, ttl=60, name="shared")
+            cache.set("k", 1)
+            cache.get("k")
+            metrics.observe_request("GET", "/api/v1/lists", 200, 0.02)
+            metrics.REQUESTS_IN_FLIGHT.inc()
+            metrics.refresh()
+        else:
+            sys.stdout.write(metrics.render()[0].decode())
+        """
+    )
+    env = {
+        **os.environ,
+        "PROMETHEUS_MULTIPROC_DIR": str(tmp_path),
+        "POSTGRES_SERVER": "x",
+        "POSTGRES_USER": "x",
+        "POSTGRES_PASSWORD": "x",
+        "POSTGRES_DB": "x",
+        "SECRET_KEY": "x",
+    }
+    run = [sys.executable, "-c", script]
+    workers = [subprocess.Popen([*run, "worker"], env=env) for _ in range(2)]
+    assert [w.wait(timeout=60) for w in workers] == [0, 0]
+    text = subprocess.run(
+        [*run, "scrape"], env=env, capture_output=True, text=True, timeout=60, check=True
+    ).stdout
+
+    assert _sample(
+        text,
+        "mitlist_http_request_duration_seconds_count",
+        method="GET",
+        route="/api/v1/lists",
+        status="2xx",
+    ) == 2
+    assert _sample(text, "mitlist_cache_hits", cache="shared") == 2
+    assert _sample(text, "mitlist_cache_hit_ratio", cache="shared") == 1.0
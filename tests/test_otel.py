@@ -0,0 +1,126 @@
+"""Tracing: batch export, parent-based sampling, server, SQLAlchemy and httpx spans."""
+
+from functools import partial
+
+import httpx
+import pytest
+from httpx import ASGITransport
+from opentelemetry import trace
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist import main
+from mitlist.api.deps import get_current_user, get_db, get_read_only_db
+from mitlist.core.config import settings
+from mitlist.core.otel import (
+    build_tracer_provider,
+    instrument_app,
+    instrument_libraries,
+    uninstrument_libraries,
+)
+from mitlist.modules.auth.models import User
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+def _remote_parent(sampled: bool):
+    ctx = SpanContext(
+        trace_id=0x1234,
+        span_id=0x5678,
+        is_remote=True,
+        trace_flags=TraceFlags(TraceFlags.SAMPLED if sampled else TraceFlags.DEFAULT),
+    )
+    return trace.set_span_in_context(NonRecordingSpan(ctx))
+
+
+def test_spans_are_batched_to_the_exporter(exporter: InMemorySpanExporter):
+    provider = build_tracer_provider(exporter)
+    tracer = provider.get_tracer("test")
+
+    with tracer.start_as_current_span("parent"):
+        with tracer.start_as_current_span("child"):
+            pass
+    assert exporter.get_finished_spans() == ()  # still queued in the batch processor
+
+    provider.force_flush()
+    spans = exporter.get_finished_spans()
+    assert [s.name for s in spans] == ["child", "parent"]
+    assert spans[0].resource.attributes["service.name"] == settings.OTEL_SERVICE_NAME
+    provider.shutdown()
+
+
+def test_parent_based_ratio_sampling(exporter: InMemorySpanExporter, monkeypatch):
+    monkeypatch.setattr(settings, "OTEL_TRACES_SAMPLER_RATIO", 0.0)
+    provider = build_tracer_provider(exporter)
+    tracer = provider.get_tracer("test")
+
+    with tracer.start_as_current_span("root"):
+        pass
+    with tracer.start_as_current_span("sampled upstream", context=_remote_parent(True)):
+        pass
+    with tracer.start_as_current_span("dropped upstream", context=_remote_parent(False)):
+        pass
+    provider.force_flush()
+
+    assert [s.name for s in exporter.get_finished_spans()] == ["sampled upstream"]
+    provider.shutdown()
+
+
+async def test_sql_and_httpx_calls_produce_spans(exporter: InMemorySpanExporter, engine):
+    provider = build_tracer_provider(exporter)
+    instrument_libraries(provider)
+    try:
+        with provider.get_tracer("test").start_as_current_span("request") as request_span:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        # Nothing listens on port 9: the call fails, but still produces a client span.
+        async with httpx.AsyncClient() as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://127.0.0.1:9/oauth/v2/keys")
+    finally:
+        uninstrument_libraries()
+    provider.force_flush()
+
+    spans = exporter.get_finished_spans()
+    sql = [s for s in spans if s.attributes.get("db.statement") == "SELECT 1"]
+    http = [s for s in spans if s.kind == trace.SpanKind.CLIENT and s.name.startswith("GET")]
+    assert len(sql) == 1
+    assert sql[0].parent.span_id == request_span.get_span_context().span_id
+    assert len(http) == 1
+    assert not http[0].status.is_ok
+    provider.shutdown()
+
+
+async def test_server_span_carries_sql_stats(
+    exporter: InMemorySpanExporter, db: AsyncSession, test_user: User, monkeypatch
+):
+    # The app as main builds it, with the instrumentor exporting to `exporter`
+    provider = build_tracer_provider(exporter)
+    monkeypatch.setattr(main, "otel_enabled", lambda: True)
+    monkeypatch.setattr(main, "instrument_app", partial(instrument_app, provider=provider))
+    application = main.create_application()
+
+    async def override_get_db():
+        yield db
+
+    application.dependency_overrides[get_db] = override_get_db
+    application.dependency_overrides[get_read_only_db] = override_get_db
+    application.dependency_overrides[get_current_user] = lambda: test_user
+    async with httpx.AsyncClient(
+        transport=ASGITransport(app=application), base_url="http://test"
+    ) as client:
+        response = await client.get("/api/v1/notifications")
+    assert response.status_code == 200
+    provider.force_flush()
+
+    server = [s for s in exporter.get_finished_spans() if s.kind == trace.SpanKind.SERVER]
+    assert len(server) == 1
+    assert server[0].attributes["db.query_count"] >= 1
+    assert server[0].attributes["db.n_plus_one_suspected"] is False
+    assert "db.total_duration_ms" in server[0].attributes
+    provider.shutdown()
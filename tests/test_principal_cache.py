@@ -0,0 +1,149 @@
+"""Tests for the principal cache and write-behind last-login buffer."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import object_session
+from starlette.requests import Request
+
+from mitlist.api import principal
+from mitlist.api.deps import get_current_user, invalidate_cached_user
+from mitlist.api.principal import (
+    USER_INVALIDATION_CHANNEL,
+    LastLoginBuffer,
+    last_login_buffer,
+    user_cache,
+)
+from mitlist.core.state import state_backend
+from mitlist.modules.auth.models import User
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+@pytest.fixture(autouse=True)
+def _clear_principal_cache():
+    user_cache.clear()
+    last_login_buffer._pending.clear()
+    yield
+    user_cache.clear()
+    last_login_buffer._pending.clear()
+
+
+def _request() -> Request:
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""}
+    return Request(scope)
+
+
+def _claims(user: User) -> dict:
+    return {"sub": "cache-sub", "email": user.email, "name": user.name}
+
+
+async def test_cache_hit_issues_no_queries(db: AsyncSession, engine, test_user: User):
+    first = await get_current_user(
+        request=_request(), claims=_claims(test_user), db=db, lookup_db=db
+    )
+    assert first.id == test_user.id
+
+    qc = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", qc)
+    try:
+        second = await get_current_user(
+            request=_request(), claims=_claims(test_user), db=db, lookup_db=db
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", qc)
+
+    assert qc.count == 0
+    assert second.id == test_user.id
+    assert second.email == test_user.email
+    assert object_session(second) is None
+    assert test_user.id in last_login_buffer.pending()
+
+
+async def test_invalidate_cached_user_forces_reload(db: AsyncSession, engine, test_user: User):
+    await get_current_user(request=_request(), claims=_claims(test_user), db=db, lookup_db=db)
+    assert user_cache.get("cache-sub") is not None
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        invalidate_cached_user(session, test_user.id)
+        assert user_cache.get("cache-sub") is not None  # not before the change commits
+        await session.commit()
+
+    assert user_cache.get("cache-sub") is None
+
+
+async def test_invalidation_is_published_after_commit_only(engine, test_user: User, monkeypatch):
+    published: list[tuple[str, str]] = []
+    publish = state_backend.publish
+
+    async def recording_publish(channel: str, message: str) -> None:
+        published.append((channel, message))
+        await publish(channel, message)
+
+    monkeypatch.setattr(state_backend, "publish", recording_publish)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    user_cache.put("cache-sub", test_user)
+
+    async with session_factory() as session:
+        invalidate_cached_user(session, test_user.id)
+        await session.rollback()
+    assert user_cache.get("cache-sub") is not None
+
+    async with session_factory() as session:
+        invalidate_cached_user(session, test_user.id)
+        await session.commit()
+    assert user_cache.get("cache-sub") is None
+    await asyncio.gather(*principal._publishing)
+    assert published == [(USER_INVALIDATION_CHANNEL, str(test_user.id))]
+
+    # Another worker's message evicts this worker's copy
+    user_cache.put("cache-sub", test_user)
+    await publish(USER_INVALIDATION_CHANNEL, str(test_user.id))
+    assert user_cache.get("cache-sub") is None
+
+
+async def test_last_login_buffer_coalesces_into_one_update(engine):
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        users = [
+            User(email=f"buffer{i}@example.com", name=f"Buffer {i}", hashed_password="pw")
+            for i in range(3)
+        ]
+        session.add_all(users)
+        await session.commit()
+
+    buffer = LastLoginBuffer()
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i, user in enumerate(users):
+        buffer.record(user.id, base)
+        buffer.record(user.id, base + timedelta(minutes=i + 1))
+        buffer.record(user.id, base - timedelta(days=1))
+
+    qc = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", qc)
+    try:
+        written = await buffer.flush(session_factory)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", qc)
+
+    assert written == 3
+    assert qc.count == 1
+    assert buffer.pending() == {}
+
+    async with session_factory() as session:
+        result = await session.execute(
+            select(User.id, User.last_login_at).where(User.id.in_([u.id for u in users]))
+        )
+        seen = {uid: ts.replace(tzinfo=timezone.utc) for uid, ts in result.all()}
+    for i, user in enumerate(users):
+        assert seen[user.id] == base + timedelta(minutes=i + 1)
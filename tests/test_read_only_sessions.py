@@ -0,0 +1,112 @@
+"""Read-only sessions: no commit, no writes, no connection for DB-free endpoints."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from mitlist.api.principal import last_login_buffer, user_cache
+from mitlist.core.config import settings
+from mitlist.db import engine as db_engine
+from mitlist.main import app
+from mitlist.modules.auth.models import User
+
+
+@pytest.fixture
+def read_only_factory(engine, monkeypatch):
+    factory = async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+        info={"read_only": True},
+    )
+    monkeypatch.setattr(db_engine, "ReadOnlySessionLocal", factory)
+    return factory
+
+
+async def test_system_info_never_checks_out_a_connection(monkeypatch):
+    # No get_db override: the configured Postgres server is unreachable in tests, so any
+    # checkout from the real pool would fail the request. The principal comes from the
+    # user cache, leaving the request's (unused) session as the only DB dependency.
+    monkeypatch.setattr(settings, "DEV_TEST_USER_ENABLED", True)
+    monkeypatch.setattr(last_login_buffer, "_pending", {})
+    user_cache.clear()
+    user_cache.put(
+        "dev-ro-at-example.com",
+        User(id=1, email="ro@example.com", name="Read Only", is_active=True),
+    )
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+            headers={"Authorization": "Bearer dev:ro@example.com"},
+        ) as ac:
+            response = await ac.get("/api/v1/system/info")
+    finally:
+        user_cache.clear()
+
+    assert response.status_code == 200
+
+
+async def test_read_only_get_checks_out_one_connection(
+    file_engine, session_factory, household, monkeypatch
+):
+    # The real session dependencies on a file database, so every session has its own
+    # connection: the principal and membership lookups must share the handler's.
+    monkeypatch.setattr(db_engine, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(
+        db_engine,
+        "ReadOnlySessionLocal",
+        async_sessionmaker(file_engine, expire_on_commit=False, info={"read_only": True}),
+    )
+    monkeypatch.setattr(settings, "DEV_TEST_USER_ENABLED", True)
+    monkeypatch.setattr(last_login_buffer, "_pending", {})
+    checkouts: list[object] = []
+    event.listen(file_engine.sync_engine, "checkout", lambda *args: checkouts.append(args[0]))
+    user_cache.clear()
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+            headers={"Authorization": "Bearer dev:owner@example.test", "X-Group-ID": "1"},
+        ) as ac:
+            # Cache miss (user and membership loaded together), then a cached principal
+            for _ in range(2):
+                checkouts.clear()
+                response = await ac.get("/api/v1/categories")
+                assert response.status_code == 200
+                assert len(checkouts) == 1
+    finally:
+        user_cache.clear()
+
+
+async def test_get_read_only_db_skips_commit(read_only_factory, test_user: User, monkeypatch):
+    async def fail_commit(self):
+        raise AssertionError("read-only session must not commit")
+
+    monkeypatch.setattr(AsyncSession, "commit", fail_commit)
+
+    gen = db_engine.get_read_only_db()
+    session = await gen.__anext__()
+    user = (await session.execute(select(User).where(User.id == test_user.id))).scalar_one()
+    assert user.email == test_user.email
+    await gen.aclose()
+
+
+async def test_read_only_session_rejects_flush(read_only_factory):
+    async with read_only_factory() as session:
+        session.add(User(email="nope@example.com", name="Nope"))
+        with pytest.raises(RuntimeError):
+            await session.flush()
+
+
+async def test_read_only_bind_only_applies_to_postgres():
+    pg = create_async_engine("postgresql+asyncpg://u:p@localhost/db")
+    sqlite = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        assert db_engine._read_only_bind(pg).get_execution_options()["postgresql_readonly"]
+        assert db_engine._read_only_bind(sqlite) is sqlite
+    finally:
+        await pg.dispose()
+        await sqlite.dispose()
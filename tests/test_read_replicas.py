@@ -0,0 +1,71 @@
+"""Read-replica routing for get_read_db."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from mitlist.api import deps
+from mitlist.db.engine import ReplicaRouter
+
+
+@pytest.fixture
+async def replica_engines():
+    engines = [create_async_engine("sqlite+aiosqlite:///:memory:") for _ in range(3)]
+    yield engines
+    for e in engines:
+        await e.dispose()
+
+
+def test_pick_round_robins_across_replicas(replica_engines):
+    router = ReplicaRouter(replica_engines, max_lag_seconds=5)
+
+    picked = [router.pick() for _ in range(6)]
+
+    assert picked == replica_engines + replica_engines
+
+
+def test_lagging_replicas_are_skipped(replica_engines):
+    router = ReplicaRouter(replica_engines, max_lag_seconds=5)
+    router.lag = [30.0, 1.0, 30.0]
+
+    assert {router.pick() for _ in range(4)} == {replica_engines[1]}
+
+
+def test_all_replicas_lagging_falls_back_to_primary(replica_engines):
+    router = ReplicaRouter(replica_engines, max_lag_seconds=5)
+    router.lag = [30.0, 30.0, 30.0]
+
+    assert router.pick() is None
+    assert ReplicaRouter([], max_lag_seconds=5).pick() is None
+
+
+async def test_failed_lag_probe_marks_replica_unhealthy(replica_engines):
+    # SQLite has no pg_is_in_recovery(): the probe fails like an unreachable replica.
+    router = ReplicaRouter(replica_engines[:1], max_lag_seconds=5)
+
+    await router.probe()
+
+    assert router.lag == [float("inf")]
+    assert router.pick() is None
+
+
+async def test_get_read_db_uses_primary_session_without_replicas(db: AsyncSession, monkeypatch):
+    monkeypatch.setattr(deps, "replica_router", ReplicaRouter([], max_lag_seconds=5))
+
+    gen = deps.get_read_db(db=db)
+    session = await gen.__anext__()
+
+    assert session is db
+    await gen.aclose()
+
+
+async def test_get_read_db_binds_to_replica(db: AsyncSession, replica_engines, monkeypatch):
+    monkeypatch.setattr(deps, "replica_router", ReplicaRouter(replica_engines[:1], 5))
+
+    gen = deps.get_read_db(db=db)
+    session = await gen.__anext__()
+
+    assert session is not db
+    assert session.bind is replica_engines[0]
+    assert (await session.execute(text("SELECT 1"))).scalar_one() == 1
+    await gen.aclose()
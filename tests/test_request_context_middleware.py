@@ -0,0 +1,105 @@
+"""Pure ASGI request-context middleware: behaviour and latency vs BaseHTTPMiddleware."""
+
+import statistics
+import time
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist.api.deps import get_current_user, get_db, get_read_only_db
+from mitlist.api.middleware import RequestContextMiddleware
+from mitlist.api.router import api_router, health_router
+from mitlist.core.request_context import get_trace_id, get_user_id, set_trace_id
+from mitlist.modules.auth.models import User
+
+
+def _app(kind: str) -> FastAPI:
+    app = FastAPI()
+    if kind == "asgi":
+        app.add_middleware(RequestContextMiddleware)
+    else:
+        # The previous implementation, for comparison.
+        @app.middleware("http")
+        async def trace_id_middleware(request: Request, call_next):
+            trace_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+            set_trace_id(trace_id)
+            response = await call_next(request)
+            response.headers["X-Request-ID"] = trace_id
+            return response
+
+    @app.get("/trace")
+    async def trace():
+        return {"trace_id": get_trace_id()}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk{i}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.include_router(health_router)
+    app.include_router(api_router)
+    return app
+
+
+async def test_trace_id_is_echoed_and_visible_to_handlers():
+    async with AsyncClient(transport=ASGITransport(app=_app("asgi")), base_url="http://t") as ac:
+        given = await ac.get("/trace", headers={"X-Request-ID": "abc-123"})
+        generated = await ac.get("/trace")
+
+    assert given.headers["X-Request-ID"] == "abc-123"
+    assert given.json() == {"trace_id": "abc-123"}
+    assert generated.headers["X-Request-ID"] == generated.json()["trace_id"]
+
+
+async def test_request_contextvars_do_not_leak_into_caller(client: AsyncClient, test_user: User):
+    # ASGITransport runs the app in this task: the middleware must restore the context.
+    response = await client.get("/api/v1/notifications")
+
+    assert response.status_code == 200
+    assert get_trace_id() is None
+    assert get_user_id() is None
+
+
+async def test_streaming_response_passes_through():
+    async with AsyncClient(transport=ASGITransport(app=_app("asgi")), base_url="http://t") as ac:
+        response = await ac.get("/stream")
+
+    assert response.text == "chunk0\nchunk1\nchunk2\n"
+    assert "X-Request-ID" in response.headers
+
+
+async def test_benchmark_middleware_latency(db: AsyncSession, test_user: User):
+    """Median latency of /health/live and an authenticated GET, old vs new middleware."""
+
+    async def override_get_db():
+        yield db
+
+    results: dict[str, dict[str, float]] = {}
+    for kind in ("basehttp", "asgi"):
+        app = _app(kind)
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_only_db] = override_get_db
+        app.dependency_overrides[get_current_user] = lambda: test_user
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as ac:
+            for url in ("/health/live", "/api/v1/notifications"):
+                for _ in range(20):
+                    await ac.get(url)
+                samples = []
+                for _ in range(300):
+                    start = time.perf_counter()
+                    await ac.get(url)
+                    samples.append(time.perf_counter() - start)
+                results.setdefault(url, {})[kind] = statistics.median(samples) * 1e6
+
+    for url, by_kind in results.items():
+        print(
+            f"\n{url}: BaseHTTPMiddleware {by_kind['basehttp']:.0f}us, "
+            f"pure ASGI {by_kind['asgi']:.0f}us"
+        )
+    assert results["/health/live"]["asgi"] < results["/health/live"]["basehttp"]
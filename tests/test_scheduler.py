@@ -0,0 +1,283 @@
+"""Job scheduler: leases, retries, backlog rescheduling, and the built-in sweeps."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist.jobs.models import ScheduledJob
+from mitlist.jobs.registry import JOBS
+from mitlist.jobs.scheduler import Job, JobContext, Scheduler
+from mitlist.modules.assets.models import HomeAsset, MaintenanceTask
+from mitlist.modules.auth.models import Group, User, UserGroup
+from mitlist.modules.finance.models import Category, Expense, RecurringExpense
+from mitlist.modules.governance.models import Proposal
+from mitlist.modules.notifications.models import Notification
+from mitlist.modules.plants.models import Plant, PlantSchedule, PlantSpecies
+
+T0 = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = T0
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+async def _state(session_factory, name: str) -> ScheduledJob:
+    async with session_factory() as db:
+        return await db.scalar(select(ScheduledJob).where(ScheduledJob.name == name))
+
+
+def _naive(value: datetime) -> datetime:
+    return value.replace(tzinfo=None)
+
+
+async def test_due_job_runs_once_per_interval(session_factory):
+    calls: list[JobContext] = []
+
+    async def job(db: AsyncSession, ctx: JobContext) -> int:
+        calls.append(ctx)
+        return 3
+
+    clock = Clock()
+    scheduler = Scheduler(clock=clock)
+    scheduler.register(Job("tick", job, interval=600, jitter=0))
+
+    assert await scheduler.run_pending(session_factory) == {"tick": "SUCCESS"}
+    assert await scheduler.run_pending(session_factory) == {}
+    assert calls[0].since == T0 - timedelta(seconds=600)
+
+    state = await _state(session_factory, "tick")
+    assert state.last_status == "SUCCESS"
+    assert state.lease_owner is None
+    assert _naive(state.next_run_at) == _naive(T0 + timedelta(seconds=600))
+
+    clock.now = T0 + timedelta(seconds=600)
+    assert await scheduler.run_pending(session_factory) == {"tick": "SUCCESS"}
+    # The next window starts where the previous successful run ended
+    assert _naive(calls[1].since) == _naive(T0)
+
+
+async def test_live_lease_blocks_other_processes_until_it_expires(session_factory):
+    async def job(db: AsyncSession, ctx: JobContext) -> int:
+        return 0
+
+    clock = Clock()
+    first = Scheduler(owner="a", lease_seconds=60, clock=clock)
+    second = Scheduler(owner="b", lease_seconds=60, clock=clock)
+    for scheduler in (first, second):
+        scheduler.register(Job("tick", job, interval=600))
+    await first._ensure_rows(session_factory)
+
+    # "a" claimed the job and died without releasing it
+    assert await first._claim(session_factory, first.jobs["tick"], T0) is not None
+    assert await second.run_pending(session_factory) == {}
+
+    clock.now = T0 + timedelta(seconds=61)
+    assert await second.run_pending(session_factory) == {"tick": "SUCCESS"}
+
+
+async def test_failures_back_off_then_wait_for_the_next_interval(session_factory):
+    async def job(db: AsyncSession, ctx: JobContext) -> int:
+        raise RuntimeError("boom")
+
+    clock = Clock()
+    scheduler = Scheduler(clock=clock)
+    scheduler.register(Job("flaky", job, interval=3600, max_attempts=3, retry_delay=10, jitter=0))
+
+    assert await scheduler.run_pending(session_factory) == {"flaky": "RETRY"}
+    state = await _state(session_factory, "flaky")
+    assert (state.attempts, state.last_error) == (1, "RuntimeError: boom")
+    assert _naive(state.next_run_at) == _naive(T0 + timedelta(seconds=10))
+
+    clock.now = T0 + timedelta(seconds=10)
+    assert await scheduler.run_pending(session_factory) == {"flaky": "RETRY"}
+    state = await _state(session_factory, "flaky")
+    assert _naive(state.next_run_at) == _naive(clock.now + timedelta(seconds=20))
+
+    clock.now += timedelta(seconds=20)
+    assert await scheduler.run_pending(session_factory) == {"flaky": "FAILED"}
+    state = await _state(session_factory, "flaky")
+    assert state.attempts == 0
+    assert _naive(state.next_run_at) == _naive(clock.now + timedelta(seconds=3600))
+
+
+async def test_full_batch_is_rescheduled_immediately(session_factory):
+    async def job(db: AsyncSession, ctx: JobContext) -> int:
+        return ctx.batch_size
+
+    scheduler = Scheduler(batch_size=10, clock=Clock())
+    scheduler.register(Job("backlog", job, interval=3600))
+
+    await scheduler.run_pending(session_factory)
+    assert _naive((await _state(session_factory, "backlog")).next_run_at) == _naive(T0)
+
+
+async def _household(db: AsyncSession) -> tuple[Group, list[User]]:
+    users = [
+        User(email=f"u{i}@example.test", hashed_password="x", name=f"User {i}") for i in range(2)
+    ]
+    db.add_all(users)
+    await db.flush()
+    group = Group(name="Home", created_by_id=users[0].id)
+    db.add(group)
+    await db.flush()
+    db.add_all(
+        UserGroup(user_id=u.id, group_id=group.id, role="MEMBER", joined_at=_naive(T0))
+        for u in users
+    )
+    await db.flush()
+    return group, users
+
+
+async def test_builtin_sweeps(session_factory):
+    async with session_factory() as db:
+        group, users = await _household(db)
+        category = Category(group_id=group.id, name="Rent", is_income=False)
+        db.add(category)
+        await db.flush()
+        db.add(
+            RecurringExpense(
+                group_id=group.id,
+                paid_by_user_id=users[0].id,
+                description="Rent",
+                amount=Decimal("900.00"),
+                category_id=category.id,
+                frequency_type="MONTHLY",
+                start_date=datetime(2025, 12, 1),
+                next_due_date=datetime(2026, 1, 1),
+            )
+        )
+        db.add_all(
+            Proposal(
+                group_id=group.id,
+                created_by_id=users[0].id,
+                title=title,
+                type="GENERAL",
+                strategy="SIMPLE_MAJORITY",
+                status="OPEN",
+                deadline_at=deadline,
+            )
+            for title, deadline in (
+                ("Past", datetime(2026, 2, 1)),
+                ("Future", datetime(2026, 4, 1)),
+            )
+        )
+        species = PlantSpecies(scientific_name="Ficus elastica", toxicity="LOW", light_needs="LOW")
+        db.add(species)
+        await db.flush()
+        plant = Plant(group_id=group.id, species_id=species.id, nickname="Rubber")
+        asset = HomeAsset(group_id=group.id, name="Boiler", asset_type="APPLIANCE")
+        db.add_all([plant, asset])
+        await db.flush()
+        db.add_all(
+            [
+                # Due within the first window (T0 - 15 min, T0]: assignee only
+                PlantSchedule(
+                    plant_id=plant.id,
+                    action_type="WATER",
+                    next_due_date=_naive(T0 - timedelta(minutes=5)),
+                    frequency_days=7,
+                    assigned_to_id=users[1].id,
+                ),
+                # Long overdue: before the window, not reminded again
+                PlantSchedule(
+                    plant_id=plant.id,
+                    action_type="FERTILIZE",
+                    next_due_date=datetime(2026, 1, 1),
+                    frequency_days=30,
+                ),
+                MaintenanceTask(
+                    asset_id=asset.id,
+                    name="Service",
+                    frequency_days=365,
+                    next_due_date=_naive(T0 - timedelta(minutes=30)),
+                    priority="HIGH",
+                ),
+            ]
+        )
+        await db.commit()
+
+    scheduler = Scheduler(clock=Clock())
+    for job in JOBS:
+        scheduler.register(job)
+    outcomes = await scheduler.run_pending(session_factory)
+    assert set(outcomes.values()) == {"SUCCESS"}
+
+    async with session_factory() as db:
+        # One expense per missed month (Jan, Feb, Mar), dated at its due date
+        dates = list(
+            await db.scalars(
+                select(Expense.expense_date)
+                .where(Expense.is_recurring_generated.is_(True))
+                .order_by(Expense.expense_date)
+            )
+        )
+        assert dates == [datetime(2026, 1, 1), datetime(2026, 2, 1), datetime(2026, 3, 1)]
+        recurring = await db.scalar(select(RecurringExpense))
+        assert recurring.next_due_date == datetime(2026, 4, 1)
+
+        statuses = dict((await db.execute(select(Proposal.title, Proposal.status))).all())
+        assert statuses == {"Past": "REJECTED", "Future": "OPEN"}
+
+        notifications = (
+            await db.execute(
+                select(Notification.type, Notification.user_id, func.count()).group_by(
+                    Notification.type, Notification.user_id
+                )
+            )
+        ).all()
+        assert sorted(notifications) == sorted(
+            [
+                ("PLANT_CARE_DUE", users[1].id, 1),
+                ("MAINTENANCE_DUE", users[0].id, 1),
+                ("MAINTENANCE_DUE", users[1].id, 1),
+            ]
+        )
+
+
+async def test_reminder_sweep_pages_through_its_window(session_factory):
+    async with session_factory() as db:
+        group, users = await _household(db)
+        species = PlantSpecies(scientific_name="Ficus elastica", toxicity="LOW", light_needs="LOW")
+        db.add(species)
+        await db.flush()
+        plant = Plant(group_id=group.id, species_id=species.id, nickname="Rubber")
+        db.add(plant)
+        await db.flush()
+        # Five schedules due within the first window, two sharing a due date
+        db.add_all(
+            PlantSchedule(
+                plant_id=plant.id,
+                action_type="WATER",
+                next_due_date=_naive(T0 - timedelta(minutes=minutes)),
+                frequency_days=7,
+                assigned_to_id=users[0].id,
+            )
+            for minutes in (10, 8, 8, 5, 1)
+        )
+        await db.commit()
+
+    job = next(job for job in JOBS if job.name == "plants.care_reminders")
+    clock = Clock()
+    scheduler = Scheduler(batch_size=2, clock=clock)
+    scheduler.register(job)
+
+    for full_batch in (True, True, False):
+        assert await scheduler.run_pending(session_factory) == {job.name: "SUCCESS"}
+        state = await _state(session_factory, job.name)
+        if full_batch:
+            # Stopped at a full batch: due again now, same window, cursor kept
+            assert _naive(state.next_run_at) == _naive(T0)
+            assert _naive(state.last_success_at) == _naive(T0 - timedelta(seconds=job.interval))
+            assert state.cursor is not None
+    assert state.cursor is None
+    assert _naive(state.last_success_at) == _naive(T0)
+    assert await scheduler.run_pending(session_factory) == {}
+
+    async with session_factory() as db:
+        assert await db.scalar(select(func.count(Notification.id))) == 5
@@ -0,0 +1,94 @@
+"""Synthetic dataset generator: reproducibility, referential integrity, hot-path services."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from mitlist.db.seed import SeedConfig, _config, _parser, seed
+from mitlist.modules.auth.models import User, UserGroup
+from mitlist.modules.calendar.service import get_calendar_feed
+from mitlist.modules.chores.service import get_leaderboard
+from mitlist.modules.finance.models import Expense, ExpenseSplit
+from mitlist.modules.finance.service import calculate_group_balances
+
+CONFIG = SeedConfig(groups=3, members_min=3, members_max=4, years=0.5, end_date=date(2026, 1, 1))
+
+
+async def _seeded(path, cfg: SeedConfig = CONFIG, runs: int = 1):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    for run in range(runs):
+        counts = await seed(engine, cfg, batch_size=500, create_schema=run == 0)
+    return engine, counts
+
+
+async def _dump(engine, table: str) -> list[tuple]:
+    async with engine.connect() as conn:
+        return (await conn.execute(text(f"SELECT * FROM {table} ORDER BY id"))).all()
+
+
+async def test_same_seed_same_rows(tmp_path):
+    first, counts = await _seeded(tmp_path / "a.db")
+    second, _ = await _seeded(tmp_path / "b.db")
+    other, _ = await _seeded(tmp_path / "c.db", SeedConfig(**{**vars(CONFIG), "seed": 2}))
+
+    assert counts["groups"] == 3
+    assert 9 <= counts["users"] <= 12
+    assert counts["expenses"] > 100 and counts["expense_splits"] > counts["expenses"]
+    for table in ("expenses", "expense_splits", "chore_assignments", "notifications"):
+        assert await _dump(first, table) == await _dump(second, table)
+    assert await _dump(first, "expenses") != await _dump(other, "expenses")
+    for engine in (first, second, other):
+        await engine.dispose()
+
+
+async def test_splits_add_up_and_reruns_append(tmp_path):
+    engine, counts = await _seeded(tmp_path / "seed.db", runs=2)
+
+    async with AsyncSession(engine) as db:
+        assert await db.scalar(select(func.count(User.id))) == 2 * counts["users"]
+        totals: dict[int, Decimal] = {}
+        for expense_id, owed in (
+            await db.execute(select(ExpenseSplit.expense_id, ExpenseSplit.owed_amount))
+        ).all():
+            totals[expense_id] = totals.get(expense_id, Decimal("0")) + owed
+        amounts = dict((await db.execute(select(Expense.id, Expense.amount))).all())
+        assert totals == amounts
+        orphans = await db.scalar(
+            select(func.count(UserGroup.id)).where(UserGroup.user_id.not_in(select(User.id)))
+        )
+        assert orphans == 0
+    await engine.dispose()
+
+
+async def test_hot_paths_run_on_seeded_data(tmp_path):
+    engine, _ = await _seeded(tmp_path / "seed.db")
+
+    async with AsyncSession(engine) as db:
+        _, balances, _, _ = await calculate_group_balances(db, 1)
+        leaderboard = await get_leaderboard(db, 1, period="all")
+        feed = await get_calendar_feed(db, 1, date(2026, 1, 1), date(2026, 1, 31))
+
+    assert len(balances) >= 3
+    assert leaderboard
+    assert {"CHORE", "MEAL_PLAN"} <= {item["type"] for item in feed}
+    await engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (
+            ["--groups", "50", "--members", "2-8"],
+            {"groups": 50, "members_min": 2, "members_max": 8},
+        ),
+        (["--years", "3.5", "--seed", "9"], {"years": 3.5, "seed": 9}),
+    ],
+)
+def test_cli_overrides(argv, expected):
+    cfg = _config(_parser().parse_args(argv))
+    for name, value in expected.items():
+        assert getattr(cfg, name) == value
+    assert cfg.expenses_per_member_month == SeedConfig().expenses_per_member_month
@@ -0,0 +1,73 @@
+"""Per-request SQL instrumentation: counting, N+1 detection, span attributes, Server-Timing."""
+
+import logging
+
+import pytest
+from httpx import AsyncClient
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mitlist.core.config import settings
+from mitlist.db.instrumentation import report_query_stats, statement_shape, track_queries
+from mitlist.modules.auth.models import User
+
+
+def test_statement_shape_ignores_binds_and_in_list_length():
+    assert statement_shape("SELECT *\n  FROM users WHERE id = $1") == (
+        "SELECT * FROM users WHERE id = ?"
+    )
+    assert statement_shape("SELECT * FROM users WHERE id IN (?, ?, ?)") == statement_shape(
+        "SELECT * FROM users WHERE id IN (?)"
+    )
+
+
+async def test_track_queries_records_count_time_and_slowest(db: AsyncSession, test_user: User):
+    with track_queries() as outer:
+        await db.execute(text("SELECT 1"))
+        with track_queries() as inner:
+            await db.execute(select(User).where(User.id == test_user.id))
+
+    assert inner.count == 1
+    assert outer.count == 2
+    assert outer.total_ms >= inner.total_ms > 0
+    assert outer.slowest_statement is not None
+
+
+async def test_repeated_shapes_are_flagged_as_n_plus_one(
+    db: AsyncSession, test_user: User, caplog
+):
+    with track_queries() as stats:
+        for _ in range(5):
+            await db.execute(select(User).where(User.id == test_user.id))
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with caplog.at_level(logging.WARNING, logger="mitlist.db.instrumentation"):
+        with provider.get_tracer(__name__).start_as_current_span("GET /test"):
+            report_query_stats(stats, "GET /test", n_plus_one_threshold=5)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["db.query_count"] == 5
+    assert span.attributes["db.n_plus_one_suspected"] is True
+    assert "Suspected N+1 in GET /test: 5 executions" in caplog.text
+
+
+async def test_server_timing_header(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_TIMING_ENABLED", True)
+
+    response = await client.get("/api/v1/notifications")
+
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("app;dur=")
+    assert response.headers["Server-Timing"].endswith('desc="3 queries"')
+
+
+async def test_query_budget_fails_when_exceeded(db: AsyncSession, query_budget):
+    with pytest.raises(AssertionError, match="Expected <= 1 queries, got 2"):
+        with query_budget(1):
+            await db.execute(text("SELECT 1"))
+            await db.execute(text("SELECT 2"))
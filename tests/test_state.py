@@ -0,0 +1,222 @@
+"""Shared state backends (in-process and Redis protocol) and the maintenance-mode middleware."""
+
+import asyncio
+import importlib.util
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from mitlist.api.middleware import MaintenanceModeMiddleware
+from mitlist.core.state import MemoryStateBackend, RedisStateBackend, StateBackendError
+
+requires_redis = pytest.mark.skipif(
+    importlib.util.find_spec("redis") is None, reason="needs the `redis` extra"
+)
+
+
+class StandInServer:
+    """Just enough of the Redis protocol for the backend: strings with PX, pub/sub, AUTH."""
+
+    def __init__(self, password: str | None = None) -> None:
+        self.password = password
+        self.data: dict[bytes, bytes] = {}
+        self.subscribers: dict[bytes, set[asyncio.StreamWriter]] = {}
+        self.commands: list[str] = []
+        self.connections: set[asyncio.StreamWriter] = set()
+        self.server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        port = self.server.sockets[0].getsockname()[1]
+        auth = f":{self.password}@" if self.password else ""
+        return f"redis://{auth}127.0.0.1:{port}/2"
+
+    async def __aenter__(self) -> "StandInServer":
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.drop_connections()
+        self.server.close()
+        await self.server.wait_closed()
+
+    def drop_connections(self) -> None:
+        for writer in list(self.connections):
+            writer.close()
+        self.connections.clear()
+        self.subscribers.clear()
+
+    @staticmethod
+    def _bulk(value: bytes | None) -> bytes:
+        return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> list[bytes]:
+        count = int((await reader.readuntil(b"\r\n"))[1:-2])
+        args = []
+        for _ in range(count):
+            size = int((await reader.readuntil(b"\r\n"))[1:-2])
+            args.append((await reader.readexactly(size + 2))[:-2])
+        return args
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections.add(writer)
+        authed = self.password is None
+        try:
+            while True:
+                name, *args = await self._read_command(reader)
+                name = name.decode().upper()
+                self.commands.append(name)
+                if name == "AUTH":
+                    authed = args[-1].decode() == self.password
+                    writer.write(b"+OK\r\n" if authed else b"-WRONGPASS invalid password\r\n")
+                elif not authed:
+                    writer.write(b"-NOAUTH Authentication required.\r\n")
+                elif name in ("SELECT", "SET"):
+                    if name == "SET":
+                        self.data[args[0]] = args[1]
+                        if len(args) > 2:
+                            asyncio.get_running_loop().call_later(
+                                int(args[3]) / 1000, self.data.pop, args[0], None
+                            )
+                    writer.write(b"+OK\r\n")
+                elif name == "GET":
+                    writer.write(self._bulk(self.data.get(args[0])))
+                elif name == "DEL":
+                    writer.write(b":%d\r\n" % (self.data.pop(args[0], None) is not None))
+                elif name == "PUBLISH":
+                    targets = self.subscribers.get(args[0], set())
+                    for target in targets:
+                        target.write(b"*3\r\n$7\r\nmessage\r\n" + self._bulk(args[0]))
+                        target.write(self._bulk(args[1]))
+                    writer.write(b":%d\r\n" % len(targets))
+                elif name == "SUBSCRIBE":
+                    for i, channel in enumerate(args, 1):
+                        self.subscribers.setdefault(channel, set()).add(writer)
+                        writer.write(b"*3\r\n$9\r\nsubscribe\r\n" + self._bulk(channel))
+                        writer.write(b":%d\r\n" % i)
+                else:
+                    writer.write(b"-ERR unknown command\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.connections.discard(writer)
+            writer.close()
+
+
+async def _eventually(condition, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+async def test_memory_backend_ttl_and_shared_values():
+    now = [0.0]
+    backend = MemoryStateBackend(clock=lambda: now[0])
+    await backend.set("token", "a", ttl=10)
+    await backend.set("flag", "1")
+    assert await backend.get("token") == "a"
+    now[0] = 10.0
+    assert await backend.get("token") is None
+    assert await backend.delete("flag") is True
+    assert await backend.delete("flag") is False
+
+    shared = backend.shared("settings", {"on": False})
+    assert backend.shared("settings", None) is shared
+    await shared.set({"on": True})
+    assert shared.value == {"on": True}
+
+
+@requires_redis
+async def test_redis_backend_commands():
+    async with StandInServer(password="s3cret") as server:
+        backend = RedisStateBackend(server.url)
+        try:
+            await backend.set("k", "v")
+            await backend.set("short", "x", ttl=0.05)
+            assert await backend.get("k") == "v"
+            assert server.data[b"mitlist:k"] == b"v"
+            await asyncio.sleep(0.1)
+            assert await backend.get("short") is None
+            assert await backend.delete("k") is True
+            assert server.commands[0] == "AUTH"
+            assert "SELECT" in server.commands
+
+            # A connection closed by the server is replaced transparently
+            server.drop_connections()
+            assert await backend.get("k") is None
+        finally:
+            await backend.stop()
+
+        backend = RedisStateBackend(server.url.replace("s3cret", "wrong"))
+        with pytest.raises(StateBackendError, match="invalid password"):
+            await backend.get("k")
+        await backend.close()
+
+
+@requires_redis
+async def test_shared_value_follows_writes_from_other_workers():
+    async with StandInServer() as server:
+        workers = [RedisStateBackend(server.url) for _ in range(2)]
+        flags = [w.shared("maintenance_mode", {"enabled": False}) for w in workers]
+        for worker in workers:
+            await worker.start(refresh_interval=3600)
+        try:
+            await _eventually(lambda: len(server.subscribers.get(b"mitlist:invalidate", ())) == 2)
+            await flags[0].set({"enabled": True})
+            await _eventually(lambda: flags[1].value == {"enabled": True})
+
+            # Missed while the subscription was down: caught up on resubscribe
+            server.drop_connections()
+            server.data[b"mitlist:maintenance_mode"] = b'{"enabled": false}'
+            await _eventually(lambda: flags[1].value == {"enabled": False}, timeout=5)
+        finally:
+            for worker in workers:
+                await worker.stop()
+
+
+@requires_redis
+async def test_maintenance_middleware_uses_local_copy():
+    async with StandInServer() as server:
+        backend = RedisStateBackend(server.url)
+        flag = backend.shared("maintenance_mode", {"enabled": False})
+        await backend.start(refresh_interval=3600)
+
+        app = FastAPI()
+
+        @app.get("/api/v1/lists")
+        async def lists():
+            return []
+
+        @app.get("/api/v1/admin/maintenance-mode")
+        async def status():
+            return flag.value
+
+        @app.get("/health/live")
+        async def live():
+            return {"status": "ok"}
+
+        app.add_middleware(
+            MaintenanceModeMiddleware,
+            state=flag,
+            prefix="/api/v1/",
+            exempt=("/api/v1/admin/maintenance-mode",),
+        )
+        try:
+            async with AsyncClient(transport=ASGITransport(app), base_url="http://t") as client:
+                assert (await client.get("/api/v1/lists")).status_code == 200
+
+                await flag.set({"enabled": True, "message": "Back soon"})
+                commands = len(server.commands)
+                response = await client.get("/api/v1/lists")
+                assert response.status_code == 503
+                assert response.json()["code"] == "MAINTENANCE_MODE"
+                assert response.json()["detail"] == "Back soon"
+                assert (await client.get("/api/v1/admin/maintenance-mode")).status_code == 200
+                assert (await client.get("/health/live")).status_code == 200
+                # Requests never touched the backend
+                assert len(server.commands) == commands
+        finally:
+            await backend.stop()
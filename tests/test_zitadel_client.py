@@ -0,0 +1,83 @@
+"""Shared Zitadel HTTP client: single-flight discovery/JWKS refresh and background rotation."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from mitlist.core.auth import zitadel
+from mitlist.core.config import settings
+
+BASE_URL = "https://idp.test"
+JWKS = {"keys": [{"kty": "RSA", "kid": "k1", "n": "AQAB", "e": "AQAB"}]}
+
+
+class StandInIdP:
+    """MockTransport handler serving discovery + JWKS with a small delay."""
+
+    def __init__(self):
+        self.calls: dict[str, int] = {}
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls[path] = self.calls.get(path, 0) + 1
+        await asyncio.sleep(0.01)
+        if path == "/.well-known/openid-configuration":
+            return httpx.Response(200, json={"jwks_uri": f"{BASE_URL}/oauth/v2/keys"})
+        if path == "/oauth/v2/keys":
+            return httpx.Response(200, json=JWKS)
+        return httpx.Response(404)
+
+
+@pytest.fixture
+async def idp(monkeypatch):
+    handler = StandInIdP()
+    monkeypatch.setattr(settings, "ZITADEL_BASE_URL", BASE_URL)
+    monkeypatch.setattr(
+        zitadel, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(zitadel, "_discovery_cache", {"expires_at": 0.0, "value": None})
+    monkeypatch.setattr(
+        zitadel, "_jwks_cache", {"expires_at": 0.0, "fetched_at": 0.0, "value": None}
+    )
+    yield handler
+    await zitadel.stop_zitadel_client()
+
+
+async def test_concurrent_cold_callers_share_one_fetch(idp: StandInIdP):
+    results = await asyncio.gather(*(zitadel.get_jwks() for _ in range(25)))
+
+    assert all(r == JWKS for r in results)
+    assert idp.calls == {"/.well-known/openid-configuration": 1, "/oauth/v2/keys": 1}
+
+
+async def test_unknown_kid_refresh_is_single_flight_and_rate_limited(
+    idp: StandInIdP, monkeypatch
+):
+    await zitadel.get_jwks()
+    monkeypatch.setitem(zitadel._jwks_cache, "fetched_at", time.time() - 3600)
+
+    await asyncio.gather(*(zitadel.get_jwks(force_refresh=True) for _ in range(10)))
+    assert idp.calls["/oauth/v2/keys"] == 2
+
+    # Just refetched: further unknown kids are served from cache.
+    await zitadel.get_jwks(force_refresh=True)
+    assert idp.calls["/oauth/v2/keys"] == 2
+
+
+async def test_background_refresh_rotates_keys_before_expiry(idp: StandInIdP, monkeypatch):
+    monkeypatch.setattr(settings, "ZITADEL_JWKS_REFRESH_AHEAD_SECONDS", 300)
+    await zitadel.get_jwks()
+    # Pretend the cached JWKS is inside the refresh-ahead window.
+    monkeypatch.setitem(zitadel._jwks_cache, "expires_at", time.time() + 60)
+    assert zitadel._next_refresh_delay() == 0.0
+
+    await zitadel.start_zitadel_client()
+    for _ in range(100):
+        if zitadel._jwks_cache["expires_at"] > time.time() + 300:
+            break
+        await asyncio.sleep(0.01)
+
+    assert idp.calls["/oauth/v2/keys"] >= 2
+    assert zitadel._jwks_cache["expires_at"] > time.time() + 300
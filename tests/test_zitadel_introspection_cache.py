@@ -0,0 +1,74 @@
+"""Introspection result cache: positive/negative entries, exp bound and coalescing."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from mitlist.core.auth import zitadel
+from mitlist.core.cache import TTLCache
+from mitlist.core.config import settings
+
+
+class StandInIntrospection:
+    """Introspection endpoint: tokens starting with 'revoked' are inactive."""
+
+    def __init__(self, exp: float):
+        self.exp = exp
+        self.calls = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        token = request.content.decode().split("token=", 1)[1]
+        if token.startswith("revoked"):
+            return httpx.Response(200, json={"active": False})
+        return httpx.Response(200, json={"active": True, "sub": "u1", "exp": int(self.exp)})
+
+
+@pytest.fixture
+def introspection(monkeypatch):
+    handler = StandInIntrospection(exp=time.time() + 3600)
+    monkeypatch.setattr(settings, "ZITADEL_BASE_URL", "https://idp.test")
+    monkeypatch.setattr(settings, "ZITADEL_INTROSPECTION_CLIENT_ID", "api")
+    monkeypatch.setattr(settings, "ZITADEL_INTROSPECTION_CLIENT_SECRET", "secret")
+    monkeypatch.setattr(
+        zitadel, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(zitadel, "_introspection_cache", TTLCache(maxsize=100, ttl=60))
+    monkeypatch.setattr(zitadel, "_introspection_stats", {"coalesced": 0})
+    return handler
+
+
+async def test_active_result_is_cached(introspection: StandInIntrospection):
+    await zitadel.require_active_token("good-token")
+    await zitadel.require_active_token("good-token")
+
+    assert introspection.calls == 1
+    stats = zitadel.introspection_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+async def test_inactive_result_is_negatively_cached(introspection: StandInIntrospection):
+    for _ in range(3):
+        with pytest.raises(zitadel.ZitadelTokenError):
+            await zitadel.require_active_token("revoked-token")
+
+    assert introspection.calls == 1
+
+
+async def test_entries_never_outlive_token_exp(introspection: StandInIntrospection):
+    introspection.exp = time.time() + 0.05
+    await zitadel.require_active_token("short-lived")
+    await asyncio.sleep(0.1)
+
+    assert zitadel._introspection_cache.get(zitadel._token_cache_key("short-lived")) is None
+
+
+async def test_concurrent_introspections_are_coalesced(introspection: StandInIntrospection):
+    await asyncio.gather(*(zitadel.require_active_token("busy-token") for _ in range(20)))
+
+    assert introspection.calls == 1
+    assert zitadel.introspection_cache_stats()["coalesced"] == 19
@@ -0,0 +1,135 @@
+"""Zitadel JWT verification: claims/key caching behaviour and a verification microbenchmark."""
+
+import base64
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+from mitlist.core.auth import zitadel
+from mitlist.core.config import settings
+
+KID = "bench-kid"
+
+
+def _b64url_uint(value: int) -> str:
+    raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+@pytest.fixture(scope="module")
+def rsa_key_pair():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode("ascii")
+    numbers = private_key.public_key().public_numbers()
+    public_jwk = {
+        "kty": "RSA",
+        "use": "sig",
+        "alg": "RS256",
+        "kid": KID,
+        "n": _b64url_uint(numbers.n),
+        "e": _b64url_uint(numbers.e),
+    }
+    return private_pem, public_jwk
+
+
+@pytest.fixture
+def stand_in_jwks(rsa_key_pair, monkeypatch):
+    """Serve a local JWKS document from the module cache instead of the network."""
+    _, public_jwk = rsa_key_pair
+    monkeypatch.setattr(settings, "ZITADEL_AUDIENCE", "")
+    monkeypatch.setattr(settings, "ZITADEL_ISSUER", "")
+    monkeypatch.setattr(settings, "ZITADEL_BASE_URL", "")
+    jwks = {"keys": [public_jwk]}
+    monkeypatch.setitem(zitadel._jwks_cache, "value", jwks)
+    monkeypatch.setitem(zitadel._jwks_cache, "expires_at", time.time() + 3600)
+    zitadel._verified_cache.clear()
+    zitadel._key_cache.update({"jwks": None, "keys": {}})
+    yield jwks
+    zitadel._verified_cache.clear()
+    zitadel._key_cache.update({"jwks": None, "keys": {}})
+
+
+def _sign(private_pem: str, exp_in: float = 600, sub: str = "bench-user") -> str:
+    now = int(time.time())
+    return jwt.encode(
+        {"sub": sub, "iat": now, "exp": int(now + exp_in)},
+        private_pem,
+        algorithm="RS256",
+        headers={"kid": KID},
+    )
+
+
+async def test_verified_claims_are_cached(rsa_key_pair, stand_in_jwks):
+    token = _sign(rsa_key_pair[0])
+
+    first = await zitadel.verify_access_token(token)
+    hits_before = zitadel._verified_cache.hits
+    second = await zitadel.verify_access_token(token)
+
+    assert second.claims == first.claims
+    assert zitadel._verified_cache.hits == hits_before + 1
+
+
+async def test_cached_claims_do_not_outlive_exp(rsa_key_pair, stand_in_jwks, monkeypatch):
+    token = _sign(rsa_key_pair[0], exp_in=30)
+    await zitadel.verify_access_token(token)
+
+    real_monotonic = time.monotonic
+    monkeypatch.setattr("mitlist.core.cache.time.monotonic", lambda: real_monotonic() + 60)
+
+    assert zitadel._verified_cache.get(zitadel._token_cache_key(token)) is None
+
+
+async def test_key_objects_rebuilt_only_when_jwks_changes(rsa_key_pair, stand_in_jwks, monkeypatch):
+    _, public_jwk = rsa_key_pair
+    await zitadel.verify_access_token(_sign(rsa_key_pair[0], sub="a"))
+    parsed = zitadel._key_cache["keys"][KID]
+
+    await zitadel.verify_access_token(_sign(rsa_key_pair[0], sub="b"))
+    assert zitadel._key_cache["keys"][KID] is parsed
+
+    monkeypatch.setitem(zitadel._jwks_cache, "value", {"keys": [dict(public_jwk)]})
+    await zitadel.verify_access_token(_sign(rsa_key_pair[0], sub="c"))
+    assert zitadel._key_cache["keys"][KID] is not parsed
+
+
+async def test_verification_throughput(rsa_key_pair, stand_in_jwks):
+    """Microbenchmark: verifications/sec before (PEM per call) vs after (cached)."""
+    private_pem, public_jwk = rsa_key_pair
+    token = _sign(private_pem)
+    iterations = 200
+    options = {"verify_aud": False, "verify_iss": False, "require_exp": True}
+
+    # Before: construct JWK -> PEM -> re-parse on every verification
+    start = time.perf_counter()
+    for _ in range(iterations):
+        pem = zitadel._construct_key(public_jwk).to_pem().decode("utf-8")
+        jwt.decode(token, pem, algorithms=["RS256"], options=options)
+    before = iterations / (time.perf_counter() - start)
+
+    # After, cold claims cache: pre-parsed key object, full signature check
+    start = time.perf_counter()
+    for _ in range(iterations):
+        zitadel._verified_cache.clear()
+        await zitadel.verify_access_token(token)
+    after_cold = iterations / (time.perf_counter() - start)
+
+    # After, warm claims cache: repeat requests with the same bearer token
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await zitadel.verify_access_token(token)
+    after_warm = iterations / (time.perf_counter() - start)
+
+    print("\n--- JWT verification throughput (verifications/sec) ---")
+    print(f"before (PEM per call): {before:,.0f}")
+    print(f"after, cold cache:     {after_cold:,.0f}")
+    print(f"after, warm cache:     {after_warm:,.0f}")
+
+    assert after_warm > before * 5